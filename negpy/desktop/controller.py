@@ -1,10 +1,10 @@
 import os
 import time
 from dataclasses import replace
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 import numpy as np
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, QMetaObject, Q_ARG, Qt
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal, QMetaObject, Q_ARG, Qt
 from PyQt6.QtGui import QIcon, QPixmap
 
 from negpy.desktop.session import DesktopSessionManager, AppState, ToolMode
@@ -96,6 +96,13 @@ class AppController(QObject):
 
         self._is_rendering = False
         self._pending_render_task: Any = None
+        self._inflight_render_key: Any = None
+
+        # Render requests made within one event-loop turn collapse into a single task
+        self._requested_readback = False
+        self._render_flush_timer = QTimer(self)
+        self._render_flush_timer.setSingleShot(True)
+        self._render_flush_timer.setInterval(0)
 
         self._connect_signals()
 
@@ -130,6 +137,7 @@ class AppController(QObject):
         self.session.file_selected.connect(self.load_file)
         self.session.state_changed.connect(self.config_updated.emit)
         self.session.state_changed.connect(self.request_render)
+        self._render_flush_timer.timeout.connect(self._flush_render_request)
 
     def generate_missing_thumbnails(self) -> None:
         missing = [f for f in self.state.uploaded_files if f["name"] not in self.state.thumbnails]
@@ -144,11 +152,13 @@ class AppController(QObject):
     def _on_thumbnails_finished(self, new_thumbs: Dict[str, Any]) -> None:
         self.set_status("GALLERIES UPDATED", 3000)
         self.status_progress_requested.emit(0, 0)
+        updated = []
         for name, pil_img in new_thumbs.items():
             if pil_img:
-                u8_arr = np.array(pil_img.convert("RGB"))
+                u8_arr = np.asarray(pil_img if pil_img.mode == "RGB" else pil_img.convert("RGB"))
                 self.state.thumbnails[name] = QIcon(QPixmap.fromImage(ImageConverter.to_qimage(u8_arr)))
-        self.session.asset_model.refresh()
+                updated.append(name)
+        self.session.asset_model.refresh_thumbnails(updated)
 
     def request_asset_discovery(self, paths: List[str]) -> None:
         """
@@ -157,7 +167,11 @@ class AppController(QObject):
         from negpy.infrastructure.loaders.constants import SUPPORTED_RAW_EXTENSIONS
 
         self.set_status("SCANNING FOR ASSETS...")
-        task = AssetDiscoveryTask(paths=paths, supported_extensions=tuple(SUPPORTED_RAW_EXTENSIONS))
+        task = AssetDiscoveryTask(
+            paths=paths,
+            supported_extensions=tuple(SUPPORTED_RAW_EXTENSIONS),
+            known_paths=frozenset(f["path"] for f in self.state.uploaded_files),
+        )
         self.asset_discovery_requested.emit(task)
 
     def _on_discovery_progress(self, current: int, total: int, name: str) -> None:
@@ -211,12 +225,12 @@ class AppController(QObject):
     def handle_crop_completed(self, nx1: float, ny1: float, nx2: float, ny2: float) -> None:
         if self.state.active_tool != ToolMode.CROP_MANUAL:
             return
-        uv_grid = self.state.last_metrics.get("uv_grid")
-        if uv_grid is None:
+        uv_transform = self.state.last_metrics.get("uv_transform")
+        if uv_transform is None:
             return
 
-        rx1, ry1 = CoordinateMapping.map_click_to_raw(nx1, ny1, uv_grid)
-        rx2, ry2 = CoordinateMapping.map_click_to_raw(nx2, ny2, uv_grid)
+        rx1, ry1 = CoordinateMapping.map_click_to_raw(nx1, ny1, uv_transform)
+        rx2, ry2 = CoordinateMapping.map_click_to_raw(nx2, ny2, uv_transform)
 
         new_geo = replace(
             self.state.config.geometry,
@@ -244,16 +258,20 @@ class AppController(QObject):
     def save_current_edits(self) -> None:
         if self.state.current_file_hash:
             self.session.update_config(self.state.config, persist=True)
+            # Explicit save: write now rather than after the debounce
+            self.session.flush_pending_settings()
             self._update_thumbnail_from_state(force_readback=True)
 
     def clear_retouch(self) -> None:
+        # update_config already schedules the render through state_changed
+        if not self.state.config.retouch.manual_dust_spots:
+            return
         self.session.update_config(
             replace(
                 self.state.config,
                 retouch=replace(self.state.config.retouch, manual_dust_spots=[]),
             )
         )
-        self.request_render()
 
     def undo_last_retouch(self) -> None:
         """
@@ -268,13 +286,12 @@ class AppController(QObject):
                     retouch=replace(self.state.config.retouch, manual_dust_spots=spots),
                 )
             )
-            self.request_render()
 
     def _handle_dust_pick(self, nx: float, ny: float) -> None:
-        uv_grid = self.state.last_metrics.get("uv_grid")
-        if uv_grid is None:
+        uv_transform = self.state.last_metrics.get("uv_transform")
+        if uv_transform is None:
             return
-        rx, ry = CoordinateMapping.map_click_to_raw(nx, ny, uv_grid)
+        rx, ry = CoordinateMapping.map_click_to_raw(nx, ny, uv_transform)
         new_spots = self.state.config.retouch.manual_dust_spots + [(rx, ry, float(self.state.config.retouch.manual_dust_size))]
         self.session.update_config(
             replace(
@@ -282,7 +299,6 @@ class AppController(QObject):
                 retouch=replace(self.state.config.retouch, manual_dust_spots=new_spots),
             )
         )
-        self.request_render()
 
     def _handle_wb_pick(self, nx: float, ny: float) -> None:
         """
@@ -297,14 +313,15 @@ class AppController(QObject):
             is_log = False
 
         if isinstance(img, GPUTexture):
-            img = img.readback()
-
-        if img is None or not isinstance(img, np.ndarray):
+            # Only one texel is needed, so skip the full-frame VRAM download
+            h, w = img.height, img.width
+            sampled = img.readback_pixel(min(max(int(nx * w), 0), w - 1), min(max(int(ny * h), 0), h - 1))
+        elif isinstance(img, np.ndarray):
+            h, w = img.shape[:2]
+            sampled = img[min(max(int(ny * h), 0), h - 1), min(max(int(nx * w), 0), w - 1)]
+        else:
             return
 
-        h, w = img.shape[:2]
-        sampled = img[int(np.clip(ny * h, 0, h - 1)), int(np.clip(nx * w, 0, w - 1))]
-
         exp = self.state.config.exposure
         if is_log:
             new_m, new_y = calculate_wb_shifts_from_log(sampled[:3])
@@ -314,14 +331,15 @@ class AppController(QObject):
             new_m = exp.wb_magenta + delta_m * damping
             new_y = exp.wb_yellow + delta_y * damping
 
-        new_exp = replace(
-            exp,
-            wb_cyan=0.0,
-            wb_magenta=float(np.clip(new_m, -1.0, 1.0)),
-            wb_yellow=float(np.clip(new_y, -1.0, 1.0)),
-        )
+        wb_magenta = min(max(float(new_m), -1.0), 1.0)
+        wb_yellow = min(max(float(new_y), -1.0), 1.0)
+        # Picking an already neutral spot, or one pinned at the slider limits, changes nothing
+        if (exp.wb_cyan, exp.wb_magenta, exp.wb_yellow) == (0.0, wb_magenta, wb_yellow):
+            return
+
+        new_exp = replace(exp, wb_cyan=0.0, wb_magenta=wb_magenta, wb_yellow=wb_yellow)
+        # update_config renders through state_changed
         self.session.update_config(replace(self.state.config, exposure=new_exp))
-        self.request_render()
 
     def request_batch_normalization(self) -> None:
         """
@@ -330,6 +348,8 @@ class AppController(QObject):
         if not self.state.uploaded_files:
             return
 
+        # The worker reads every file's settings back from storage
+        self.session.flush_pending_settings()
         self.set_status("Starting Batch Normalization...")
         task = NormalizationTask(
             files=self.state.uploaded_files.copy(),
@@ -348,32 +368,40 @@ class AppController(QObject):
         """
         Applies averaged normalization baseline to all files.
         """
+        self._apply_locked_baseline(locked_floors, locked_ceils, None)
+
+        self.set_status("Batch Normalization Complete", 3000)
+        self.status_progress_requested.emit(0, 0)
+        self.request_render()
+
+    def _apply_locked_baseline(self, locked_floors: tuple, locked_ceils: tuple, roll_name: Optional[str]) -> None:
+        """
+        Locks every session file to the given baseline, persisting all files in one transaction.
+        """
+        self.session.flush_pending_settings()
+        saved = self.session.repo.load_file_settings_batch([f["hash"] for f in self.state.uploaded_files])
+        batch = []
         for f_info in self.state.uploaded_files:
-            p = self.session.repo.load_file_settings(f_info["hash"]) or replace(self.state.config)
+            p = saved.get(f_info["hash"]) or replace(self.state.config)
             new_process = replace(
                 p.process,
                 use_roll_average=True,
                 locked_floors=locked_floors,
                 locked_ceils=locked_ceils,
-                roll_name=None,
+                roll_name=roll_name,
             )
-            new_p = replace(p, process=new_process)
-            self.session.repo.save_file_settings(f_info["hash"], new_p)
+            batch.append((f_info["hash"], replace(p, process=new_process)))
+        self.session.repo.save_file_settings_batch(batch)
 
-        # Update current state
         new_process = replace(
             self.state.config.process,
             use_roll_average=True,
             locked_floors=locked_floors,
             locked_ceils=locked_ceils,
-            roll_name=None,
+            roll_name=roll_name,
         )
         self.session.update_config(replace(self.state.config, process=new_process), persist=True)
 
-        self.set_status("Batch Normalization Complete", 3000)
-        self.status_progress_requested.emit(0, 0)
-        self.request_render()
-
     def save_current_normalization_as_roll(self, name: str) -> None:
         """
         Persists current batch normalization values as a named roll.
@@ -394,26 +422,7 @@ class AppController(QObject):
         data = self.session.repo.load_normalization_roll(name)
         if data:
             locked_floors, locked_ceils = data
-            for f_info in self.state.uploaded_files:
-                p = self.session.repo.load_file_settings(f_info["hash"]) or replace(self.state.config)
-                new_process = replace(
-                    p.process,
-                    use_roll_average=True,
-                    locked_floors=locked_floors,
-                    locked_ceils=locked_ceils,
-                    roll_name=name,
-                )
-                new_p = replace(p, process=new_process)
-                self.session.repo.save_file_settings(f_info["hash"], new_p)
-
-            new_process = replace(
-                self.state.config.process,
-                use_roll_average=True,
-                locked_floors=locked_floors,
-                locked_ceils=locked_ceils,
-                roll_name=name,
-            )
-            self.session.update_config(replace(self.state.config, process=new_process), persist=True)
+            self._apply_locked_baseline(locked_floors, locked_ceils, name)
             self.set_status(f"Applied Roll '{name}'", 2000)
             self.request_render()
 
@@ -431,11 +440,19 @@ class AppController(QObject):
 
     def request_render(self, readback_metrics: bool = True) -> None:
         """
-        Dispatches a render task to the worker thread.
+        Schedules a render task for the worker thread.
+        Repeated requests before the event loop runs again are coalesced; metrics are read back if any of them asked.
         """
         if self.state.preview_raw is None:
             return
 
+        self._requested_readback = self._requested_readback or readback_metrics
+        self._render_flush_timer.start()
+
+    def _flush_render_request(self) -> None:
+        if self.state.preview_raw is None:
+            return
+
         self.set_status("Rendering...")
         task = RenderTask(
             buffer=self.state.preview_raw,
@@ -446,14 +463,39 @@ class AppController(QObject):
             icc_invert=self.state.icc_invert,
             color_space=self.state.workspace_color_space,
             gpu_enabled=self.state.gpu_enabled,
-            readback_metrics=readback_metrics,
+            readback_metrics=self._requested_readback,
         )
+        self._requested_readback = False
+
+        # A queued task replaced before dispatch still owes its metrics readback
+        if self._pending_render_task is not None and self._pending_render_task.readback_metrics and not task.readback_metrics:
+            task = replace(task, readback_metrics=True)
 
         if self._is_rendering:
-            self._pending_render_task = task
+            # The in-flight render already covers an identical request
+            same_as_inflight = self._render_key(task) == self._inflight_render_key
+            self._pending_render_task = None if same_as_inflight else task
             return
 
+        self._dispatch_render(task)
+
+    @staticmethod
+    def _render_key(task: RenderTask) -> Any:
+        return (
+            id(task.buffer),
+            task.config,
+            task.source_hash,
+            task.preview_size,
+            task.icc_profile_path,
+            task.icc_invert,
+            task.color_space,
+            task.gpu_enabled,
+            task.readback_metrics,
+        )
+
+    def _dispatch_render(self, task: RenderTask) -> None:
         self._is_rendering = True
+        self._inflight_render_key = self._render_key(task)
         self.render_requested.emit(task)
 
     def request_export(self) -> None:
@@ -489,14 +531,16 @@ class AppController(QObject):
         """
         Initiates batch export, optionally applying current export settings to all files.
         """
+        self.session.flush_pending_settings()
         current_export = self.state.config.export
         icc_path = self.state.icc_profile_path
         icc_invert = self.state.icc_invert
         apply_icc = self.state.apply_icc_to_export
 
+        saved = self.session.repo.load_file_settings_batch([f["hash"] for f in self.state.uploaded_files])
         tasks = []
         for f in self.state.uploaded_files:
-            params = self.session.repo.load_file_settings(f["hash"]) or self.state.config
+            params = saved.get(f["hash"]) or self.state.config
 
             if override_settings:
                 params = replace(params, export=current_export)
@@ -536,6 +580,7 @@ class AppController(QObject):
 
     def _on_render_finished(self, result: Any, metrics: Dict[str, Any]) -> None:
         self._is_rendering = False
+        self._inflight_render_key = None
 
         should_update_thumb = not self._first_render_done
         self._first_render_done = True
@@ -550,8 +595,7 @@ class AppController(QObject):
         if self._pending_render_task:
             task = self._pending_render_task
             self._pending_render_task = None
-            self._is_rendering = True
-            self.render_requested.emit(task)
+            self._dispatch_render(task)
 
     def _on_metrics_updated(self, metrics: Dict[str, Any]) -> None:
         """
@@ -577,6 +621,7 @@ class AppController(QObject):
     def _on_render_error(self, message: str) -> None:
         self.state.is_processing = self._is_rendering = False
         self._pending_render_task = None
+        self._inflight_render_key = None
         logger.error(f"Worker failure: {message}")
 
     def _on_export_finished(self) -> None:
@@ -593,11 +638,14 @@ class AppController(QObject):
         metrics = self.state.last_metrics
         buffer = metrics.get("base_positive")
 
-        if isinstance(buffer, GPUTexture):
+        # A GPU readback is already a private buffer; anything taken from metrics must be copied
+        owned = isinstance(buffer, GPUTexture)
+        if owned:
             buffer = buffer.readback()
 
         if buffer is not None and not isinstance(buffer, np.ndarray):
             buffer = metrics.get("analysis_buffer")
+            owned = False
         if buffer is None or not isinstance(buffer, np.ndarray):
             return
 
@@ -605,7 +653,7 @@ class AppController(QObject):
             ThumbnailUpdateTask(
                 filename=os.path.basename(self.state.current_file_path),
                 file_hash=self.state.current_file_hash,
-                buffer=buffer.copy(),
+                buffer=buffer if owned else buffer.copy(),
             )
         )
 
@@ -613,12 +661,14 @@ class AppController(QObject):
         """
         Total system evacuation on exit.
         """
+        self.session.flush_pending_settings()
         self.render_thread.quit()
         self.render_thread.wait()
         self.export_thread.quit()
         self.export_thread.wait()
         self.thumb_thread.quit()
         self.thumb_thread.wait()
+        self.thumb_worker.close()
         self.norm_thread.quit()
         self.norm_thread.wait()
         self.discovery_thread.quit()
@@ -1,11 +1,43 @@
 from enum import Enum, auto
 from dataclasses import dataclass, field, replace
-from typing import Dict, Any, List, Optional
-from PyQt6.QtCore import QObject, pyqtSignal, QAbstractListModel, QModelIndex, Qt
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from PyQt6.QtCore import QObject, pyqtSignal, QAbstractListModel, QModelIndex, Qt, QTimer
 from negpy.domain.models import WorkspaceConfig
 from negpy.infrastructure.storage.repository import StorageRepository
 
 
+# Trailing delay before persisted edits are written; bursts of edits collapse into one write
+SETTINGS_FLUSH_MS = 250
+
+# Global settings carried over between files
+STICKY_SETTING_KEYS: List[str] = [
+    "last_export_config",
+    "last_process_mode",
+    "last_analysis_buffer",
+    "last_use_roll_average",
+    "last_locked_floors",
+    "last_locked_ceils",
+    "last_roll_name",
+    "last_density",
+    "last_grade",
+    "last_wb_cyan",
+    "last_wb_magenta",
+    "last_wb_yellow",
+    "last_use_camera_wb",
+    "last_toe",
+    "last_toe_width",
+    "last_toe_hardness",
+    "last_shoulder",
+    "last_shoulder_width",
+    "last_shoulder_hardness",
+    "last_aspect_ratio",
+    "last_autocrop_offset",
+    "last_lab_config",
+    "last_toning_config",
+    "last_retouch_config",
+]
+
+
 class ToolMode(Enum):
     NONE = auto()
     WB_PICK = auto()
@@ -52,6 +84,8 @@ class AssetListModel(QAbstractListModel):
     def __init__(self, state: AppState):
         super().__init__()
         self._state = state
+        # File name -> rows, rebuilt lazily after the file list changes
+        self._rows_by_name: Optional[Dict[str, List[int]]] = None
 
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self._state.uploaded_files)
@@ -74,8 +108,21 @@ class AssetListModel(QAbstractListModel):
         return None
 
     def refresh(self) -> None:
+        self._rows_by_name = None
         self.layoutChanged.emit()
 
+    def refresh_thumbnails(self, names: Iterable[str]) -> None:
+        """
+        Repaints only the rows whose thumbnails changed; the list layout is left untouched.
+        """
+        if self._rows_by_name is None:
+            self._rows_by_name = {}
+            for i, f in enumerate(self._state.uploaded_files):
+                self._rows_by_name.setdefault(f["name"], []).append(i)
+        rows = [row for name in set(names) for row in self._rows_by_name.get(name, ())]
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0), [Qt.ItemDataRole.DecorationRole])
+
 
 class DesktopSessionManager(QObject):
     """
@@ -91,6 +138,16 @@ class DesktopSessionManager(QObject):
         self.repo = repo
         self.state = AppState()
         self.asset_model = AssetListModel(self.state)
+        # Sticky values as last written to global storage
+        self._persisted_sticky: Dict[str, Any] = {}
+        # (file hash, config) of the latest persisted edit not yet written
+        self._pending_persist: Optional[Tuple[Optional[str], WorkspaceConfig]] = None
+        # Config the repository holds for the current file, as last read or written
+        self._stored_config: Optional[WorkspaceConfig] = None
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(SETTINGS_FLUSH_MS)
+        self._persist_timer.timeout.connect(self.flush_pending_settings)
 
         # Load global hardware settings
         saved_gpu = self.repo.get_global_setting("gpu_enabled")
@@ -116,7 +173,10 @@ class DesktopSessionManager(QObject):
             RetouchConfig,
         )
 
-        sticky_export = self.repo.get_global_setting("last_export_config")
+        # One read for every sticky key instead of a query per setting
+        sticky = self.repo.get_global_settings(STICKY_SETTING_KEYS if not only_global else ["last_export_config"])
+
+        sticky_export = sticky.get("last_export_config")
         if sticky_export:
             valid_keys = ExportConfig.__dataclass_fields__.keys()
             filtered = {k: v for k, v in sticky_export.items() if k in valid_keys}
@@ -126,12 +186,12 @@ class DesktopSessionManager(QObject):
         if only_global:
             return config
 
-        sticky_mode = self.repo.get_global_setting("last_process_mode")
-        sticky_buffer = self.repo.get_global_setting("last_analysis_buffer")
-        sticky_roll_average = self.repo.get_global_setting("last_use_roll_average")
-        sticky_floors = self.repo.get_global_setting("last_locked_floors")
-        sticky_ceils = self.repo.get_global_setting("last_locked_ceils")
-        sticky_roll_name = self.repo.get_global_setting("last_roll_name")
+        sticky_mode = sticky.get("last_process_mode")
+        sticky_buffer = sticky.get("last_analysis_buffer")
+        sticky_roll_average = sticky.get("last_use_roll_average")
+        sticky_floors = sticky.get("last_locked_floors")
+        sticky_ceils = sticky.get("last_locked_ceils")
+        sticky_roll_name = sticky.get("last_roll_name")
 
         new_process = config.process
         if sticky_mode:
@@ -149,19 +209,19 @@ class DesktopSessionManager(QObject):
 
         config = replace(config, process=new_process)
 
-        sticky_density = self.repo.get_global_setting("last_density")
-        sticky_grade = self.repo.get_global_setting("last_grade")
-        sticky_cyan = self.repo.get_global_setting("last_wb_cyan")
-        sticky_magenta = self.repo.get_global_setting("last_wb_magenta")
-        sticky_yellow = self.repo.get_global_setting("last_wb_yellow")
-        sticky_camera_wb = self.repo.get_global_setting("last_use_camera_wb")
+        sticky_density = sticky.get("last_density")
+        sticky_grade = sticky.get("last_grade")
+        sticky_cyan = sticky.get("last_wb_cyan")
+        sticky_magenta = sticky.get("last_wb_magenta")
+        sticky_yellow = sticky.get("last_wb_yellow")
+        sticky_camera_wb = sticky.get("last_use_camera_wb")
 
-        sticky_toe = self.repo.get_global_setting("last_toe")
-        sticky_toe_w = self.repo.get_global_setting("last_toe_width")
-        sticky_toe_h = self.repo.get_global_setting("last_toe_hardness")
-        sticky_shoulder = self.repo.get_global_setting("last_shoulder")
-        sticky_shoulder_w = self.repo.get_global_setting("last_shoulder_width")
-        sticky_shoulder_h = self.repo.get_global_setting("last_shoulder_hardness")
+        sticky_toe = sticky.get("last_toe")
+        sticky_toe_w = sticky.get("last_toe_width")
+        sticky_toe_h = sticky.get("last_toe_hardness")
+        sticky_shoulder = sticky.get("last_shoulder")
+        sticky_shoulder_w = sticky.get("last_shoulder_width")
+        sticky_shoulder_h = sticky.get("last_shoulder_hardness")
 
         new_exp = config.exposure
         if sticky_density is not None:
@@ -192,8 +252,8 @@ class DesktopSessionManager(QObject):
 
         config = replace(config, exposure=new_exp)
 
-        sticky_ratio = self.repo.get_global_setting("last_aspect_ratio")
-        sticky_offset = self.repo.get_global_setting("last_autocrop_offset")
+        sticky_ratio = sticky.get("last_aspect_ratio")
+        sticky_offset = sticky.get("last_autocrop_offset")
 
         new_geo = config.geometry
         if sticky_ratio:
@@ -203,19 +263,19 @@ class DesktopSessionManager(QObject):
 
         config = replace(config, geometry=new_geo)
 
-        sticky_lab = self.repo.get_global_setting("last_lab_config")
+        sticky_lab = sticky.get("last_lab_config")
         if sticky_lab:
             valid_keys = LabConfig.__dataclass_fields__.keys()
             filtered = {k: v for k, v in sticky_lab.items() if k in valid_keys}
             config = replace(config, lab=LabConfig(**filtered))
 
-        sticky_toning = self.repo.get_global_setting("last_toning_config")
+        sticky_toning = sticky.get("last_toning_config")
         if sticky_toning:
             valid_keys = ToningConfig.__dataclass_fields__.keys()
             filtered = {k: v for k, v in sticky_toning.items() if k in valid_keys}
             config = replace(config, toning=ToningConfig(**filtered))
 
-        sticky_retouch = self.repo.get_global_setting("last_retouch_config")
+        sticky_retouch = sticky.get("last_retouch_config")
         if sticky_retouch:
             valid_keys = RetouchConfig.__dataclass_fields__.keys()
             # Never carry over manual spots to other files
@@ -226,45 +286,50 @@ class DesktopSessionManager(QObject):
 
     def _persist_sticky_settings(self, config: WorkspaceConfig) -> None:
         """
-        Saves current settings to global storage.
+        Saves current settings to global storage, writing only values that changed since the last save.
         """
         from dataclasses import asdict
 
-        self.repo.save_global_setting("last_process_mode", config.process.process_mode)
-        self.repo.save_global_setting("last_analysis_buffer", config.process.analysis_buffer)
-        self.repo.save_global_setting("last_use_roll_average", config.process.use_roll_average)
-        self.repo.save_global_setting("last_locked_floors", config.process.locked_floors)
-        self.repo.save_global_setting("last_locked_ceils", config.process.locked_ceils)
-        self.repo.save_global_setting("last_roll_name", config.process.roll_name)
-
-        self.repo.save_global_setting("last_density", config.exposure.density)
-        self.repo.save_global_setting("last_grade", config.exposure.grade)
-        self.repo.save_global_setting("last_wb_cyan", config.exposure.wb_cyan)
-        self.repo.save_global_setting("last_wb_magenta", config.exposure.wb_magenta)
-        self.repo.save_global_setting("last_wb_yellow", config.exposure.wb_yellow)
-        self.repo.save_global_setting("last_use_camera_wb", config.exposure.use_camera_wb)
-
-        self.repo.save_global_setting("last_toe", config.exposure.toe)
-        self.repo.save_global_setting("last_toe_width", config.exposure.toe_width)
-        self.repo.save_global_setting("last_toe_hardness", config.exposure.toe_hardness)
-        self.repo.save_global_setting("last_shoulder", config.exposure.shoulder)
-        self.repo.save_global_setting("last_shoulder_width", config.exposure.shoulder_width)
-        self.repo.save_global_setting("last_shoulder_hardness", config.exposure.shoulder_hardness)
-
-        self.repo.save_global_setting("last_aspect_ratio", config.geometry.autocrop_ratio)
-        self.repo.save_global_setting("last_autocrop_offset", config.geometry.autocrop_offset)
-        self.repo.save_global_setting("last_export_config", asdict(config.export))
-        self.repo.save_global_setting("last_lab_config", asdict(config.lab))
-        self.repo.save_global_setting("last_toning_config", asdict(config.toning))
-        self.repo.save_global_setting("last_retouch_config", asdict(config.retouch))
+        values = {
+            "last_process_mode": config.process.process_mode,
+            "last_analysis_buffer": config.process.analysis_buffer,
+            "last_use_roll_average": config.process.use_roll_average,
+            "last_locked_floors": config.process.locked_floors,
+            "last_locked_ceils": config.process.locked_ceils,
+            "last_roll_name": config.process.roll_name,
+            "last_density": config.exposure.density,
+            "last_grade": config.exposure.grade,
+            "last_wb_cyan": config.exposure.wb_cyan,
+            "last_wb_magenta": config.exposure.wb_magenta,
+            "last_wb_yellow": config.exposure.wb_yellow,
+            "last_use_camera_wb": config.exposure.use_camera_wb,
+            "last_toe": config.exposure.toe,
+            "last_toe_width": config.exposure.toe_width,
+            "last_toe_hardness": config.exposure.toe_hardness,
+            "last_shoulder": config.exposure.shoulder,
+            "last_shoulder_width": config.exposure.shoulder_width,
+            "last_shoulder_hardness": config.exposure.shoulder_hardness,
+            "last_aspect_ratio": config.geometry.autocrop_ratio,
+            "last_autocrop_offset": config.geometry.autocrop_offset,
+            "last_export_config": asdict(config.export),
+            "last_lab_config": asdict(config.lab),
+            "last_toning_config": asdict(config.toning),
+            "last_retouch_config": asdict(config.retouch),
+        }
+        changed = {key: value for key, value in values.items() if key not in self._persisted_sticky or self._persisted_sticky[key] != value}
+        if not changed:
+            return
+        self.repo.save_global_settings(changed)
+        self._persisted_sticky.update(changed)
 
     def select_file(self, index: int, selection_override: Optional[List[int]] = None) -> None:
         """
         Changes active file and hydrates state from repository.
         """
         if 0 <= index < len(self.state.uploaded_files):
-            # Save current before switching
-            if self.state.current_file_hash:
+            self.flush_pending_settings()
+            # Save current before switching, unless the repository already holds it
+            if self.state.current_file_hash and self.state.config != self._stored_config:
                 self.repo.save_file_settings(self.state.current_file_hash, self.state.config)
                 self.settings_saved.emit()
 
@@ -275,6 +340,7 @@ class DesktopSessionManager(QObject):
             self.state.current_file_hash = file_info["hash"]
 
             saved_config = self.repo.load_file_settings(file_info["hash"])
+            self._stored_config = saved_config
 
             if saved_config:
                 self.state.config = self._apply_sticky_settings(saved_config, only_global=True)
@@ -298,41 +364,44 @@ class DesktopSessionManager(QObject):
             return
 
         source_config = self.state.config
+        target_hashes = [
+            self.state.uploaded_files[idx]["hash"]
+            for idx in self.state.selected_indices
+            if idx != self.state.selected_file_idx and 0 <= idx < len(self.state.uploaded_files)
+        ]
+        if not target_hashes:
+            return
 
-        for idx in self.state.selected_indices:
-            if idx == self.state.selected_file_idx:
-                continue
-
-            if 0 <= idx < len(self.state.uploaded_files):
-                target_info = self.state.uploaded_files[idx]
-                target_hash = target_info["hash"]
+        # One read and one write transaction for the whole selection
+        saved = self.repo.load_file_settings_batch(target_hashes)
+        batch = []
+        for target_hash in target_hashes:
+            target_config = saved.get(target_hash) or WorkspaceConfig()
 
-                target_config = self.repo.load_file_settings(target_hash)
-                if not target_config:
-                    target_config = WorkspaceConfig()
+            merged_geo = replace(
+                source_config.geometry,
+                manual_crop_rect=target_config.geometry.manual_crop_rect,
+                fine_rotation=target_config.geometry.fine_rotation,
+            )
 
-                merged_geo = replace(
-                    source_config.geometry,
-                    manual_crop_rect=target_config.geometry.manual_crop_rect,
-                    fine_rotation=target_config.geometry.fine_rotation,
-                )
+            merged_retouch = replace(source_config.retouch, manual_dust_spots=target_config.retouch.manual_dust_spots)
 
-                merged_retouch = replace(source_config.retouch, manual_dust_spots=target_config.retouch.manual_dust_spots)
+            merged_process = replace(
+                source_config.process,
+                local_floors=target_config.process.local_floors,
+                local_ceils=target_config.process.local_ceils,
+            )
 
-                merged_process = replace(
-                    source_config.process,
-                    local_floors=target_config.process.local_floors,
-                    local_ceils=target_config.process.local_ceils,
-                )
+            new_config = replace(
+                source_config,
+                geometry=merged_geo,
+                retouch=merged_retouch,
+                process=merged_process,
+            )
 
-                new_config = replace(
-                    source_config,
-                    geometry=merged_geo,
-                    retouch=merged_retouch,
-                    process=merged_process,
-                )
+            batch.append((target_hash, new_config))
 
-                self.repo.save_file_settings(target_hash, new_config)
+        self.repo.save_file_settings_batch(batch)
 
         self.settings_saved.emit()
 
@@ -347,18 +416,36 @@ class DesktopSessionManager(QObject):
     def update_config(self, config: WorkspaceConfig, persist: bool = False, render: bool = True) -> None:
         """
         Updates global config and optionally saves to disk.
+        An edit that leaves the config unchanged skips the sidebar resync and re-render.
         """
+        changed = config != self.state.config
         self.state.config = config
 
         if persist:
-            self._persist_sticky_settings(config)
-            if self.state.current_file_hash:
-                self.repo.save_file_settings(self.state.current_file_hash, config)
-                self.settings_saved.emit()
+            self._pending_persist = (self.state.current_file_hash, config)
+            self._persist_timer.start()
 
-        if render:
+        if render and changed:
             self.state_changed.emit()
 
+    def flush_pending_settings(self) -> None:
+        """
+        Writes the latest persisted edit now. Called by the debounce timer and before
+        anything that reads settings back or leaves the current file.
+        """
+        self._persist_timer.stop()
+        if self._pending_persist is None:
+            return
+        file_hash, config = self._pending_persist
+        self._pending_persist = None
+
+        self._persist_sticky_settings(config)
+        if file_hash:
+            self.repo.save_file_settings(file_hash, config)
+            if file_hash == self.state.current_file_hash:
+                self._stored_config = config
+            self.settings_saved.emit()
+
     def reset_settings(self) -> None:
         """
         Reverts current file to default configuration.
@@ -384,10 +471,12 @@ class DesktopSessionManager(QObject):
         import os
         from negpy.kernel.image.logic import calculate_file_hash
 
+        known_hashes = {f["hash"] for f in self.state.uploaded_files}
         if validated_info:
             for info in validated_info:
-                if any(f["hash"] == info["hash"] for f in self.state.uploaded_files):
+                if info["hash"] in known_hashes:
                     continue
+                known_hashes.add(info["hash"])
                 self.state.uploaded_files.append(info)
         else:
             for path in file_paths:
@@ -396,9 +485,10 @@ class DesktopSessionManager(QObject):
                     if f_hash.startswith("err_"):
                         continue
 
-                    if any(f["hash"] == f_hash for f in self.state.uploaded_files):
+                    if f_hash in known_hashes:
                         continue
 
+                    known_hashes.add(f_hash)
                     self.state.uploaded_files.append({"name": os.path.basename(path), "path": path, "hash": f_hash})
                 except Exception as e:
                     from negpy.kernel.system.logging import get_logger
@@ -412,6 +502,7 @@ class DesktopSessionManager(QObject):
         """
         Purges all loaded files from the session.
         """
+        self.flush_pending_settings()
         self.state.uploaded_files.clear()
         self.state.thumbnails.clear()
         self.state.selected_file_idx = -1
@@ -430,16 +521,16 @@ class DesktopSessionManager(QObject):
         if 0 <= idx < len(self.state.uploaded_files):
             file_info = self.state.uploaded_files.pop(idx)
             self.state.thumbnails.pop(file_info["name"], None)
+            self.asset_model.refresh()
 
-            if not self.state.uploaded_files:
-                self.state.selected_file_idx = -1
-                self.state.current_file_path = None
-                self.state.current_file_hash = None
-                self.state.preview_raw = None
-                self.state.config = WorkspaceConfig()
-            else:
-                new_idx = min(idx, len(self.state.uploaded_files) - 1)
-                self.select_file(new_idx)
+            if self.state.uploaded_files:
+                # select_file emits state_changed for the new active file
+                self.select_file(min(idx, len(self.state.uploaded_files) - 1))
+                return
 
-            self.asset_model.refresh()
+            self.state.selected_file_idx = -1
+            self.state.current_file_path = None
+            self.state.current_file_hash = None
+            self.state.preview_raw = None
+            self.state.config = WorkspaceConfig()
             self.state_changed.emit()
@@ -26,6 +26,11 @@ class GPUCanvasWidget(QWidget):
         self.image_size: Tuple[int, int] = (1, 1)
         self.format: str = ""
 
+        # Per-frame GPU objects reused until the displayed texture or viewport rect changes
+        self._bind_group: Optional[Any] = None
+        self._bind_group_view: Optional[Any] = None
+        self._last_rect: Optional[bytes] = None
+
         # Debounce resize to prevent context thrashing
         self.resize_timer = QTimer()
         self.resize_timer.setSingleShot(True)
@@ -40,6 +45,7 @@ class GPUCanvasWidget(QWidget):
         self.context.configure(device=self.device, format=self.format)
 
         self.uniform_buffer = self.device.create_buffer(size=16, usage=wgpu.BufferUsage.UNIFORM | wgpu.BufferUsage.COPY_DST)
+        self._bind_group = self._bind_group_view = self._last_rect = None
         self._create_render_pipeline(self.format)
 
     def update_texture(self, tex_wrapper: Any) -> None:
@@ -49,6 +55,7 @@ class GPUCanvasWidget(QWidget):
 
     def clear(self) -> None:
         self.current_texture_view = None
+        self._bind_group = self._bind_group_view = None
         self.canvas.request_draw(self._draw_frame)
 
     def resizeEvent(self, event) -> None:
@@ -206,35 +213,36 @@ class GPUCanvasWidget(QWidget):
             nw, nh = iw * r, ih * r
             nx, ny = (ww - nw) / 2.0, (wh - nh) / 2.0
 
-            self.device.queue.write_buffer(
-                self.uniform_buffer,
-                0,
-                struct.pack(
-                    "ffff",
-                    (nx / ww) * 2.0 - 1.0,
-                    1.0 - (ny / wh) * 2.0,
-                    (nw / ww) * 2.0,
-                    (nh / wh) * 2.0,
-                ),
+            rect = struct.pack(
+                "ffff",
+                (nx / ww) * 2.0 - 1.0,
+                1.0 - (ny / wh) * 2.0,
+                (nw / ww) * 2.0,
+                (nh / wh) * 2.0,
             )
-
-            bind_group = self.device.create_bind_group(
-                layout=self.bind_group_layout,
-                entries=[
-                    {"binding": 0, "resource": self.current_texture_view},
-                    {
-                        "binding": 1,
-                        "resource": {
-                            "buffer": self.uniform_buffer,
-                            "offset": 0,
-                            "size": 16,
+            if rect != self._last_rect:
+                self.device.queue.write_buffer(self.uniform_buffer, 0, rect)
+                self._last_rect = rect
+
+            if self._bind_group is None or self._bind_group_view is not self.current_texture_view:
+                self._bind_group = self.device.create_bind_group(
+                    layout=self.bind_group_layout,
+                    entries=[
+                        {"binding": 0, "resource": self.current_texture_view},
+                        {
+                            "binding": 1,
+                            "resource": {
+                                "buffer": self.uniform_buffer,
+                                "offset": 0,
+                                "size": 16,
+                            },
                         },
-                    },
-                ],
-            )
+                    ],
+                )
+                self._bind_group_view = self.current_texture_view
 
             pass_enc.set_pipeline(self.render_pipeline)
-            pass_enc.set_bind_group(0, bind_group)
+            pass_enc.set_bind_group(0, self._bind_group)
             pass_enc.draw(4, 1, 0, 0)
 
         pass_enc.end()
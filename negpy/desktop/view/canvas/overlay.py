@@ -2,12 +2,13 @@ import numpy as np
 import sys
 from typing import Optional, Tuple
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPainter, QImage, QMouseEvent, QColor, QPen
+from PyQt6.QtGui import QPainter, QImage, QPixmap, QMouseEvent, QColor, QPen
 from PyQt6.QtCore import Qt, pyqtSignal, QRectF, QPointF, QSize
 from negpy.desktop.converters import ImageConverter
 from negpy.desktop.session import ToolMode, AppState
 from negpy.desktop.view.widgets.overlays import ImageInfoOverlay
 from negpy.desktop.view.styles.theme import THEME
+from negpy.domain.models import ASPECT_RATIO_VALUES
 from negpy.kernel.system.config import APP_CONFIG
 
 
@@ -23,6 +24,7 @@ class CanvasOverlay(QWidget):
         super().__init__(parent)
         self.state = state
         self._qimage: Optional[QImage] = None
+        self._scaled_pixmap: Optional[QPixmap] = None
         self._current_size: Optional[Tuple[int, int]] = None
         self._display_rect: QRectF = QRectF()
         self._content_rect: Optional[Tuple[int, int, int, int]] = None
@@ -58,6 +60,7 @@ class CanvasOverlay(QWidget):
         If buffer is provided, it's CPU mode. If gpu_size is provided, it's GPU mode.
         """
         self._content_rect = content_rect
+        self._scaled_pixmap = None
         if buffer is not None:
             self._qimage = ImageConverter.to_qimage(buffer, color_space)
             self._current_size = (self._qimage.width(), self._qimage.height())
@@ -66,6 +69,15 @@ class CanvasOverlay(QWidget):
             self._current_size = gpu_size
         self.update()
 
+    def refresh_for_config(self) -> None:
+        """
+        Repaints after a config edit. Only the active tool's cursor reads config,
+        so with no image shown or no tool active there is nothing to redraw.
+        """
+        if self._tool_mode == ToolMode.NONE or (self._qimage is None and not self._current_size):
+            return
+        self.update()
+
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
 
@@ -96,10 +108,27 @@ class CanvasOverlay(QWidget):
             self._display_rect = QRectF(x, y, new_w, new_h)
 
             if self._qimage:
-                painter.drawImage(self._display_rect, self._qimage)
+                painter.drawPixmap(QPointF(x, y), self._get_scaled_pixmap(new_w, new_h))
 
         self._draw_widget_ui(painter)
 
+    def _get_scaled_pixmap(self, w: int, h: int) -> QPixmap:
+        """
+        Returns the preview resampled to display size, rescaling only on resize or new buffer.
+        """
+        assert self._qimage is not None
+        dpr = self.devicePixelRatioF()
+        target = QSize(max(1, int(w * dpr)), max(1, int(h * dpr)))
+        if self._scaled_pixmap is None or self._scaled_pixmap.size() != target:
+            scaled = self._qimage.scaled(
+                target,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            self._scaled_pixmap = QPixmap.fromImage(scaled)
+            self._scaled_pixmap.setDevicePixelRatio(dpr)
+        return self._scaled_pixmap
+
     def _draw_widget_ui(self, painter: QPainter) -> None:
         if self._crop_p1 and self._crop_p2:
             rect = QRectF(self._crop_p1, self._crop_p2).normalized().intersected(self._display_rect)
@@ -145,10 +174,11 @@ class CanvasOverlay(QWidget):
         painter.drawEllipse(self._mouse_pos, radius, radius)
 
     def _map_to_image_coords(self, pos: QPointF) -> Optional[Tuple[float, float]]:
-        if self._display_rect.isEmpty() or not self._display_rect.contains(pos):
+        d = self._display_rect
+        if d.isEmpty() or not d.contains(pos):
             return None
-        nb_x = (pos.x() - self._display_rect.x()) / self._display_rect.width()
-        nb_y = (pos.y() - self._display_rect.y()) / self._display_rect.height()
+        nb_x = (pos.x() - d.x()) / d.width()
+        nb_y = (pos.y() - d.y()) / d.height()
 
         if self._content_rect and self._current_size:
             bw, bh = self._current_size
@@ -157,7 +187,7 @@ class CanvasOverlay(QWidget):
             nx_max, ny_max = (cx + cw) / bw, (cy + ch) / bh
             nx = (nb_x - nx_min) / max(1e-5, (nx_max - nx_min))
             ny = (nb_y - ny_min) / max(1e-5, (ny_max - ny_min))
-            return float(np.clip(nx, 0, 1)), float(np.clip(ny, 0, 1))
+            return min(max(nx, 0.0), 1.0), min(max(ny, 0.0), 1.0)
 
         return float(nb_x), float(nb_y)
 
@@ -171,24 +201,26 @@ class CanvasOverlay(QWidget):
             self.update()
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
-        self._mouse_pos = event.position()
+        pos = event.position()
+        self._mouse_pos = pos
         if self._crop_active:
-            pos = event.position()
+            d = self._display_rect
+            p1 = self._crop_p1
             ratio_str = self.state.config.geometry.autocrop_ratio
 
             if ratio_str == "Free":
                 # Constrain p2 to display_rect
-                nx = max(self._display_rect.left(), min(self._display_rect.right(), pos.x()))
-                ny = max(self._display_rect.top(), min(self._display_rect.bottom(), pos.y()))
+                nx = max(d.left(), min(d.right(), pos.x()))
+                ny = max(d.top(), min(d.bottom(), pos.y()))
                 self._crop_p2 = QPointF(nx, ny)
             else:
                 try:
                     # Constrain p2 to respect aspect ratio relative to p1
-                    w_r, h_r = map(float, ratio_str.split(":"))
-                    target_ratio = w_r / h_r
+                    target_ratio = ASPECT_RATIO_VALUES[ratio_str]
 
-                    dx = pos.x() - self._crop_p1.x()
-                    dy = pos.y() - self._crop_p1.y()
+                    p1_x, p1_y = p1.x(), p1.y()
+                    dx = pos.x() - p1_x
+                    dy = pos.y() - p1_y
 
                     if abs(dx) > abs(dy) * target_ratio:
                         # DX is dominant
@@ -198,22 +230,23 @@ class CanvasOverlay(QWidget):
                         dx = (abs(dy) * target_ratio) * (1 if dx >= 0 else -1)
 
                     # Ensure p2 stays within display_rect while keeping ratio
-                    limit_x = self._display_rect.left() if dx < 0 else self._display_rect.right()
-                    limit_y = self._display_rect.top() if dy < 0 else self._display_rect.bottom()
+                    limit_x = d.left() if dx < 0 else d.right()
+                    limit_y = d.top() if dy < 0 else d.bottom()
 
-                    scale_x = abs(limit_x - self._crop_p1.x()) / abs(dx) if dx != 0 else 1.0
-                    scale_y = abs(limit_y - self._crop_p1.y()) / abs(dy) if dy != 0 else 1.0
+                    scale_x = abs(limit_x - p1_x) / abs(dx) if dx != 0 else 1.0
+                    scale_y = abs(limit_y - p1_y) / abs(dy) if dy != 0 else 1.0
 
                     scale = min(scale_x, scale_y)
                     if scale < 1.0:
                         dx *= scale
                         dy *= scale
 
-                    self._crop_p2 = QPointF(self._crop_p1.x() + dx, self._crop_p1.y() + dy)
+                    self._crop_p2 = QPointF(p1_x + dx, p1_y + dy)
                 except Exception:
                     self._crop_p2 = pos
             self.update()
-        else:
+        elif self._tool_mode != ToolMode.NONE:
+            # Cursor guides follow the mouse; without an active tool nothing on screen depends on it
             self.update()
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (
     QToolButton,
 )
 from PyQt6.QtCore import QSize
+from typing import Any
 import qtawesome as qta
 from negpy.desktop.controller import AppController
 from negpy.desktop.view.styles.theme import THEME
@@ -20,6 +21,7 @@ class ActionToolbar(QWidget):
         super().__init__()
         self.controller = controller
         self.session = controller.session
+        self._synced_state: Any = None
 
         self._init_ui()
         self._connect_signals()
@@ -164,7 +166,6 @@ class ActionToolbar(QWidget):
         new_geo = replace(self.session.state.config.geometry, rotation=new_rot)
         new_config = replace(self.session.state.config, geometry=new_geo)
         self.session.update_config(new_config)
-        self.controller.request_render()
 
     def flip(self, axis: str) -> None:
         from dataclasses import replace
@@ -177,10 +178,17 @@ class ActionToolbar(QWidget):
 
         new_config = replace(self.session.state.config, geometry=new_geo)
         self.session.update_config(new_config)
-        self.controller.request_render()
 
     def _update_ui_state(self) -> None:
+        """
+        Refreshes button states only when navigation or clipboard state changed, not on every config edit.
+        """
         state = self.session.state
+        key = (state.selected_file_idx, len(state.uploaded_files), state.clipboard is not None)
+        if key == self._synced_state:
+            return
+        self._synced_state = key
+
         self.btn_prev.setEnabled(state.selected_file_idx > 0)
         self.btn_next.setEnabled(state.selected_file_idx < len(state.uploaded_files) - 1)
         self.btn_unload.setEnabled(state.selected_file_idx >= 0)
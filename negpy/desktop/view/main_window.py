@@ -9,7 +9,6 @@ from PyQt6.QtWidgets import (
     QScrollArea,
 )
 from PyQt6.QtCore import Qt, QTimer
-from PIL import Image
 import numpy as np
 
 from negpy.desktop.view.canvas.widget import ImageCanvas
@@ -96,7 +95,7 @@ class MainWindow(QMainWindow):
         self.controller.export_progress.connect(self._on_export_progress)
         self.controller.export_finished.connect(self._on_export_finished)
         self.controller.tool_sync_requested.connect(self._sync_tool_buttons)
-        self.controller.config_updated.connect(self.canvas.overlay.update)
+        self.controller.config_updated.connect(self.canvas.overlay.refresh_for_config)
 
         self.controller.status_message_requested.connect(self.top_status.showMessage)
         self.controller.status_progress_requested.connect(self.top_status.set_progress)
@@ -126,21 +125,25 @@ class MainWindow(QMainWindow):
         if isinstance(buffer, np.ndarray):
             export_conf = self.state.config.export
             should_preview = export_conf.export_border_size > 0 or export_conf.paper_aspect_ratio != AspectRatio.ORIGINAL
+            # Soft-proofed renders arrive with their 8-bit proof; reuse it instead of quantizing again
+            display_u8 = metrics.get("base_positive_u8")
+            if display_u8 is None or display_u8.shape != buffer.shape:
+                display_u8 = None
 
             if should_preview:
-                pil_img = Image.fromarray(float_to_uint8(buffer))
                 try:
-                    pil_img, content_rect = PrintService.apply_preview_layout_to_pil(
-                        pil_img,
+                    buffer, content_rect = PrintService.apply_preview_layout(
+                        display_u8 if display_u8 is not None else float_to_uint8(buffer),
                         export_conf.paper_aspect_ratio,
                         export_conf.export_border_size,
                         export_conf.export_print_size,
                         export_conf.export_border_color,
                         APP_CONFIG.preview_render_size,
                     )
-                    buffer = np.array(pil_img).astype(np.float32) / 255.0
                 except Exception as e:
                     logger.error(f"Border preview failure: {e}")
+            elif display_u8 is not None:
+                buffer = display_u8
 
         self.canvas.update_buffer(buffer, self.state.workspace_color_space, content_rect=content_rect)
 
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -19,6 +21,9 @@ from negpy.desktop.view.sidebar.toning import ToningSidebar
 from negpy.desktop.view.sidebar.retouch import RetouchSidebar
 from negpy.desktop.view.sidebar.icc import ICCSidebar
 
+# Sections nothing outside the panel reads from; while collapsed their resync waits until they are expanded
+LAZY_SYNC_SECTIONS = ("presets", "process", "lab", "toning", "icc")
+
 
 class ControlsPanel(QWidget):
     """
@@ -28,6 +33,9 @@ class ControlsPanel(QWidget):
     def __init__(self, controller: AppController):
         super().__init__()
         self.controller = controller
+        # Inputs each sidebar was last synced from; sections whose inputs are unchanged are skipped
+        self._synced_inputs: Dict[str, Any] = {}
+        self._sections: Dict[str, CollapsibleSection] = {}
 
         self._init_ui()
         self._connect_signals()
@@ -121,21 +129,41 @@ class ControlsPanel(QWidget):
         section = CollapsibleSection(title, expanded=is_expanded, icon=icon)
         section.set_content(widget)
         self.layout.addWidget(section)
+        self._sections[key] = section
+        if key in LAZY_SYNC_SECTIONS:
+            section.toggle_button.toggled.connect(self._on_section_toggled)
 
     def _connect_signals(self) -> None:
         self.controller.config_updated.connect(self._sync_all_sidebars)
         self.controller.tool_sync_requested.connect(self._sync_tool_buttons)
 
+    def _on_section_toggled(self, expanded: bool) -> None:
+        if expanded:
+            self._sync_all_sidebars()
+
     def _sync_all_sidebars(self) -> None:
-        """Force all sidebar panels to update their widgets from current AppState."""
-        self.process_sidebar.sync_ui()
-        self.exposure_sidebar.sync_ui()
-        self.geometry_sidebar.sync_ui()
-        self.lab_sidebar.sync_ui()
-        self.toning_sidebar.sync_ui()
-        self.retouch_sidebar.sync_ui()
-        self.icc_sidebar.sync_ui()
-        self.presets_sidebar.sync_ui()
+        """Updates sidebar panels from current AppState, skipping panels whose inputs did not change."""
+        state = self.controller.state
+        conf = state.config
+        panels = (
+            ("process", self.process_sidebar, conf.process),
+            ("exposure", self.exposure_sidebar, (conf.exposure, state.active_tool)),
+            ("geometry", self.geometry_sidebar, (conf.geometry, state.active_tool)),
+            ("lab", self.lab_sidebar, (conf.lab, conf.process.process_mode)),
+            ("toning", self.toning_sidebar, (conf.toning, conf.process.process_mode)),
+            ("retouch", self.retouch_sidebar, (conf.retouch, state.active_tool)),
+            # Preset list is rescanned from disk; saves refresh it directly, so only redo it per file
+            ("presets", self.presets_sidebar, state.current_file_hash),
+            # ICC reads session state outside WorkspaceConfig
+            ("icc", self.icc_sidebar, (state.icc_profile_path, state.icc_invert, state.apply_icc_to_export)),
+        )
+        for key, sidebar, inputs in panels:
+            if key in self._synced_inputs and self._synced_inputs[key] == inputs:
+                continue
+            if key in LAZY_SYNC_SECTIONS and not self._sections[key].is_expanded():
+                continue
+            sidebar.sync_ui()
+            self._synced_inputs[key] = inputs
 
     def _sync_tool_buttons(self) -> None:
         """Updates toggle button states to match active_tool."""
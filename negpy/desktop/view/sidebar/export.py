@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (
     QDoubleSpinBox,
     QSpinBox,
     QWidget,
-    QVBoxLayout,
+    QGridLayout,
     QLabel,
 )
 from PyQt6.QtGui import QColor
@@ -59,50 +59,41 @@ class ExportSidebar(BaseSidebar):
         self._update_orig_res_style(conf.use_original_res)
         self.layout.addWidget(self.orig_res_btn)
 
+        # Label-over-input pairs sit in one grid each instead of nested row/column layouts
         self.size_container = QWidget()
-        size_layout = QVBoxLayout(self.size_container)
-        size_layout.setContentsMargins(0, 0, 0, 0)
-        print_row = QHBoxLayout()
+        size_grid = QGridLayout(self.size_container)
+        size_grid.setContentsMargins(0, 0, 0, 0)
 
-        vbox_size = QVBoxLayout()
-        vbox_size.addWidget(QLabel("Size (cm)"))
         self.size_input = QDoubleSpinBox()
         self.size_input.setRange(1.0, 500.0)
         self.size_input.setValue(conf.export_print_size)
-        vbox_size.addWidget(self.size_input)
 
-        vbox_dpi = QVBoxLayout()
-        vbox_dpi.addWidget(QLabel("DPI"))
         self.dpi_input = QSpinBox()
         self.dpi_input.setRange(72, 4800)
         self.dpi_input.setValue(conf.export_dpi)
-        vbox_dpi.addWidget(self.dpi_input)
 
-        print_row.addLayout(vbox_size)
-        print_row.addLayout(vbox_dpi)
-        size_layout.addLayout(print_row)
+        size_grid.addWidget(QLabel("Size (cm)"), 0, 0)
+        size_grid.addWidget(QLabel("DPI"), 0, 1)
+        size_grid.addWidget(self.size_input, 1, 0)
+        size_grid.addWidget(self.dpi_input, 1, 1)
         self.layout.addWidget(self.size_container)
         self.size_container.setVisible(not conf.use_original_res)
 
-        border_row = QHBoxLayout()
-        vbox_border = QVBoxLayout()
-        vbox_border.addWidget(QLabel("Width (cm)"))
         self.border_input = QDoubleSpinBox()
         self.border_input.setRange(0.0, 10.0)
         self.border_input.setSingleStep(0.1)
         self.border_input.setValue(conf.export_border_size)
-        vbox_border.addWidget(self.border_input)
 
-        vbox_color = QVBoxLayout()
-        vbox_color.addWidget(QLabel("Color"))
         self.color_btn = QPushButton()
         self.color_btn.setFixedHeight(30)
         self._update_color_btn(conf.export_border_color)
-        vbox_color.addWidget(self.color_btn)
 
-        border_row.addLayout(vbox_border)
-        border_row.addLayout(vbox_color)
-        self.layout.addLayout(border_row)
+        border_grid = QGridLayout()
+        border_grid.addWidget(QLabel("Width (cm)"), 0, 0)
+        border_grid.addWidget(QLabel("Color"), 0, 1)
+        border_grid.addWidget(self.border_input, 1, 0)
+        border_grid.addWidget(self.color_btn, 1, 1)
+        self.layout.addLayout(border_grid)
 
         self.pattern_input = QLineEdit(conf.filename_pattern)
         self.pattern_input.setPlaceholderText("Filename Pattern...")
@@ -199,21 +190,23 @@ class ExportSidebar(BaseSidebar):
             self.apply_all_btn.setIcon(qta.icon("fa5s.clone", color=THEME.text_primary))
 
     def _persist_all_export_settings(self) -> None:
-        """Collects all UI values and performs a single debounced config update."""
-        self.update_config_section(
-            "export",
-            persist=True,
-            render=False,
-            export_fmt=self.fmt_combo.currentText(),
-            export_color_space=self.cs_combo.currentText(),
-            paper_aspect_ratio=self.ratio_combo.currentText(),
-            use_original_res=self.orig_res_btn.isChecked(),
-            export_print_size=self.size_input.value(),
-            export_dpi=self.dpi_input.value(),
-            export_border_size=self.border_input.value(),
-            filename_pattern=self.pattern_input.text(),
-            export_path=self.path_input.text(),
-        )
+        """Collects all UI values and performs a single debounced config update, skipped when nothing changed."""
+        conf = self.state.config.export
+        values = {
+            "export_fmt": self.fmt_combo.currentText(),
+            "export_color_space": self.cs_combo.currentText(),
+            "paper_aspect_ratio": self.ratio_combo.currentText(),
+            "use_original_res": self.orig_res_btn.isChecked(),
+            "export_print_size": self.size_input.value(),
+            "export_dpi": self.dpi_input.value(),
+            "export_border_size": self.border_input.value(),
+            "filename_pattern": self.pattern_input.text(),
+            "export_path": self.path_input.text(),
+        }
+        changes = {k: v for k, v in values.items() if getattr(conf, k) != v}
+        if not changes:
+            return
+        self.update_config_section("export", persist=True, render=False, **changes)
 
     def _on_orig_res_toggled(self, checked: bool) -> None:
         self._update_orig_res_style(checked)
@@ -1,3 +1,4 @@
+from typing import Any, Tuple
 from PyQt6.QtWidgets import (
     QPushButton,
     QHBoxLayout,
@@ -8,6 +9,26 @@ from negpy.desktop.view.styles.theme import THEME
 from negpy.desktop.view.sidebar.base import BaseSidebar
 from negpy.desktop.session import ToolMode
 
+# Slider attribute -> ExposureConfig field; drives signal wiring, sync and signal blocking
+EXPOSURE_SLIDER_FIELDS = (
+    ("cyan_slider", "wb_cyan"),
+    ("magenta_slider", "wb_magenta"),
+    ("yellow_slider", "wb_yellow"),
+    ("density_slider", "density"),
+    ("grade_slider", "grade"),
+    ("toe_slider", "toe"),
+    ("toe_w_slider", "toe_width"),
+    ("toe_h_slider", "toe_hardness"),
+    ("sh_slider", "shoulder"),
+    ("sh_w_slider", "shoulder_width"),
+    ("sh_h_slider", "shoulder_hardness"),
+)
+
+
+def _read_slider_values(conf: Any) -> Tuple[Any, ...]:
+    """Slider-backed field values in table order; always a tuple, whatever the table length."""
+    return tuple(getattr(conf, field_name) for _, field_name in EXPOSURE_SLIDER_FIELDS)
+
 
 class ExposureSidebar(BaseSidebar):
     """
@@ -68,26 +89,15 @@ class ExposureSidebar(BaseSidebar):
         self.layout.addLayout(sh_row)
 
         self.layout.addStretch()
+        self._sliders = tuple(getattr(self, attr) for attr, _ in EXPOSURE_SLIDER_FIELDS)
 
     def _connect_signals(self) -> None:
-        self.cyan_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, wb_cyan=v))
-        self.magenta_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, wb_magenta=v))
-        self.yellow_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, wb_yellow=v))
-
-        self.density_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, density=v))
-        self.grade_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, grade=v))
+        for slider, (_, field_name) in zip(self._sliders, EXPOSURE_SLIDER_FIELDS):
+            slider.valueChanged.connect(lambda v, f=field_name: self.update_config_section("exposure", readback_metrics=False, **{f: v}))
 
         self.pick_wb_btn.toggled.connect(self._on_pick_wb_toggled)
         self.camera_wb_btn.toggled.connect(self._on_camera_wb_toggled)
 
-        self.toe_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, toe=v))
-        self.toe_w_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, toe_width=v))
-        self.toe_h_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, toe_hardness=v))
-
-        self.sh_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, shoulder=v))
-        self.sh_w_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, shoulder_width=v))
-        self.sh_h_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, shoulder_hardness=v))
-
     def _on_pick_wb_toggled(self, checked: bool) -> None:
         self.controller.set_active_tool(ToolMode.WB_PICK if checked else ToolMode.NONE)
 
@@ -101,23 +111,11 @@ class ExposureSidebar(BaseSidebar):
 
         self.block_signals(True)
         try:
-            self.cyan_slider.setValue(conf.wb_cyan)
-            self.magenta_slider.setValue(conf.wb_magenta)
-            self.yellow_slider.setValue(conf.wb_yellow)
+            for slider, value in zip(self._sliders, _read_slider_values(conf)):
+                slider.setValue(value)
 
             self.pick_wb_btn.setChecked(self.state.active_tool == ToolMode.WB_PICK)
             self.camera_wb_btn.setChecked(conf.use_camera_wb)
-
-            self.density_slider.setValue(conf.density)
-            self.grade_slider.setValue(conf.grade)
-
-            self.toe_slider.setValue(conf.toe)
-            self.toe_w_slider.setValue(conf.toe_width)
-            self.toe_h_slider.setValue(conf.toe_hardness)
-
-            self.sh_slider.setValue(conf.shoulder)
-            self.sh_w_slider.setValue(conf.shoulder_width)
-            self.sh_h_slider.setValue(conf.shoulder_hardness)
         finally:
             self.block_signals(False)
 
@@ -125,20 +123,5 @@ class ExposureSidebar(BaseSidebar):
         """
         Helper to block/unblock all sliders and buttons.
         """
-        widgets = [
-            self.cyan_slider,
-            self.magenta_slider,
-            self.yellow_slider,
-            self.pick_wb_btn,
-            self.camera_wb_btn,
-            self.density_slider,
-            self.grade_slider,
-            self.toe_slider,
-            self.toe_w_slider,
-            self.toe_h_slider,
-            self.sh_slider,
-            self.sh_w_slider,
-            self.sh_h_slider,
-        ]
-        for w in widgets:
+        for w in (*self._sliders, self.pick_wb_btn, self.camera_wb_btn):
             w.blockSignals(blocked)
@@ -1,4 +1,5 @@
 import os
+from typing import Any
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -16,6 +17,9 @@ from negpy.desktop.view.styles.theme import THEME
 from negpy.infrastructure.filesystem.watcher import FolderWatchService
 from negpy.infrastructure.loaders.helpers import get_supported_raw_wildcards
 
+# Items laid out per event-loop pass, keeps large rolls responsive while loading.
+THUMBNAIL_LAYOUT_BATCH = 40
+
 
 class FileBrowser(QWidget):
     """
@@ -38,6 +42,11 @@ class FileBrowser(QWidget):
         self.selection_timer.setInterval(200)
         self.selection_timer.timeout.connect(self._commit_selection)
 
+        # Selection state the list was last synced to; config edits leave it untouched
+        self._synced_selection: Any = None
+        # (folder, supported file names, file count) of the last hot folder scan that found nothing new; unchanged ticks skip the diff
+        self._scanned_folder_key: Any = None
+
         self._init_ui()
         self._connect_signals()
 
@@ -86,6 +95,9 @@ class FileBrowser(QWidget):
         self.list_view.setSelectionMode(QListView.SelectionMode.ExtendedSelection)
         self.list_view.setIconSize(QSize(100, 100))
         self.list_view.setGridSize(QSize(120, 130))
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setBatchSize(THUMBNAIL_LAYOUT_BATCH)
         self.list_view.setSpacing(10)
         self.list_view.setWordWrap(True)
         self.list_view.setAlternatingRowColors(False)
@@ -104,7 +116,21 @@ class FileBrowser(QWidget):
         self.list_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.hot_folder_btn.toggled.connect(self._on_hot_folder_toggled)
         self.sync_btn.clicked.connect(self.session.sync_selected_settings)
-        self.session.state_changed.connect(self.sync_ui)
+        self.session.state_changed.connect(self._on_state_changed)
+
+    def _on_state_changed(self) -> None:
+        """
+        Resyncs the list only when selection or the file list changed, not on every config edit.
+        A click still inside the selection debounce is left alone; the commit catches up afterwards.
+        """
+        if self.selection_timer.isActive():
+            return
+        state = self.session.state
+        key = (tuple(state.selected_indices), state.selected_file_idx, len(state.uploaded_files))
+        if key == self._synced_selection:
+            return
+        self._synced_selection = key
+        self.sync_ui()
 
     def sync_ui(self) -> None:
         """Updates list selection to match session state."""
@@ -143,6 +169,8 @@ class FileBrowser(QWidget):
         indices = [idx.row() for idx in self.list_view.selectionModel().selectedIndexes()]
         if set(indices) != set(self.session.state.selected_indices):
             self.session.update_selection(indices)
+        # Apply any resync skipped while the debounce was pending
+        self._on_state_changed()
 
     def _on_hot_folder_toggled(self, checked: bool) -> None:
         self._update_hot_folder_style(checked)
@@ -165,11 +193,21 @@ class FileBrowser(QWidget):
 
         last_file = self.session.state.uploaded_files[-1]
         folder_path = os.path.dirname(last_file["path"])
+        names = FolderWatchService.list_supported_files(folder_path)
+        if names is None:
+            return
+        key = (folder_path, names, len(self.session.state.uploaded_files))
+        if key == self._scanned_folder_key:
+            return
+
         existing = {f["path"] for f in self.session.state.uploaded_files}
 
-        new_files = FolderWatchService.scan_for_new_files(folder_path, existing)
+        new_files = FolderWatchService.scan_for_new_files(folder_path, existing, names)
         if new_files:
+            # Not cached: files that fail discovery (mid-copy, locked) are retried on the next tick
             self.controller.request_asset_discovery(new_files)
+        else:
+            self._scanned_folder_key = key
 
     def _on_add_files(self) -> None:
         wildcards = get_supported_raw_wildcards()
@@ -1,4 +1,5 @@
 import os
+from typing import Dict, Optional
 from PyQt6.QtWidgets import (
     QComboBox,
     QCheckBox,
@@ -20,14 +21,16 @@ class ICCSidebar(BaseSidebar):
         available = ColorService.get_available_profiles()
         self.profiles = ["None"] + available
 
+        names = [os.path.basename(p) for p in self.profiles]
         self.profile_combo = QComboBox()
-        self.profile_combo.addItems([os.path.basename(p) for p in self.profiles])
+        self.profile_combo.addItems(names)
 
-        path = self.state.icc_profile_path
-        if path:
-            self.profile_combo.setCurrentText(os.path.basename(path))
-        else:
-            self.profile_combo.setCurrentText("None")
+        # Combo row per profile name, first match wins like QComboBox.findText
+        self._profile_index: Dict[str, int] = {}
+        for i, name in enumerate(names):
+            self._profile_index.setdefault(name, i)
+
+        self._select_profile(self.state.icc_profile_path)
 
         # Direction (Input/Output)
         self.mode_group = QGroupBox("Direction")
@@ -53,6 +56,11 @@ class ICCSidebar(BaseSidebar):
 
         self.layout.addStretch()
 
+    def _select_profile(self, path: Optional[str]) -> None:
+        index = self._profile_index.get(os.path.basename(path) if path else "None")
+        if index is not None:
+            self.profile_combo.setCurrentIndex(index)
+
     def _connect_signals(self) -> None:
         self.profile_combo.currentIndexChanged.connect(self._on_profile_changed)
         self.radio_input.toggled.connect(self._on_mode_changed)
@@ -65,20 +73,18 @@ class ICCSidebar(BaseSidebar):
 
     def _on_mode_changed(self) -> None:
         self.state.icc_invert = self.radio_input.isChecked()
-        self.controller.request_render()
+        # Direction only affects the preview while a profile is selected
+        if self.state.icc_profile_path:
+            self.controller.request_render()
 
     def _on_apply_changed(self, checked: bool) -> None:
+        # Read at export time only; the preview is unaffected
         self.state.apply_icc_to_export = checked
-        self.controller.request_render()
 
     def sync_ui(self) -> None:
         self.block_signals(True)
         try:
-            path = self.state.icc_profile_path
-            if path:
-                self.profile_combo.setCurrentText(os.path.basename(path))
-            else:
-                self.profile_combo.setCurrentText("None")
+            self._select_profile(self.state.icc_profile_path)
 
             if self.state.icc_invert:
                 self.radio_input.setChecked(True)
@@ -1,8 +1,22 @@
+from typing import Any, Tuple
 from PyQt6.QtWidgets import QHBoxLayout
 from negpy.desktop.view.widgets.sliders import CompactSlider
 from negpy.desktop.view.sidebar.base import BaseSidebar
 from negpy.features.process.models import ProcessMode
 
+# Slider attribute -> LabConfig field; drives signal wiring, sync and signal blocking
+LAB_SLIDER_FIELDS = (
+    ("separation_slider", "color_separation"),
+    ("saturation_slider", "saturation"),
+    ("clahe_slider", "clahe_strength"),
+    ("sharpen_slider", "sharpen"),
+)
+
+
+def _read_slider_values(conf: Any) -> Tuple[Any, ...]:
+    """Slider-backed LabConfig values in table order."""
+    return tuple(getattr(conf, field_name) for _, field_name in LAB_SLIDER_FIELDS)
+
 
 class LabSidebar(BaseSidebar):
     """
@@ -28,12 +42,11 @@ class LabSidebar(BaseSidebar):
         self.layout.addLayout(row2)
 
         self.layout.addStretch()
+        self._sliders = tuple(getattr(self, attr) for attr, _ in LAB_SLIDER_FIELDS)
 
     def _connect_signals(self) -> None:
-        self.clahe_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, clahe_strength=v))
-        self.sharpen_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, sharpen=v))
-        self.saturation_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, saturation=v))
-        self.separation_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, color_separation=v))
+        for slider, (_, field_name) in zip(self._sliders, LAB_SLIDER_FIELDS):
+            slider.valueChanged.connect(lambda v, f=field_name: self.update_config_section("lab", readback_metrics=False, **{f: v}))
 
     def sync_ui(self) -> None:
         conf = self.state.config.lab
@@ -41,10 +54,8 @@ class LabSidebar(BaseSidebar):
 
         self.block_signals(True)
         try:
-            self.clahe_slider.setValue(conf.clahe_strength)
-            self.sharpen_slider.setValue(conf.sharpen)
-            self.saturation_slider.setValue(conf.saturation)
-            self.separation_slider.setValue(conf.color_separation)
+            for slider, value in zip(self._sliders, _read_slider_values(conf)):
+                slider.setValue(value)
 
             self.separation_slider.setEnabled(not is_bw)
             self.saturation_slider.setEnabled(not is_bw)
@@ -52,11 +63,5 @@ class LabSidebar(BaseSidebar):
             self.block_signals(False)
 
     def block_signals(self, blocked: bool) -> None:
-        widgets = [
-            self.clahe_slider,
-            self.sharpen_slider,
-            self.saturation_slider,
-            self.separation_slider,
-        ]
-        for w in widgets:
-            w.blockSignals(blocked)
+        for slider in self._sliders:
+            slider.blockSignals(blocked)
@@ -20,6 +20,7 @@ class PresetsSidebar(BaseSidebar):
         # Load Row
         row_load = QHBoxLayout()
         self.preset_combo = QComboBox()
+        self._preset_names: list[str] = []
         self._refresh_presets()
 
         self.load_btn = QPushButton(" Load")
@@ -69,9 +70,20 @@ class PresetsSidebar(BaseSidebar):
         self.name_input.clear()
 
     def _refresh_presets(self) -> None:
+        """
+        Populates preset dropdown, rebuilding items only when the preset list changed.
+        """
+        names = Presets.list_presets()
+        if names == self._preset_names:
+            return
+
+        current = self.preset_combo.currentText()
         self.preset_combo.blockSignals(True)
         self.preset_combo.clear()
-        self.preset_combo.addItems(Presets.list_presets())
+        self._preset_names = names
+        self.preset_combo.addItems(names)
+        if current in names:
+            self.preset_combo.setCurrentText(current)
         self.preset_combo.blockSignals(False)
 
     def sync_ui(self) -> None:
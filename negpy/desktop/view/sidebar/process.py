@@ -11,6 +11,16 @@ from negpy.desktop.view.sidebar.base import BaseSidebar
 from negpy.features.process.models import ProcessMode
 
 
+ACTIVE_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {THEME.accent_primary};
+        color: white;
+        border-radius: 4px;
+        font-weight: bold;
+    }}
+"""
+
+
 class ProcessSidebar(BaseSidebar):
     """
     Panel for core film processing, normalization, and roll management.
@@ -25,13 +35,19 @@ class ProcessSidebar(BaseSidebar):
         self.mode_combo.setCurrentText(conf.process_mode)
         self.layout.addWidget(self.mode_combo)
 
-        self.analysis_buffer_slider = SignalSlider("Analysis Buffer", 0.0, 0.25, conf.analysis_buffer)
+        # Each change re-runs the full density analysis, so only the released value is applied
+        self.analysis_buffer_slider = SignalSlider("Analysis Buffer", 0.0, 0.25, conf.analysis_buffer, live=False)
         self.layout.addWidget(self.analysis_buffer_slider)
 
+        # Toggle icons keyed by checked state, built once rather than on every sync
+        self._normalize_icons = {
+            True: qta.icon("fa5s.magic", color="white"),
+            False: qta.icon("fa5s.magic", color=THEME.text_primary),
+        }
         self.normalize_e6_btn = QPushButton(" Normalize")
         self.normalize_e6_btn.setFixedHeight(35)
         self.normalize_e6_btn.setCheckable(True)
-        self.normalize_e6_btn.setIcon(qta.icon("fa5s.magic", color=THEME.text_primary))
+        self.normalize_e6_btn.setIcon(self._normalize_icons[False])
         self.normalize_e6_btn.setChecked(conf.e6_normalize)
         self.normalize_e6_btn.setToolTip("Automatically stretch the histogram to full dynamic range")
         self.layout.addWidget(self.normalize_e6_btn)
@@ -44,6 +60,7 @@ class ProcessSidebar(BaseSidebar):
         self.use_roll_avg_btn = QPushButton(" Use Roll Average")
         self.use_roll_avg_btn.setFixedHeight(35)
         self.use_roll_avg_btn.setCheckable(True)
+        self.use_roll_avg_btn.setIcon(qta.icon("mdi6.film", color="white"))
         self._update_roll_avg_btn_style(conf.use_roll_average)
 
         btns_row.addWidget(self.analyze_roll_btn)
@@ -52,6 +69,7 @@ class ProcessSidebar(BaseSidebar):
 
         self.roll_combo = QComboBox()
         self.roll_combo.setPlaceholderText("Select Roll...")
+        self._roll_names: list[str] = []
         self._refresh_rolls()
         self.layout.addWidget(self.roll_combo)
 
@@ -84,8 +102,8 @@ class ProcessSidebar(BaseSidebar):
         self.delete_roll_btn.clicked.connect(self._on_delete_roll)
 
     def _on_mode_changed(self, mode: str) -> None:
+        # config_updated already resyncs this panel
         self.update_config_section("process", process_mode=mode, persist=True)
-        self.sync_ui()
 
     def _on_normalize_e6_toggled(self, checked: bool) -> None:
         self.update_config_section("process", e6_normalize=checked, persist=True)
@@ -124,12 +142,16 @@ class ProcessSidebar(BaseSidebar):
 
     def _refresh_rolls(self) -> None:
         """
-        Populates roll dropdown from database.
+        Populates roll dropdown from database, rebuilding items only when the roll list changed.
         """
+        rolls = self.controller.session.repo.list_normalization_rolls()
+        if rolls == self._roll_names:
+            return
+
         current = self.roll_combo.currentText()
         self.roll_combo.blockSignals(True)
         self.roll_combo.clear()
-        rolls = self.controller.session.repo.list_normalization_rolls()
+        self._roll_names = rolls
         self.roll_combo.addItems(rolls)
         if current in rolls:
             self.roll_combo.setCurrentText(current)
@@ -166,56 +188,16 @@ class ProcessSidebar(BaseSidebar):
 
     def _update_roll_avg_btn_style(self, checked: bool) -> None:
         """
-        Updates button icon and color based on active state.
+        Updates button color based on active state.
         """
-        self.use_roll_avg_btn.setIcon(qta.icon("mdi6.film", color="white"))
-        if checked:
-            self.use_roll_avg_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {THEME.accent_primary};
-                    color: white;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }}
-            """)
-        else:
-            self.use_roll_avg_btn.setStyleSheet("")
+        self.use_roll_avg_btn.setStyleSheet(ACTIVE_BUTTON_QSS if checked else "")
 
     def _update_normalize_btn_style(self, checked: bool) -> None:
         """
         Updates normalize button icon and color.
         """
-        if checked:
-            self.normalize_e6_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {THEME.accent_primary};
-                    color: white;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }}
-            """)
-            self.normalize_e6_btn.setIcon(qta.icon("fa5s.magic", color="white"))
-        else:
-            self.normalize_e6_btn.setStyleSheet("")
-            self.normalize_e6_btn.setIcon(qta.icon("fa5s.magic", color=THEME.text_primary))
-
-    def _update_link_shadows_btn_style(self, checked: bool) -> None:
-        """
-        Updates link shadows button icon and color.
-        """
-        if checked:
-            self.link_shadows_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {THEME.accent_primary};
-                    color: white;
-                    border-radius: 4px;
-                    font-weight: bold;
-                }}
-            """)
-            self.link_shadows_btn.setIcon(qta.icon("fa5s.link", color="white"))
-        else:
-            self.link_shadows_btn.setStyleSheet("")
-            self.link_shadows_btn.setIcon(qta.icon("fa5s.link", color=THEME.text_primary))
+        self.normalize_e6_btn.setStyleSheet(ACTIVE_BUTTON_QSS if checked else "")
+        self.normalize_e6_btn.setIcon(self._normalize_icons[checked])
 
     def sync_ui(self) -> None:
         conf = self.state.config.process
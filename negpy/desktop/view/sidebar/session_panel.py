@@ -37,6 +37,10 @@ class SessionPanel(QWidget):
     def __init__(self, controller: AppController):
         super().__init__()
         self.controller = controller
+        # Set when analysis updates arrive while the Analysis tab is hidden
+        self._analysis_stale = False
+        # Export config the export tab was last synced from
+        self._synced_export: Any = None
 
         self._init_ui()
         self._connect_signals()
@@ -106,7 +110,8 @@ class SessionPanel(QWidget):
 
         analysis_layout.addWidget(self.hist_widget, 1)
         analysis_layout.addWidget(self.curve_widget, 1)
-        self.tabs.addTab(wrap_scroll(self.analysis_group), "Analysis")
+        self.analysis_tab = wrap_scroll(self.analysis_group)
+        self.tabs.addTab(self.analysis_tab, "Analysis")
 
         self.export_sidebar = ExportSidebar(self.controller)
         self.tabs.addTab(wrap_scroll(self.export_sidebar), "Export")
@@ -120,28 +125,52 @@ class SessionPanel(QWidget):
     def _connect_signals(self) -> None:
         self.controller.image_updated.connect(self._update_analysis)
         self.controller.metrics_available.connect(self._on_metrics_available)
-        self.controller.config_updated.connect(self.export_sidebar.sync_ui)
+        self.controller.config_updated.connect(self._sync_export)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _sync_export(self) -> None:
+        """
+        Resyncs the export tab only when export settings changed; edits elsewhere leave it untouched.
+        """
+        conf = self.controller.session.state.config.export
+        if conf == self._synced_export:
+            return
+        self.export_sidebar.sync_ui()
+        self._synced_export = conf
 
     def _on_metrics_available(self, metrics: Dict[str, Any]) -> None:
-        hist_data = metrics.get("histogram_raw")
-        if hist_data is not None:
-            self.hist_widget.update_data(hist_data)
+        if self.tabs.currentWidget() is not self.analysis_tab:
+            self._analysis_stale = True
+            return
+        self._update_histogram(metrics, allow_buffer=False)
 
-    def _update_analysis(self) -> None:
-        metrics = self.controller.session.state.last_metrics
-
-        hist_data = metrics.get("histogram_raw")
-        if hist_data is not None:
-            self.hist_widget.update_data(hist_data)
-        else:
-            buffer = metrics.get("analysis_buffer")
-            if buffer is None:
-                buffer = metrics.get("base_positive")
-            if buffer is not None:
-                self.hist_widget.update_data(buffer)
+    def _on_tab_changed(self, _index: int) -> None:
+        if self._analysis_stale and self.tabs.currentWidget() is self.analysis_tab:
+            self._update_analysis()
 
+    def _update_analysis(self) -> None:
+        """
+        Refreshes histogram and curve; deferred until the Analysis tab is shown.
+        """
+        if self.tabs.currentWidget() is not self.analysis_tab:
+            self._analysis_stale = True
+            return
+        self._analysis_stale = False
+        self._update_histogram(self.controller.session.state.last_metrics, allow_buffer=True)
         self.curve_widget.update_curve(self.controller.session.state.config.exposure)
 
+    def _update_histogram(self, metrics: Dict[str, Any], allow_buffer: bool) -> None:
+        """
+        Feeds the histogram from GPU counts, or from the rendered buffer when allowed.
+        """
+        data = metrics.get("histogram_raw")
+        if data is None and allow_buffer:
+            data = metrics.get("analysis_buffer")
+            if data is None:
+                data = metrics.get("base_positive")
+        if data is not None:
+            self.hist_widget.update_data(data)
+
     def _on_update_found(self, version: str) -> None:
         self.update_label.setText(f"Update Available: v{version}")
         self.update_label.setVisible(True)
@@ -1,9 +1,21 @@
+from typing import Any, Tuple
 from PyQt6.QtWidgets import QComboBox
 from negpy.desktop.view.widgets.sliders import SignalSlider
 from negpy.desktop.view.sidebar.base import BaseSidebar
 from negpy.features.process.models import ProcessMode
 from negpy.features.toning.logic import PAPER_PROFILES
 
+# Slider attribute -> ToningConfig field; drives signal wiring, sync and signal blocking
+TONING_SLIDER_FIELDS = (
+    ("selenium_slider", "selenium_strength"),
+    ("sepia_slider", "sepia_strength"),
+)
+
+
+def _read_slider_values(conf: Any) -> Tuple[Any, ...]:
+    """Slider-backed ToningConfig values in table order."""
+    return tuple(getattr(conf, field_name) for _, field_name in TONING_SLIDER_FIELDS)
+
 
 class ToningSidebar(BaseSidebar):
     """
@@ -25,13 +37,12 @@ class ToningSidebar(BaseSidebar):
         self.layout.addWidget(self.sepia_slider)
 
         self.layout.addStretch()
+        self._sliders = tuple(getattr(self, attr) for attr, _ in TONING_SLIDER_FIELDS)
 
     def _connect_signals(self) -> None:
         self.paper_combo.currentTextChanged.connect(lambda v: self.update_config_section("toning", paper_profile=v))
-        self.selenium_slider.valueChanged.connect(
-            lambda v: self.update_config_section("toning", readback_metrics=False, selenium_strength=v)
-        )
-        self.sepia_slider.valueChanged.connect(lambda v: self.update_config_section("toning", readback_metrics=False, sepia_strength=v))
+        for slider, (_, field_name) in zip(self._sliders, TONING_SLIDER_FIELDS):
+            slider.valueChanged.connect(lambda v, f=field_name: self.update_config_section("toning", readback_metrics=False, **{f: v}))
 
     def sync_ui(self) -> None:
         conf = self.state.config.toning
@@ -40,19 +51,13 @@ class ToningSidebar(BaseSidebar):
         self.block_signals(True)
         try:
             self.paper_combo.setCurrentText(conf.paper_profile)
-            self.selenium_slider.setValue(conf.selenium_strength)
-            self.sepia_slider.setValue(conf.sepia_strength)
-
-            self.selenium_slider.setEnabled(is_bw)
-            self.sepia_slider.setEnabled(is_bw)
+            for slider, value in zip(self._sliders, _read_slider_values(conf)):
+                slider.setValue(value)
+                slider.setEnabled(is_bw)
         finally:
             self.block_signals(False)
 
     def block_signals(self, blocked: bool) -> None:
-        widgets = [
-            self.paper_combo,
-            self.selenium_slider,
-            self.sepia_slider,
-        ]
-        for w in widgets:
-            w.blockSignals(blocked)
+        self.paper_combo.blockSignals(blocked)
+        for slider in self._sliders:
+            slider.blockSignals(blocked)
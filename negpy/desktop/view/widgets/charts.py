@@ -1,10 +1,59 @@
+import math
+from functools import lru_cache
+
 import numpy as np
-from typing import Any
+from typing import Any, List, Optional, Tuple
 from PyQt6.QtWidgets import QWidget, QSizePolicy
 from PyQt6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath, QPolygonF
 from PyQt6.QtCore import Qt, QPointF, QMargins
-from negpy.kernel.image.logic import get_luminance
+from negpy.kernel.image.logic import get_channel_histograms
+
+# Curve sample axis is fixed, build it once in the dtype the sigmoid works in.
+CURVE_SAMPLES_X = np.linspace(-0.1, 1.1, 50, dtype=np.float32)
+CURVE_SAMPLES_LOG_EXP = 1.0 - CURVE_SAMPLES_X
+# Density -> display value, (10 ** -D) ** (1 / 2.2), as one exp
+CURVE_DENSITY_TO_DISPLAY = -math.log(10.0) / 2.2
+
+# Histograms are statistical; a strided sample of about this many pixels on the long edge is plenty.
+HISTOGRAM_SAMPLE_EDGE = 512
+
+
+@lru_cache(maxsize=64)
+def _curve_samples(key: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Display-space curve samples for (density, grade, toe, toe_width, toe_hardness,
+    shoulder, shoulder_width, shoulder_hardness); revisited settings skip the sigmoid.
+    """
+    from negpy.features.exposure.logic import LogisticSigmoid
+    from negpy.features.exposure.models import EXPOSURE_CONSTANTS
+
+    density, grade, toe, toe_width, toe_hardness, shoulder, shoulder_width, shoulder_hardness = key
+
+    master_ref = 1.0
+    exposure_shift = 0.1 + (density * EXPOSURE_CONSTANTS["density_multiplier"])
+    pivot = master_ref - exposure_shift
+    slope = 1.0 + (grade * EXPOSURE_CONSTANTS["grade_multiplier"])
+
+    curve = LogisticSigmoid(
+        contrast=slope,
+        pivot=pivot,
+        d_max=3.5,
+        toe=toe,
+        toe_width=toe_width,
+        toe_hardness=toe_hardness,
+        shoulder=shoulder,
+        shoulder_width=shoulder_width,
+        shoulder_hardness=shoulder_hardness,
+    )
+
+    d = curve(CURVE_SAMPLES_LOG_EXP)
+    y = np.exp(d * CURVE_DENSITY_TO_DISPLAY)
+    return tuple(y.tolist())
+
+
+# Shared placeholder for a channel with no curve; never written to
+_EMPTY_CURVE = np.zeros(0, dtype=np.float32)
 
 
 class HistogramWidget(QWidget):
@@ -17,117 +66,117 @@ class HistogramWidget(QWidget):
         super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setMinimumHeight(40)
-        self._data_r = []
-        self._data_g = []
-        self._data_b = []
-        self._data_l = []
+        self._data_r: np.ndarray = _EMPTY_CURVE
+        self._data_g: np.ndarray = _EMPTY_CURVE
+        self._data_b: np.ndarray = _EMPTY_CURVE
+        self._data_l: np.ndarray = _EMPTY_CURVE
+        # Last buffer the curves were computed from; kept alive so identity checks stay valid
+        self._source: Any = None
+        # Bin counts behind the current curves
+        self._counts: Optional[np.ndarray] = None
+        self._paths: Optional[List[Tuple[QPainterPath, QPainterPath, QBrush, QPen]]] = None
+        self._paths_size: Tuple[int, int] = (0, 0)
 
     def update_data(self, buffer: Any) -> None:
         """
         Calculates histograms and triggers repaint.
+        Re-submitting the buffer the current curves came from is a no-op,
+        as is a new buffer whose bin counts match the ones already drawn.
         """
-        if buffer is None:
-            self._data_r = []
-            self._data_g = []
-            self._data_b = []
-            self._data_l = []
-            self.update()
+        if buffer is not None and buffer is self._source:
             return
+        self._source = buffer
 
-        if isinstance(buffer, np.ndarray) and buffer.shape == (4, 256):
-            self._data_r = self._normalize(buffer[0])
-            self._data_g = self._normalize(buffer[1])
-            self._data_b = self._normalize(buffer[2])
-            self._data_l = self._normalize(buffer[3])
+        if buffer is None:
+            self._counts = None
+            self._paths = None
+            self._data_r = _EMPTY_CURVE
+            self._data_g = _EMPTY_CURVE
+            self._data_b = _EMPTY_CURVE
+            self._data_l = _EMPTY_CURVE
             self.update()
             return
 
         if not isinstance(buffer, np.ndarray):
+            self._source = None
             return
 
-        if buffer.shape[0] > 500:
-            buffer = buffer[::4, ::4]
+        if buffer.shape == (4, 256):
+            counts = buffer
+        else:
+            step = max(1, max(buffer.shape[:2]) // HISTOGRAM_SAMPLE_EDGE)
+            counts = get_channel_histograms(buffer, step)
 
-        lum = get_luminance(buffer)
+        # Unrelated edits often re-render to identical bins; keep the built paths
+        if self._counts is not None and np.array_equal(counts, self._counts):
+            return
+        self._counts = np.array(counts, copy=True)
+        self._paths = None
 
-        self._data_r = self._calc_hist(buffer[..., 0])
-        self._data_g = self._calc_hist(buffer[..., 1])
-        self._data_b = self._calc_hist(buffer[..., 2])
-        self._data_l = self._calc_hist(lum)
+        self._data_r = self._normalize(counts[0])
+        self._data_g = self._normalize(counts[1])
+        self._data_b = self._normalize(counts[2])
+        self._data_l = self._normalize(counts[3])
         self.update()
 
-    def _normalize(self, counts: np.ndarray) -> list:
+    def _normalize(self, counts: np.ndarray) -> np.ndarray:
         max_val = float(np.max(counts))
         if max_val <= 0:
-            return []
-        return (counts.astype(float) / max_val).tolist()
-
-    def _calc_hist(self, data: np.ndarray) -> list:
-        hist, _ = np.histogram(data, bins=256, range=(0, 1))
-        max_val = hist.max()
-        if max_val <= 0:
-            return []
-        return (hist.astype(float) / max_val).tolist()
+            return _EMPTY_CURVE
+        res: np.ndarray = counts.astype(np.float32) * np.float32(1.0 / max_val)
+        return res
 
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        w = self.width()
-        h = self.height()
-
-        self._draw_channel(painter, self._data_l, "#eeeeee", 30, 150, w, h)
-        self._draw_channel(painter, self._data_r, "#d32f2f", 80, 200, w, h)
-        self._draw_channel(painter, self._data_g, "#388e3c", 80, 200, w, h)
-        self._draw_channel(painter, self._data_b, "#1976d2", 80, 200, w, h)
-
-    def _draw_channel(
-        self,
-        painter: QPainter,
-        data: list,
-        color_hex: str,
-        alpha_fill: int,
-        alpha_line: int,
-        w: int,
-        h: int,
-    ):
-        if not data:
-            return
+        size = (self.width(), self.height())
+        if self._paths is None or self._paths_size != size:
+            self._paths = self._build_paths(*size)
+            self._paths_size = size
 
-        if len(data) < 2:
-            return
+        for fill_path, line_path, brush, pen in self._paths:
+            painter.setBrush(brush)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawPath(fill_path)
 
-        path = QPainterPath()
-        path.moveTo(0, h)
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.setPen(pen)
+            painter.drawPath(line_path)
 
-        step = w / (len(data) - 1)
+    def _build_paths(self, w: int, h: int) -> List[Tuple[QPainterPath, QPainterPath, QBrush, QPen]]:
+        """
+        Builds fill and outline paths for each channel; reused across repaints until data or size changes.
+        """
+        channels = (
+            (self._data_l, "#eeeeee", 30, 150),
+            (self._data_r, "#d32f2f", 80, 200),
+            (self._data_g, "#388e3c", 80, 200),
+            (self._data_b, "#1976d2", 80, 200),
+        )
+        paths = []
+        for data, color_hex, alpha_fill, alpha_line in channels:
+            if len(data) < 2:
+                continue
 
-        for i, val in enumerate(data):
-            x = i * step
-            y = h - (val * h)
-            path.lineTo(x, y)
+            xs = np.arange(len(data), dtype=np.float32) * np.float32(w / (len(data) - 1))
+            ys = np.float32(h) - data * np.float32(h)
+            points = list(map(QPointF, xs.tolist(), ys.tolist()))
 
-        path.lineTo(w, h)
-        path.closeSubpath()
+            path_line = QPainterPath()
+            path_line.addPolygon(QPolygonF(points))
 
-        c_fill = QColor(color_hex)
-        c_fill.setAlpha(alpha_fill)
-        painter.setBrush(QBrush(c_fill))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(path)
+            path = QPainterPath()
+            path.addPolygon(QPolygonF([QPointF(0, h), *points, QPointF(w, h)]))
+            path.closeSubpath()
 
-        path_line = QPainterPath()
-        path_line.moveTo(0, h - (data[0] * h))
-        for i, val in enumerate(data):
-            x = i * step
-            y = h - (val * h)
-            path_line.lineTo(x, y)
+            c_fill = QColor(color_hex)
+            c_fill.setAlpha(alpha_fill)
+            c_line = QColor(color_hex)
+            c_line.setAlpha(alpha_line)
+            paths.append((path, path_line, QBrush(c_fill), QPen(c_line, 1.5)))
 
-        c_line = QColor(color_hex)
-        c_line.setAlpha(alpha_line)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.setPen(QPen(c_line, 1.5))
-        painter.drawPath(path_line)
+        return paths
 
 
 class PhotometricCurveWidget(QChartView):
@@ -177,34 +226,25 @@ class PhotometricCurveWidget(QChartView):
         self.setChart(self._chart)
         self.setMinimumHeight(40)
 
+        # Curve inputs of the last replot; other exposure fields (WB, etc.) don't change the shape
+        self._curve_key: Any = None
+
     def update_curve(self, params) -> None:
-        from negpy.features.exposure.logic import LogisticSigmoid
-        from negpy.features.exposure.models import EXPOSURE_CONSTANTS
-        from negpy.kernel.image.validation import ensure_image
-
-        master_ref = 1.0
-        exposure_shift = 0.1 + (params.density * EXPOSURE_CONSTANTS["density_multiplier"])
-        pivot = master_ref - exposure_shift
-        slope = 1.0 + (params.grade * EXPOSURE_CONSTANTS["grade_multiplier"])
-
-        curve = LogisticSigmoid(
-            contrast=slope,
-            pivot=pivot,
-            d_max=3.5,
-            toe=params.toe,
-            toe_width=params.toe_width,
-            toe_hardness=params.toe_hardness,
-            shoulder=params.shoulder,
-            shoulder_width=params.shoulder_width,
-            shoulder_hardness=params.shoulder_hardness,
+        key = (
+            params.density,
+            params.grade,
+            params.toe,
+            params.toe_width,
+            params.toe_hardness,
+            params.shoulder,
+            params.shoulder_width,
+            params.shoulder_hardness,
         )
+        if key == self._curve_key:
+            return
+        self._curve_key = key
 
-        plt_x = np.linspace(-0.1, 1.1, 50)
-        x_log_exp = 1.0 - plt_x
-
-        d = curve(ensure_image(x_log_exp))
-        t = np.power(10.0, -d)
-        y = np.power(t, 1.0 / 2.2)
+        y = _curve_samples(key)
 
-        points = [QPointF(px, py) for px, py in zip(plt_x, y)]
+        points = [QPointF(px, py) for px, py in zip(CURVE_SAMPLES_X.tolist(), y)]
         self.series.replace(points)
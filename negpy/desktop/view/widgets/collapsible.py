@@ -72,6 +72,9 @@ class CollapsibleSection(QWidget):
         """
         self.content_layout.addWidget(widget)
 
+    def is_expanded(self) -> bool:
+        return self.toggle_button.isChecked()
+
     def _on_toggle(self, checked: bool) -> None:
         self.content_area.setVisible(checked)
         self.toggle_button.setText(self._title_text)
@@ -1,3 +1,6 @@
+import time
+from typing import Optional
+
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -10,6 +13,10 @@ from PyQt6.QtGui import QPainter, QColor, QPen
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QRect
 from negpy.desktop.view.styles.theme import THEME
 
+# Trailing debounce for slider edits, plus a ceiling so a continuous drag still previews periodically
+SLIDER_DEBOUNCE_MS = 100
+SLIDER_MAX_WAIT_MS = 250
+
 
 class BaseSlider(QWidget):
     """
@@ -24,6 +31,7 @@ class BaseSlider(QWidget):
         max_val: float,
         default_val: float,
         precision: int = 100,
+        live: bool = True,
         parent=None,
     ):
         super().__init__(parent)
@@ -31,10 +39,12 @@ class BaseSlider(QWidget):
         self._max = max_val
         self._default = default_val
         self._precision = precision
+        # Non-live sliders hold drag updates until the handle is released
+        self._live = live
 
         self.slider = QSlider(Qt.Orientation.Horizontal)
-        self.slider.setRange(int(min_val * self._precision), int(max_val * self._precision))
-        self.slider.setValue(int(default_val * self._precision))
+        self.slider.setRange(self._to_ticks(min_val), self._to_ticks(max_val))
+        self.slider.setValue(self._to_ticks(default_val))
 
         self.spin = QDoubleSpinBox()
         self.spin.setRange(min_val, max_val)
@@ -43,12 +53,17 @@ class BaseSlider(QWidget):
         # Debounce timer
         self.timer = QTimer()
         self.timer.setSingleShot(True)
-        self.timer.setInterval(100)
+        self.timer.setInterval(SLIDER_DEBOUNCE_MS)
+        # Time of the oldest edit not yet emitted
+        self._pending_since: Optional[float] = None
+        # Value the rest of the app already has; drags that settle back on it emit nothing
+        self._committed: float = self.spin.value()
 
         self._connect_base_signals()
 
     def _connect_base_signals(self) -> None:
         self.slider.valueChanged.connect(self._on_slider_changed)
+        self.slider.sliderReleased.connect(self._on_slider_released)
         self.spin.valueChanged.connect(self._on_spin_changed)
         self.timer.timeout.connect(self._emit_value)
 
@@ -57,24 +72,66 @@ class BaseSlider(QWidget):
         self.spin.blockSignals(True)
         self.spin.setValue(f_val)
         self.spin.blockSignals(False)
-        self.timer.start()
+        self._schedule_emit()
+
+    def _on_slider_released(self) -> None:
+        """
+        The drag is over, so the final value goes out now instead of after the trailing debounce.
+        """
+        self._emit_value()
+
+    def _to_ticks(self, value: float) -> int:
+        """
+        Slider position for a value, rounded so e.g. 0.29 does not land on tick 28.
+        """
+        return int(round(value * self._precision))
 
     def _on_spin_changed(self, value: float) -> None:
         self.slider.blockSignals(True)
-        self.slider.setValue(int(value * self._precision))
+        self.slider.setValue(self._to_ticks(value))
         self.slider.blockSignals(False)
+        self._schedule_emit()
+
+    def _schedule_emit(self) -> None:
+        """
+        Restarts the debounce, but emits right away once edits have been pending for SLIDER_MAX_WAIT_MS.
+        Non-live sliders skip this while dragged; release emits instead.
+        """
+        if not self._live and self.slider.isSliderDown():
+            return
+        now = time.monotonic()
+        if self._pending_since is None:
+            self._pending_since = now
+        elif (now - self._pending_since) * 1000.0 >= SLIDER_MAX_WAIT_MS:
+            self._emit_value()
+            return
         self.timer.start()
 
-    def _emit_value(self) -> None:
-        self.valueChanged.emit(self.spin.value())
+    def _emit_value(self, force: bool = False) -> None:
+        self.timer.stop()
+        self._pending_since = None
+        value = self.spin.value()
+        if value == self._committed and not force:
+            return
+        self._committed = value
+        self.valueChanged.emit(value)
 
     def setValue(self, value: float) -> None:
+        """
+        Programmatic sync; the widgets are only touched when the clamped value differs from what they show.
+        """
+        if value < self._min or value > self._max:
+            value = self._min if value < self._min else self._max
+        if self.spin.value() == round(value, self.spin.decimals()) and self.slider.value() == self._to_ticks(value):
+            self._committed = self.spin.value()
+            return
         self.slider.blockSignals(True)
         self.spin.blockSignals(True)
-        self.slider.setValue(int(value * self._precision))
+        self.slider.setValue(self._to_ticks(value))
         self.spin.setValue(value)
         self.slider.blockSignals(False)
         self.spin.blockSignals(False)
+        self._committed = self.spin.value()
 
     def value(self) -> float:
         return self.spin.value()
@@ -82,7 +139,7 @@ class BaseSlider(QWidget):
     def mouseDoubleClickEvent(self, event) -> None:
         """Resets to default value."""
         self.setValue(self._default)
-        self._emit_value()
+        self._emit_value(force=True)
 
 
 class SignalSlider(BaseSlider):
@@ -99,9 +156,10 @@ class SignalSlider(BaseSlider):
         step: float = 0.01,
         precision: int = 100,
         color: str = None,
+        live: bool = True,
         parent=None,
     ):
-        super().__init__(min_val, max_val, default_val, precision=precision, parent=parent)
+        super().__init__(min_val, max_val, default_val, precision=precision, live=live, parent=parent)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -156,9 +214,10 @@ class CompactSlider(BaseSlider):
         step: float = 0.01,
         precision: int = 100,
         color: str = None,
+        live: bool = True,
         parent=None,
     ):
-        super().__init__(min_val, max_val, default_val, precision=precision, parent=parent)
+        super().__init__(min_val, max_val, default_val, precision=precision, live=live, parent=parent)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(2, 2, 2, 2)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from negpy.domain.models import WorkspaceConfig
@@ -49,6 +49,8 @@ class AssetDiscoveryTask:
 
     paths: list[str]
     supported_extensions: tuple[str, ...]
+    # Paths already in the session; re-adding a folder skips reading and hashing them again
+    known_paths: frozenset[str] = frozenset()
 
 
 class RenderWorker(QObject):
@@ -81,10 +83,8 @@ class RenderWorker(QObject):
     def process(self, task: RenderTask) -> None:
         """Executes the rendering pipeline for a single frame."""
         try:
-            img_src = task.buffer.copy()
-
             result, metrics = self._processor.run_pipeline(
-                img_src,
+                task.buffer,
                 task.config,
                 task.source_hash,
                 render_size_ref=task.preview_size,
@@ -97,6 +97,8 @@ class RenderWorker(QObject):
             if task.icc_profile_path and isinstance(result, GPUTexture):
                 result = result.readback()
 
+            # 8-bit soft proof, kept so the canvas can skip re-quantizing the float copy
+            display_u8: Optional[np.ndarray] = None
             if task.icc_profile_path and isinstance(result, np.ndarray):
                 pil_img = self._processor.buffer_to_pil(result, task.config)
                 pil_proof, _ = self._processor._apply_color_management(
@@ -104,12 +106,17 @@ class RenderWorker(QObject):
                     task.color_space,
                     task.icc_profile_path,
                     task.icc_invert,
+                    embed_icc=False,
                 )
-                arr = np.array(pil_proof)
-                result = arr.astype(np.float32) / (65535.0 if arr.dtype == np.uint16 else 255.0)
+                arr = np.asarray(pil_proof)
+                if arr.dtype == np.uint8:
+                    display_u8 = arr
+                # Scale straight into float32; astype + divide would allocate two full-size buffers
+                result = np.multiply(arr, 1.0 / (65535.0 if arr.dtype == np.uint16 else 255.0), dtype=np.float32)
 
             # Ensure ground truth is stored in metrics for view consumption
             metrics["base_positive"] = result
+            metrics["base_positive_u8"] = display_u8
 
             self.finished.emit(result, metrics)
             self.metrics_updated.emit(metrics)
@@ -126,9 +133,11 @@ class ThumbnailWorker(QObject):
     progress = pyqtSignal(int, int, str)
     finished = pyqtSignal(dict)
 
-    def __init__(self, asset_store) -> None:
+    def __init__(self, asset_store: Any) -> None:
         super().__init__()
         self._store = asset_store
+        # Event loop (and its default thread pool) reused across batches; created on the worker thread
+        self._loop: Any = None
 
     @pyqtSlot(list)
     def generate(self, files: list) -> None:
@@ -141,12 +150,13 @@ class ThumbnailWorker(QObject):
         try:
             total = len(files)
 
-            async def _progress_callback(current: int, name: str):
+            async def _progress_callback(current: int, name: str) -> None:
                 self.progress.emit(current, total, name)
 
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            new_thumbs = loop.run_until_complete(
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(self._loop)
+            new_thumbs = self._loop.run_until_complete(
                 thumb_service.generate_batch_thumbnails(files, self._store, progress_callback=_progress_callback)
             )
             self.finished.emit(new_thumbs)
@@ -159,13 +169,19 @@ class ThumbnailWorker(QObject):
         from negpy.services.assets.thumbnails import get_rendered_thumbnail
 
         try:
-            buf = task.buffer.copy()
-            thumb = get_rendered_thumbnail(buf, task.file_hash, self._store)
+            thumb = get_rendered_thumbnail(task.buffer, task.file_hash, self._store)
             if thumb:
                 self.finished.emit({task.filename: thumb})
         except Exception as e:
             logger.error(f"Thumbnail update failure: {e}")
 
+    def close(self) -> None:
+        """Stops the pooled threads; call once the worker thread has finished."""
+        if self._loop is not None:
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+            self._loop = None
+
 
 class AssetDiscoveryWorker(QObject):
     """
@@ -184,19 +200,19 @@ class AssetDiscoveryWorker(QObject):
         import os
         from negpy.kernel.image.logic import calculate_file_hash
 
-        discovered_paths = []
+        discovered_paths: list[str] = []
         for path in task.paths:
             try:
                 if os.path.isdir(path):
-                    for f in os.listdir(path):
-                        if f.lower().endswith(task.supported_extensions):
-                            discovered_paths.append(os.path.join(path, f))
+                    with os.scandir(path) as entries:
+                        discovered_paths.extend(e.path for e in entries if e.name.lower().endswith(task.supported_extensions))
                 else:
                     if path.lower().endswith(task.supported_extensions):
                         discovered_paths.append(path)
             except Exception as e:
                 logger.error(f"Discovery error for {path}: {e}")
 
+        discovered_paths = [p for p in discovered_paths if p not in task.known_paths]
         total = len(discovered_paths)
         valid_assets = []
 
@@ -224,10 +240,12 @@ class NormalizationWorker(QObject):
     finished = pyqtSignal(tuple, tuple)
     error = pyqtSignal(str)
 
-    def __init__(self, preview_service, repo) -> None:
+    def __init__(self, preview_service: Any, repo: Any) -> None:
         super().__init__()
         self._preview_service = preview_service
         self._repo = repo
+        # Per-file bounds keyed by hash and every input of the analysis; re-analyzing a roll skips known frames
+        self._bounds_cache: Dict[Tuple[Any, ...], Any] = {}
 
     @pyqtSlot(NormalizationTask)
     def process(self, task: NormalizationTask) -> None:
@@ -248,18 +266,22 @@ class NormalizationWorker(QObject):
                 process_mode = params.process.process_mode if params else DEFAULT_WORKSPACE_CONFIG.process.process_mode
                 e6_normalize = params.process.e6_normalize if params else DEFAULT_WORKSPACE_CONFIG.process.e6_normalize
 
-                raw, _, _ = self._preview_service.load_linear_preview(
-                    f_info["path"],
-                    task.workspace_color_space,
-                    use_camera_wb=use_camera_wb,
-                )
-
-                bounds = analyze_log_exposure_bounds(
-                    raw,
-                    analysis_buffer=analysis_buffer,
-                    process_mode=process_mode,
-                    e6_normalize=e6_normalize,
-                )
+                key = (f_info["hash"], task.workspace_color_space, use_camera_wb, analysis_buffer, process_mode, e6_normalize)
+                bounds = self._bounds_cache.get(key)
+                if bounds is None:
+                    raw, _, _ = self._preview_service.load_linear_preview(
+                        f_info["path"],
+                        task.workspace_color_space,
+                        use_camera_wb=use_camera_wb,
+                    )
+
+                    bounds = analyze_log_exposure_bounds(
+                        raw,
+                        analysis_buffer=analysis_buffer,
+                        process_mode=process_mode,
+                        e6_normalize=e6_normalize,
+                    )
+                    self._bounds_cache[key] = bounds
                 all_floors.append(bounds.floors)
                 all_ceils.append(bounds.ceils)
 
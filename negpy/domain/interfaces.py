@@ -5,6 +5,7 @@ from typing import (
     Tuple,
     ContextManager,
     List,
+    Dict,
 )
 from dataclasses import dataclass, field
 from negpy.domain.types import ImageBuffer, ROI, Dimensions
@@ -39,10 +40,16 @@ class IRepository(Protocol):
 
     def save_file_settings(self, file_hash: str, settings: WorkspaceConfig) -> None: ...
 
+    def save_file_settings_batch(self, items: List[Tuple[str, WorkspaceConfig]]) -> None: ...
+
     def load_file_settings(self, file_hash: str) -> Optional[WorkspaceConfig]: ...
 
+    def load_file_settings_batch(self, file_hashes: List[str]) -> Dict[str, WorkspaceConfig]: ...
+
     def save_global_setting(self, key: str, value: Any) -> None: ...
+    def save_global_settings(self, values: Dict[str, Any]) -> None: ...
     def get_global_setting(self, key: str, default: Any = None) -> Any: ...
+    def get_global_settings(self, keys: List[str]) -> Dict[str, Any]: ...
     def initialize(self) -> None: ...
 
 
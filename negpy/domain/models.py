@@ -26,6 +26,12 @@ class AspectRatio(StrEnum):
     R_24_65 = "24:65"
 
 
+# Width / height of every fixed "W:H" ratio, parsed once instead of on each layout pass or drag event
+ASPECT_RATIO_VALUES: Dict[str, float] = {
+    r.value: float(r.value.split(":")[0]) / float(r.value.split(":")[1]) for r in AspectRatio if ":" in r.value
+}
+
+
 class ExportFormat(StrEnum):
     JPEG = "JPEG"
     TIFF = "TIFF"
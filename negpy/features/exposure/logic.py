@@ -1,7 +1,9 @@
+import math
 import numpy as np
 from numba import njit, prange  # type: ignore
 from typing import Tuple, Any
-from negpy.domain.types import ImageBuffer
+from negpy.domain.types import ImageBuffer, LUMA_R, LUMA_G, LUMA_B
+from negpy.features.exposure.models import EXPOSURE_CONSTANTS
 from negpy.kernel.image.validation import ensure_image
 
 
@@ -43,10 +45,12 @@ def _apply_photometric_fused_kernel(
     """
     Fused JIT kernel for H&D curve application.
     Maps log-exposure to optical density (D) in a single pass.
+    In B&W mode (1) each pixel's Rec. 709 luminance is written to all three channels.
     """
     h, w, c = img.shape
     res = np.empty_like(img)
-    inv_gamma = 1.0 / gamma
+    # (10 ** -D) ** (1 / gamma) folded into a single exp
+    density_to_display = -math.log(10.0) / gamma
 
     for y in prange(h):
         for x in range(w):
@@ -74,8 +78,7 @@ def _apply_photometric_fused_kernel(
                 slope = slopes[ch]
                 density = d_max * _fast_sigmoid(float(slope) * diff * k_mod)
 
-                transmittance = 10.0 ** (-density)
-                final_val = transmittance**inv_gamma
+                final_val = np.exp(density * density_to_display)
 
                 if final_val < 0.0:
                     final_val = 0.0
@@ -83,6 +86,12 @@ def _apply_photometric_fused_kernel(
                     final_val = 1.0
 
                 res[y, x, ch] = final_val
+
+            if mode == 1:
+                lum = LUMA_R * res[y, x, 0] + LUMA_G * res[y, x, 1] + LUMA_B * res[y, x, 2]
+                res[y, x, 0] = lum
+                res[y, x, 1] = lum
+                res[y, x, 2] = lum
     return res
 
 
@@ -150,13 +159,14 @@ def apply_characteristic_curve(
 ) -> ImageBuffer:
     """
     Applies a film/paper characteristic curve (Sigmoid) per channel in Log-Density space.
+    mode=1 (B&W) returns the luminance replicated across channels.
     """
     pivots = np.ascontiguousarray(np.array([params_r[0], params_g[0], params_b[0]], dtype=np.float32))
     slopes = np.ascontiguousarray(np.array([params_r[1], params_g[1], params_b[1]], dtype=np.float32))
     offsets = np.ascontiguousarray(np.array(cmy_offsets, dtype=np.float32))
 
     res = _apply_photometric_fused_kernel(
-        np.ascontiguousarray(img.astype(np.float32)),
+        np.ascontiguousarray(img, dtype=np.float32),
         pivots,
         slopes,
         float(toe),
@@ -176,8 +186,6 @@ def cmy_to_density(val: float, log_range: float = 1.0) -> float:
     """
     Converts a CMY slider value (-1.0..1.0) to a physical density shift (D).
     """
-    from negpy.features.exposure.models import EXPOSURE_CONSTANTS
-
     absolute_density = val * EXPOSURE_CONSTANTS["cmy_max_density"]
     return float(absolute_density / max(log_range, 1e-6))
 
@@ -186,8 +194,6 @@ def density_to_cmy(density: float, log_range: float = 1.0) -> float:
     """
     Converts a physical density shift (D) back to a normalized CMY slider value.
     """
-    from negpy.features.exposure.models import EXPOSURE_CONSTANTS
-
     absolute_density = density * log_range
     return float(absolute_density / EXPOSURE_CONSTANTS["cmy_max_density"])
 
@@ -196,9 +202,9 @@ def calculate_wb_shifts(sampled_rgb: np.ndarray) -> Tuple[float, float]:
     """
     Calculates Magenta and Yellow shifts to neutralize sampled color in positive space.
     """
-    r, g, b = np.clip(sampled_rgb, 1e-6, 1.0)
-    d_m = np.log10(g) - np.log10(r)
-    d_y = np.log10(b) - np.log10(r)
+    r, g, b = (min(max(float(c), 1e-6), 1.0) for c in sampled_rgb[:3])
+    d_m = math.log10(g) - math.log10(r)
+    d_y = math.log10(b) - math.log10(r)
  
     shift_m = density_to_cmy(d_m)
     shift_y = density_to_cmy(d_y)
@@ -210,7 +216,7 @@ def calculate_wb_shifts_from_log(sampled_log_rgb: np.ndarray) -> Tuple[float, fl
     """
     Calculates Magenta and Yellow shifts from data in Negative Log-Density space.
     """
-    r, g, b = sampled_log_rgb[:3]
+    r, g, b = (float(c) for c in sampled_log_rgb[:3])
     d_m = r - g
     d_y = r - b
  
@@ -1,3 +1,4 @@
+import math
 from typing import Tuple, Optional
 import numpy as np
 from numba import njit, prange  # type: ignore
@@ -39,6 +40,23 @@ def _normalize_log_image_jit(img_log: np.ndarray, floors: np.ndarray, ceils: np.
     return res
 
 
+@njit(parallel=True, cache=True, fastmath=True)
+def _log_density_planes_jit(img: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Linear -> log10, clipped to [epsilon, 1], written as contiguous per-channel planes for percentile analysis.
+    """
+    h, w, _ = img.shape
+    res = np.empty((3, h, w), dtype=np.float32)
+    lo = np.float32(epsilon)
+    inv_ln10 = np.float32(1.0 / math.log(10.0))
+    for y in prange(h):
+        for ch in range(3):
+            for x in range(w):
+                v = min(max(img[y, x, ch], lo), np.float32(1.0))
+                res[ch, y, x] = np.log(v) * inv_ln10
+    return res
+
+
 class LogNegativeBounds:
     """
     D-min / D-max container.
@@ -73,7 +91,7 @@ def normalize_log_image(img_log: ImageBuffer, bounds: LogNegativeBounds) -> Imag
     floors = np.ascontiguousarray(np.array(bounds.floors, dtype=np.float32))
     ceils = np.ascontiguousarray(np.array(bounds.ceils, dtype=np.float32))
 
-    return ensure_image(_normalize_log_image_jit(np.ascontiguousarray(img_log.astype(np.float32)), floors, ceils))
+    return ensure_image(_normalize_log_image_jit(np.ascontiguousarray(img_log, dtype=np.float32), floors, ceils))
 
 
 def analyze_log_exposure_bounds(
@@ -87,15 +105,41 @@ def analyze_log_exposure_bounds(
     Performs full analysis pass on a linear image to find density floors/ceils.
     """
     epsilon = 1e-6
-    img_log = np.log10(np.clip(image, epsilon, 1.0))
+    # Crop before the log pass so excluded borders are never transformed
+    image = _analysis_region(image, roi, analysis_buffer)
+    planes = _log_density_planes_jit(np.asarray(image, dtype=np.float32), epsilon)
+    return _bounds_from_planes(planes, process_mode, e6_normalize)
+
 
+def analyze_log_density_bounds(
+    img_log: ImageBuffer,
+    roi: Optional[tuple[int, int, int, int]] = None,
+    analysis_buffer: float = 0.0,
+    process_mode: str = ProcessMode.C41,
+    e6_normalize: bool = True,
+) -> LogNegativeBounds:
+    """
+    Same analysis as analyze_log_exposure_bounds, for callers already holding the log10 image.
+    """
+    region = _analysis_region(img_log, roi, analysis_buffer)
+    planes = np.ascontiguousarray(np.moveaxis(region, -1, 0), dtype=np.float32)
+    return _bounds_from_planes(planes, process_mode, e6_normalize)
+
+
+def _analysis_region(img: ImageBuffer, roi: Optional[tuple[int, int, int, int]], analysis_buffer: float) -> ImageBuffer:
     if roi:
         y1, y2, x1, x2 = roi
-        img_log = img_log[y1:y2, x1:x2]
+        img = img[y1:y2, x1:x2]
 
     if analysis_buffer > 0:
-        img_log = get_analysis_crop(img_log, analysis_buffer)
+        img = get_analysis_crop(img, analysis_buffer)
+    return img
+
 
+def _bounds_from_planes(planes: np.ndarray, process_mode: str, e6_normalize: bool) -> LogNegativeBounds:
+    """
+    Per-channel percentile floors/ceils from (3, H, W) log-density planes.
+    """
     p_low, p_high = 0.5, 99.5
     fixed_range = 3.0
 
@@ -106,14 +150,15 @@ def analyze_log_exposure_bounds(
     floors = []
     ceils = []
     for ch in range(3):
-        data = img_log[:, :, ch]
-        f = np.percentile(data, p_low)
-        floors.append(float(f))
-
+        data = planes[ch]
         if process_mode != ProcessMode.E6 or e6_normalize:
-            c = np.percentile(data, p_high)
+            # One partition pass for both percentiles
+            f, c = np.percentile(data, [p_low, p_high])
+            floors.append(float(f))
             ceils.append(float(c))
         else:
+            f = np.percentile(data, p_low)
+            floors.append(float(f))
             ceils.append(float(f + fixed_range))
 
     return LogNegativeBounds(
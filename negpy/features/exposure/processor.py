@@ -4,10 +4,9 @@ from negpy.domain.types import ImageBuffer
 from negpy.features.exposure.models import ExposureConfig, EXPOSURE_CONSTANTS
 from negpy.features.process.models import ProcessConfig, ProcessMode
 from negpy.features.exposure.logic import apply_characteristic_curve
-from negpy.kernel.image.logic import get_luminance
 from negpy.features.exposure.normalization import (
     normalize_log_image,
-    analyze_log_exposure_bounds,
+    analyze_log_density_bounds,
     LogNegativeBounds,
 )
 
@@ -42,8 +41,9 @@ class NormalizationProcessor:
             if not needs_reanalysis:
                 bounds = context.metrics["log_bounds"]
             else:
-                bounds = analyze_log_exposure_bounds(
-                    image,
+                # Reuse the log pass above rather than redoing it inside the analysis
+                bounds = analyze_log_density_bounds(
+                    img_log,
                     context.active_roi,
                     self.config.analysis_buffer,
                     process_mode=context.process_mode,
@@ -102,9 +102,4 @@ class PhotometricProcessor:
             mode=mode_val,
         )
 
-        if context.process_mode == ProcessMode.BW:
-            res = get_luminance(img_pos)
-            res = np.stack([res, res, res], axis=-1)
-            return res
-
         return img_pos
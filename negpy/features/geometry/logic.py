@@ -2,6 +2,7 @@ import numpy as np
 import cv2
 from typing import Tuple, Optional
 from negpy.domain.types import ImageBuffer, ROI
+from negpy.domain.models import ASPECT_RATIO_VALUES
 from negpy.kernel.image.validation import ensure_image
 from negpy.kernel.image.logic import get_luminance
 
@@ -28,7 +29,7 @@ def apply_fine_rotation(img: ImageBuffer, angle: float) -> ImageBuffer:
 
 
 def apply_margin_to_roi(
-    roi: ROI,
+    roi: Tuple[float, float, float, float],
     h: int,
     w: int,
     margin_px: float,
@@ -59,11 +60,7 @@ def enforce_roi_aspect_ratio(
     if target_ratio_str == "Free":
         return int(max(0, y1)), int(min(h, y2)), int(max(0, x1)), int(min(w, x2))
 
-    try:
-        w_r, h_r = map(float, target_ratio_str.split(":"))
-        target_aspect = w_r / h_r
-    except Exception:
-        target_aspect = 1.5
+    target_aspect = ASPECT_RATIO_VALUES.get(target_ratio_str, 1.5)
 
     is_vertical = ch > cw
     if is_vertical:
@@ -151,92 +148,159 @@ def get_manual_crop_coords(
     return apply_margin_to_roi(roi, h, w, margin)
 
 
-def get_autocrop_coords(
+def detect_film_borders(
     img: ImageBuffer,
-    offset_px: int = 0,
-    scale_factor: float = 1.0,
-    target_ratio_str: str = "3:2",
     detect_res: int = 1800,
-    assist_point: Optional[Tuple[float, float]] = None,
     assist_luma: Optional[float] = None,
-) -> ROI:
+) -> Optional[Tuple[float, float, float, float]]:
     """
-    Detects film border via density thresholding.
+    Finds the exposed frame via density thresholding. Returns (y1, y2, x1, x2) in image pixels, or None.
     """
     h, w = img.shape[:2]
     det_scale = detect_res / max(h, w)
 
     d_h, d_w = int(h * det_scale), int(w * det_scale)
-    img_small = cv2.resize(img, (d_w, d_h), interpolation=cv2.INTER_AREA)
+    # Only row/column means are thresholded below, so bilinear is plenty and far cheaper than INTER_AREA on float32.
+    img_small = cv2.resize(img, (d_w, d_h), interpolation=cv2.INTER_LINEAR)
 
     lum = get_luminance(ensure_image(img_small))
 
     threshold = 0.96
     if assist_luma is not None:
-        threshold = float(np.clip(assist_luma - 0.02, 0.5, 0.98))
+        threshold = min(max(float(assist_luma) - 0.02, 0.5), 0.98)
 
     rows_det = np.where(np.mean(lum, axis=1) < threshold)[0]
     cols_det = np.where(np.mean(lum, axis=0) < threshold)[0]
 
     if len(rows_det) < 10 or len(cols_det) < 10:
-        return 0, h, 0, w
+        return None
+
+    return (
+        rows_det[0] / det_scale,
+        rows_det[-1] / det_scale,
+        cols_det[0] / det_scale,
+        cols_det[-1] / det_scale,
+    )
 
-    y1, y2 = rows_det[0] / det_scale, rows_det[-1] / det_scale
-    x1, x2 = cols_det[0] / det_scale, cols_det[-1] / det_scale
+
+def finalize_autocrop_roi(
+    borders: Optional[Tuple[float, float, float, float]],
+    h: int,
+    w: int,
+    offset_px: int = 0,
+    scale_factor: float = 1.0,
+    target_ratio_str: str = "3:2",
+) -> ROI:
+    """
+    Applies offset margin and aspect ratio to detected borders.
+    """
+    if borders is None:
+        return 0, h, 0, w
 
     margin = (2 + offset_px) * scale_factor
-    roi = (y1, y2, x1, x2)
-    roi = apply_margin_to_roi(roi, h, w, margin)
+    roi = apply_margin_to_roi(borders, h, w, margin)
 
     return enforce_roi_aspect_ratio(roi, h, w, target_ratio_str)
 
 
-def map_coords_to_geometry(
-    nx: float,
-    ny: float,
+def get_autocrop_coords(
+    img: ImageBuffer,
+    offset_px: int = 0,
+    scale_factor: float = 1.0,
+    target_ratio_str: str = "3:2",
+    detect_res: int = 1800,
+    assist_point: Optional[Tuple[float, float]] = None,
+    assist_luma: Optional[float] = None,
+) -> ROI:
+    """
+    Detects film border via density thresholding.
+    """
+    h, w = img.shape[:2]
+    borders = detect_film_borders(img, detect_res=detect_res, assist_luma=assist_luma)
+    return finalize_autocrop_roi(borders, h, w, offset_px, scale_factor, target_ratio_str)
+
+
+def get_geometry_matrix(
     orig_shape: Tuple[int, int],
     rotation_k: int = 0,
     fine_rotation: float = 0.0,
     flip_horizontal: bool = False,
     flip_vertical: bool = False,
     roi: Optional[ROI] = None,
-) -> Tuple[float, float]:
+) -> np.ndarray:
     """
-    Maps raw coordinates to geometry-transformed space.
+    Composes rot90 -> flips -> fine rotation -> crop into a single 3x3 matrix (raw 0-1 -> transformed 0-1).
     """
     h_orig, w_orig = orig_shape
-    px, py = nx * w_orig, ny * h_orig
     h, w = h_orig, w_orig
+    mat = np.diag([float(w_orig), float(h_orig), 1.0])
 
     k = rotation_k % 4
     if k == 1:
-        px, py = py, w - px
+        mat = np.array([[0.0, 1.0, 0.0], [-1.0, 0.0, w], [0.0, 0.0, 1.0]]) @ mat
         h, w = w, h
     elif k == 2:
-        px, py = w - px, h - py
+        mat = np.array([[-1.0, 0.0, w], [0.0, -1.0, h], [0.0, 0.0, 1.0]]) @ mat
     elif k == 3:
-        px, py = h - py, px
+        mat = np.array([[0.0, -1.0, h], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]) @ mat
         h, w = w, h
 
     if flip_horizontal:
-        px = w - px
+        mat = np.array([[-1.0, 0.0, w], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]) @ mat
     if flip_vertical:
-        py = h - py
+        mat = np.array([[1.0, 0.0, 0.0], [0.0, -1.0, h], [0.0, 0.0, 1.0]]) @ mat
 
     if fine_rotation != 0.0:
-        center = (w / 2.0, h / 2.0)
-        m_mat = cv2.getRotationMatrix2D(center, fine_rotation, 1.0)
-        pt = np.array([px, py, 1.0])
-        res_pt = m_mat @ pt
-        px, py = float(res_pt[0]), float(res_pt[1])
+        m_mat = cv2.getRotationMatrix2D((w / 2.0, h / 2.0), fine_rotation, 1.0)
+        mat = np.vstack([m_mat, [0.0, 0.0, 1.0]]) @ mat
 
     if roi:
         y1, y2, x1, x2 = roi
-        px -= x1
-        py -= y1
+        mat = np.array([[1.0, 0.0, -x1], [0.0, 1.0, -y1], [0.0, 0.0, 1.0]]) @ mat
         h, w = y2 - y1, x2 - x1
 
-    nx_new = np.clip(px / max(w, 1), 0.0, 1.0)
-    ny_new = np.clip(py / max(h, 1), 0.0, 1.0)
+    res: np.ndarray = np.diag([1.0 / max(w, 1), 1.0 / max(h, 1), 1.0]) @ mat
+    return res
+
 
-    return float(nx_new), float(ny_new)
+def map_points_to_geometry(
+    points: np.ndarray,
+    orig_shape: Tuple[int, int],
+    rotation_k: int = 0,
+    fine_rotation: float = 0.0,
+    flip_horizontal: bool = False,
+    flip_vertical: bool = False,
+    roi: Optional[ROI] = None,
+) -> np.ndarray:
+    """
+    Maps (N, 2) raw coordinates to geometry-transformed space in one pass.
+    """
+    mat = get_geometry_matrix(orig_shape, rotation_k, fine_rotation, flip_horizontal, flip_vertical, roi)
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    mapped: np.ndarray = np.clip(pts @ mat[:2, :2].T + mat[:2, 2], 0.0, 1.0)
+    return mapped
+
+
+def map_coords_to_geometry(
+    nx: float,
+    ny: float,
+    orig_shape: Tuple[int, int],
+    rotation_k: int = 0,
+    fine_rotation: float = 0.0,
+    flip_horizontal: bool = False,
+    flip_vertical: bool = False,
+    roi: Optional[ROI] = None,
+) -> Tuple[float, float]:
+    """
+    Maps raw coordinates to geometry-transformed space.
+    """
+    mapped = map_points_to_geometry(
+        np.array([nx, ny]),
+        orig_shape,
+        rotation_k,
+        fine_rotation,
+        flip_horizontal,
+        flip_vertical,
+        roi,
+    )
+    return float(mapped[0, 0]), float(mapped[0, 1])
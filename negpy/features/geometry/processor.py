@@ -1,12 +1,15 @@
+from typing import Optional, Tuple
 import numpy as np
 from negpy.domain.interfaces import PipelineContext
 from negpy.domain.types import ImageBuffer
 from negpy.features.geometry.models import GeometryConfig
 from negpy.features.geometry.logic import (
     apply_fine_rotation,
-    get_autocrop_coords,
+    detect_film_borders,
+    finalize_autocrop_roi,
     get_manual_rect_coords,
 )
+from negpy.kernel.caching.manager import PipelineCache
 
 
 class GeometryProcessor:
@@ -14,8 +17,9 @@ class GeometryProcessor:
     Rotates and detects crop.
     """
 
-    def __init__(self, config: GeometryConfig):
+    def __init__(self, config: GeometryConfig, cache: Optional[PipelineCache] = None):
         self.config = config
+        self.cache = cache
 
     def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
         orig_shape = (image.shape[0], image.shape[1])
@@ -25,10 +29,13 @@ class GeometryProcessor:
             img = np.rot90(img, k=self.config.rotation)
 
         if self.config.flip_horizontal:
-            img = np.ascontiguousarray(np.fliplr(img))
+            img = np.fliplr(img)
 
         if self.config.flip_vertical:
-            img = np.ascontiguousarray(np.flipud(img))
+            img = np.flipud(img)
+
+        if self.config.flip_horizontal or self.config.flip_vertical:
+            img = np.ascontiguousarray(img)
 
         if self.config.fine_rotation != 0.0:
             img = apply_fine_rotation(img, self.config.fine_rotation)
@@ -54,8 +61,11 @@ class GeometryProcessor:
             )
             context.active_roi = roi
         else:
-            roi = get_autocrop_coords(
-                img,
+            h, w = img.shape[:2]
+            roi = finalize_autocrop_roi(
+                self._detect_borders(img, orig_shape),
+                h,
+                w,
                 offset_px=self.config.autocrop_offset,
                 scale_factor=context.scale_factor,
                 target_ratio_str=self.config.autocrop_ratio,
@@ -65,6 +75,25 @@ class GeometryProcessor:
         context.metrics["active_roi"] = context.active_roi
         return img
 
+    def _detect_borders(self, img: ImageBuffer, orig_shape: tuple) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Film border detection, reused while only offset or ratio change.
+        """
+        key = (
+            orig_shape,
+            self.config.rotation,
+            self.config.fine_rotation,
+            self.config.flip_horizontal,
+            self.config.flip_vertical,
+        )
+        if self.cache is not None and self.cache.autocrop is not None and self.cache.autocrop[0] == key:
+            return self.cache.autocrop[1]
+
+        borders = detect_film_borders(img)
+        if self.cache is not None:
+            self.cache.autocrop = (key, borders)
+        return borders
+
 
 class CropProcessor:
     """
@@ -40,8 +40,8 @@ def apply_spectral_crosstalk(img_dens: ImageBuffer, strength: float, matrix: Opt
     applied_matrix = applied_matrix / np.maximum(row_sums, 1e-6)
 
     res = _apply_spectral_crosstalk_jit(
-        np.ascontiguousarray(img_dens.astype(np.float32)),
-        np.ascontiguousarray(applied_matrix.astype(np.float32)),
+        np.ascontiguousarray(img_dens, dtype=np.float32),
+        np.ascontiguousarray(applied_matrix, dtype=np.float32),
     )
 
     return ensure_image(res)
@@ -127,6 +127,33 @@ def apply_output_sharpening(img: ImageBuffer, amount: float, scale_factor: float
     return ensure_image(np.clip(res_rgb, 0.0, 1.0))
 
 
+@njit(parallel=True, cache=True, fastmath=True)
+def _apply_saturation_jit(img: np.ndarray, saturation: float) -> np.ndarray:
+    """
+    HSV saturation scale at constant hue/value, single pass.
+    """
+    h, w, c = img.shape
+    res = np.empty((h, w, c), dtype=np.float32)
+    for y in prange(h):
+        for x in range(w):
+            r = img[y, x, 0]
+            g = img[y, x, 1]
+            b = img[y, x, 2]
+            v = max(r, g, b)
+            m = min(r, g, b)
+
+            k = 1.0
+            if v != 0.0 and v != m:
+                s = (v - m) / v
+                s_new = min(max(s * saturation, 0.0), 1.0)
+                k = s_new / s
+
+            for ch in range(3):
+                val = v - (v - img[y, x, ch]) * k
+                res[y, x, ch] = min(max(val, 0.0), 1.0)
+    return res
+
+
 def apply_saturation(img: ImageBuffer, saturation: float) -> ImageBuffer:
     """
     Adjusts saturation via HSV space.
@@ -134,9 +161,4 @@ def apply_saturation(img: ImageBuffer, saturation: float) -> ImageBuffer:
     if saturation == 1.0:
         return img
 
-    hsv = cv2.cvtColor(img.astype(np.float32), cv2.COLOR_RGB2HSV)
-    hsv[:, :, 1] = hsv[:, :, 1] * saturation
-    hsv[:, :, 1] = np.clip(hsv[:, :, 1], 0.0, 1.0)
-
-    res = cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB)
-    return ensure_image(np.clip(res, 0.0, 1.0))
+    return ensure_image(_apply_saturation_jit(np.ascontiguousarray(img, dtype=np.float32), float(saturation)))
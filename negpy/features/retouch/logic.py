@@ -1,10 +1,10 @@
 import numpy as np
 import cv2
 from numba import njit, prange  # type: ignore
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from negpy.domain.types import ImageBuffer, LUMA_R, LUMA_G, LUMA_B
 from negpy.kernel.image.validation import ensure_image
-from negpy.kernel.image.logic import get_luminance
+from negpy.kernel.image.logic import float_to_uint8, get_luminance
 
 
 @njit(parallel=True, cache=True, fastmath=True)
@@ -124,13 +124,13 @@ def _apply_inpainting_grain_jit(
     noise: np.ndarray,
 ) -> np.ndarray:
     h, w, c = img_inpainted.shape
-    res = np.empty_like(img_inpainted)
+    res = np.empty((h, w, c), dtype=np.float32)
 
     for y in prange(h):
         for x in range(w):
             lum = (LUMA_R * img_inpainted[y, x, 0] + LUMA_G * img_inpainted[y, x, 1] + LUMA_B * img_inpainted[y, x, 2]) / 255.0
             mod = 3.0 * lum * (1.0 - lum)
-            m = mask_final[y, x, 0]
+            m = mask_final[y, x] / 255.0
 
             orig_luma = LUMA_R * img[y, x, 0] + LUMA_G * img[y, x, 1] + LUMA_B * img[y, x, 2]
             heal_luma = (LUMA_R * img_inpainted[y, x, 0] + LUMA_G * img_inpainted[y, x, 1] + LUMA_B * img_inpainted[y, x, 2]) / 255.0
@@ -150,15 +150,42 @@ def _apply_inpainting_grain_jit(
     return res
 
 
+@njit(parallel=True, cache=True, fastmath=True)
+def _rasterize_spots_jit(h: int, w: int, cx: np.ndarray, cy: np.ndarray, radii: np.ndarray) -> np.ndarray:
+    """
+    Fills all heal spots (SoA centers/radii in pixels) into one uint8 mask in a single row-parallel pass.
+    """
+    mask = np.zeros((h, w), dtype=np.uint8)
+    n = cx.shape[0]
+
+    for y in prange(h):
+        for i in range(n):
+            r = radii[i]
+            dy = y - cy[i]
+            if dy < -r or dy > r:
+                continue
+            half = int(np.sqrt(r * r - dy * dy))
+            x0 = max(0, cx[i] - half)
+            x1 = min(w - 1, cx[i] + half)
+            for x in range(x0, x1 + 1):
+                mask[y, x] = 255
+
+    return mask
+
+
 def apply_dust_removal(
     img: ImageBuffer,
     dust_remove: bool,
     dust_threshold: float,
     dust_size: int,
-    manual_spots: List[Tuple[float, float, float]],
+    manual_spots: Union[List[Tuple[float, float, float]], np.ndarray],
     scale_factor: float,
 ) -> ImageBuffer:
-    if not (dust_remove or manual_spots):
+    """
+    manual_spots are (x, y, size) rows in normalized coordinates, as a list or an (N, 3) array.
+    """
+    has_manual = len(manual_spots) > 0
+    if not (dust_remove or has_manual):
         return img
 
     if dust_remove:
@@ -173,38 +200,39 @@ def apply_dust_removal(
         w_std_gray = np.sqrt(np.clip(cv2.blur(gray**2, (w_win, w_win)) - w_mean_gray**2, 0, None))
 
         img = _apply_auto_retouch_jit(
-            np.ascontiguousarray(img.astype(np.float32)),
-            np.ascontiguousarray(mean_gray.astype(np.float32)),
-            np.ascontiguousarray(std_gray.astype(np.float32)),
-            np.ascontiguousarray(w_std_gray.astype(np.float32)),
+            np.ascontiguousarray(img, dtype=np.float32),
+            np.ascontiguousarray(mean_gray, dtype=np.float32),
+            np.ascontiguousarray(std_gray, dtype=np.float32),
+            np.ascontiguousarray(w_std_gray, dtype=np.float32),
             float(dust_threshold),
             float(dust_size),
             float(scale_factor),
         )
 
-    if manual_spots:
+    if has_manual:
         h_img, w_img = img.shape[:2]
-        manual_mask_u8 = np.zeros((h_img, w_img), dtype=np.uint8)
-        for spot in manual_spots:
-            nx, ny, s_size = spot
-            radius = int(max(1, s_size * scale_factor))
-            cv2.circle(manual_mask_u8, (int(nx * w_img), int(ny * h_img)), radius, 255, -1)
+        spots = np.asarray(manual_spots, dtype=np.float64).reshape(-1, 3)
+        manual_mask_u8 = _rasterize_spots_jit(
+            h_img,
+            w_img,
+            np.ascontiguousarray(spots[:, 0] * w_img, dtype=np.int32),
+            np.ascontiguousarray(spots[:, 1] * h_img, dtype=np.int32),
+            np.ascontiguousarray(np.maximum(1.0, spots[:, 2] * scale_factor), dtype=np.int32),
+        )
 
-        img_u8 = np.clip(np.nan_to_num(img * 255), 0, 255).astype(np.uint8)
+        img_u8 = float_to_uint8(img)
         inpaint_rad = int(3 * scale_factor) | 1
-        img_inpainted_u8 = ensure_image(cv2.inpaint(img_u8, manual_mask_u8, inpaint_rad, cv2.INPAINT_TELEA))
+        img_inpainted_u8: np.ndarray = cv2.inpaint(img_u8, manual_mask_u8, inpaint_rad, cv2.INPAINT_TELEA)
 
         noise_arr = np.random.normal(0, 3.5, img_inpainted_u8.shape).astype(np.float32)
-        mask_base = manual_mask_u8.astype(np.float32) / 255.0
-        mask_blur = cv2.GaussianBlur(mask_base[:, :, None], (inpaint_rad | 1, inpaint_rad | 1), 0)
-        mask_final = (mask_blur[:, :, None] if mask_blur.ndim == 2 else mask_blur).astype(np.float32)
+        mask_blur_u8 = cv2.GaussianBlur(manual_mask_u8, (inpaint_rad | 1, inpaint_rad | 1), 0)
 
         img = ensure_image(
             _apply_inpainting_grain_jit(
-                np.ascontiguousarray(img.astype(np.float32)),
-                np.ascontiguousarray(img_inpainted_u8.astype(np.float32)),
-                np.ascontiguousarray(mask_final.astype(np.float32)),
-                np.ascontiguousarray(noise_arr.astype(np.float32)),
+                np.ascontiguousarray(img, dtype=np.float32),
+                np.ascontiguousarray(img_inpainted_u8),
+                np.ascontiguousarray(mask_blur_u8),
+                noise_arr,
             )
         )
 
@@ -1,8 +1,9 @@
+import numpy as np
 from negpy.domain.interfaces import PipelineContext
 from negpy.domain.types import ImageBuffer
 from negpy.features.retouch.models import RetouchConfig
 from negpy.features.retouch.logic import apply_dust_removal
-from negpy.features.geometry.logic import map_coords_to_geometry
+from negpy.features.geometry.logic import map_points_to_geometry
 
 
 class RetouchProcessor:
@@ -33,19 +34,19 @@ class RetouchProcessor:
         flip_h = rot_params.get("flip_horizontal", False)
         flip_v = rot_params.get("flip_vertical", False)
 
-        mapped_spots = []
+        mapped_spots: np.ndarray = np.empty((0, 3), dtype=np.float64)
         if self.config.manual_dust_spots:
-            for nx, ny, size in self.config.manual_dust_spots:
-                mnx, mny = map_coords_to_geometry(
-                    nx,
-                    ny,
-                    (orig_h, orig_w),
-                    rotation,
-                    fine_rotation,
-                    flip_h,
-                    flip_v,
-                )
-                mapped_spots.append((mnx, mny, size))
+            spots = np.asarray(self.config.manual_dust_spots, dtype=np.float64).reshape(-1, 3)
+            mapped = map_points_to_geometry(
+                spots[:, :2],
+                (orig_h, orig_w),
+                rotation,
+                fine_rotation,
+                flip_h,
+                flip_v,
+            )
+            # Stays an (N, 3) array end to end; the rasterizer consumes columns directly
+            mapped_spots = np.column_stack((np.asarray(mapped, dtype=np.float64), spots[:, 2]))
 
         img = apply_dust_removal(
             img,
@@ -81,11 +81,11 @@ def simulate_paper_substrate(img: ImageBuffer, profile_name: str) -> ImageBuffer
     Look-up profile -> Apply tint.
     """
     profile = PAPER_PROFILES.get(profile_name, PAPER_PROFILES[PaperProfileName.NONE])
-    tint = np.ascontiguousarray(np.array(profile.tint, dtype=np.float32))
+    tint = np.array(profile.tint, dtype=np.float32)
 
     return ensure_image(
         _apply_paper_substrate_jit(
-            np.ascontiguousarray(img.astype(np.float32)),
+            np.ascontiguousarray(img, dtype=np.float32),
             tint,
             float(profile.dmax_boost),
         )
@@ -105,7 +105,7 @@ def apply_chemical_toning(
 
     return ensure_image(
         _apply_chemical_toning_jit(
-            np.ascontiguousarray(img.astype(np.float32)),
+            np.ascontiguousarray(img, dtype=np.float32),
             float(selenium_strength),
             float(sepia_strength),
         )
@@ -1,5 +1,5 @@
 import os
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 from PIL import Image, ImageCms
 from negpy.kernel.system.config import APP_CONFIG
 from negpy.kernel.system.paths import get_resource_path
@@ -12,6 +12,23 @@ class ColorService:
     ICC profile application & soft-proofing.
     """
 
+    # path -> (file mtime, parsed profile); parsing is far costlier than the stat
+    _profile_cache: Dict[str, Tuple[int, Any]] = {}
+
+    @classmethod
+    def load_profile(cls, path: str) -> Any:
+        """
+        Opens an ICC profile, reusing the parsed object until the file changes.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = cls._profile_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        profile = ImageCms.getOpenProfile(path)
+        cls._profile_cache[path] = (mtime, profile)
+        return profile
+
     @staticmethod
     def _get_profile(cs_name: str) -> Any:
         """
@@ -19,7 +36,7 @@ class ColorService:
         """
         path = ColorSpaceRegistry.get_icc_path(cs_name)
         if path and os.path.exists(path):
-            return ImageCms.getOpenProfile(path)
+            return ColorService.load_profile(path)
 
         # Fallback to built-in if possible, else sRGB
         if cs_name == ColorSpace.XYZ.value:
@@ -42,7 +59,7 @@ class ColorService:
 
         try:
             profile_working = ColorService._get_profile(src_color_space)
-            profile_selected: Any = ImageCms.getOpenProfile(dst_profile_path)
+            profile_selected: Any = ColorService.load_profile(dst_profile_path)
 
             if inverse:
                 profile_src = profile_selected
@@ -93,21 +110,22 @@ class ColorService:
             pass
         return pil_img
 
+    @staticmethod
+    def _scan_icc_dir(directory: str) -> list[str]:
+        """
+        Lists ICC profiles in a directory with a single scandir pass.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return [e.path for e in entries if e.name.lower().endswith((".icc", ".icm")) and e.is_file()]
+        except OSError:
+            return []
+
     @staticmethod
     def get_available_profiles() -> list[str]:
         """
         Returns list of available ICC profile paths.
         """
-        icc_root = get_resource_path("icc")
-        built_in_icc = []
-        if os.path.exists(icc_root):
-            built_in_icc = [os.path.join(icc_root, f) for f in os.listdir(icc_root) if f.lower().endswith((".icc", ".icm"))]
-
-        user_icc = []
-        if os.path.exists(APP_CONFIG.user_icc_dir):
-            user_icc = [
-                os.path.join(APP_CONFIG.user_icc_dir, f)
-                for f in os.listdir(APP_CONFIG.user_icc_dir)
-                if f.lower().endswith((".icc", ".icm"))
-            ]
+        built_in_icc = ColorService._scan_icc_dir(get_resource_path("icc"))
+        user_icc = ColorService._scan_icc_dir(APP_CONFIG.user_icc_dir)
         return sorted(built_in_icc + user_icc)
@@ -1,6 +1,6 @@
 import rawpy
 import os
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from negpy.domain.models import ColorSpace
 from negpy.kernel.system.config import APP_CONFIG
 from negpy.kernel.system.paths import get_resource_path
@@ -42,10 +42,30 @@ class ColorSpaceRegistry:
         """
         return cls._RAWPY_MAP.get(cs_name, rawpy.ColorSpace.Adobe)
 
+    # cs_name -> (user ICC dir mtime, resolved path); every soft-proof render and export asks again
+    _path_cache: Dict[str, Tuple[int, Optional[str]]] = {}
+
     @classmethod
     def get_icc_path(cls, cs_name: str) -> Optional[str]:
         """
         Locates ICC profile for the given color space.
+        Lookups are reused until the user ICC folder changes.
+        """
+        try:
+            user_mtime = os.stat(APP_CONFIG.user_icc_dir).st_mtime_ns
+        except OSError:
+            user_mtime = -1
+        cached = cls._path_cache.get(cs_name)
+        if cached is not None and cached[0] == user_mtime:
+            return cached[1]
+
+        path = cls._resolve_icc_path(cs_name)
+        cls._path_cache[cs_name] = (user_mtime, path)
+        return path
+
+    @classmethod
+    def _resolve_icc_path(cls, cs_name: str) -> Optional[str]:
+        """
         Checks application defaults then user overrides.
         """
         # 1. Check mapped defaults
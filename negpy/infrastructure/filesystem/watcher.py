@@ -1,5 +1,5 @@
 import os
-from typing import List, Set
+from typing import FrozenSet, Iterable, List, Optional, Set
 from negpy.infrastructure.loaders.constants import SUPPORTED_RAW_EXTENSIONS
 
 
@@ -11,24 +11,31 @@ class FolderWatchService:
     SUPPORTED_EXTS = SUPPORTED_RAW_EXTENSIONS
 
     @classmethod
-    def scan_for_new_files(cls, folder_path: str, existing_paths: Set[str]) -> List[str]:
+    def list_supported_files(cls, folder_path: str) -> Optional[FrozenSet[str]]:
         """
-        Shallow scan for unindexed files.
+        Names of supported files from a single scandir pass, without per-file stats.
         """
-        if not os.path.exists(folder_path):
-            return []
-
-        new_files = []
         try:
             with os.scandir(folder_path) as it:
-                for entry in it:
-                    if entry.is_file():
-                        ext = os.path.splitext(entry.name)[1].lower()
-                        if ext in cls.SUPPORTED_EXTS:
-                            full_path = os.path.abspath(entry.path)
-                            if full_path not in existing_paths:
-                                new_files.append(full_path)
-        except Exception:
-            pass
+                return frozenset(
+                    entry.name for entry in it if entry.is_file() and os.path.splitext(entry.name)[1].lower() in cls.SUPPORTED_EXTS
+                )
+        except OSError:
+            return None
 
+    @classmethod
+    def scan_for_new_files(cls, folder_path: str, existing_paths: Set[str], names: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Shallow scan for unindexed files. Reuses a listing from list_supported_files when given.
+        """
+        if names is None:
+            names = cls.list_supported_files(folder_path)
+            if names is None:
+                return []
+
+        new_files = []
+        for name in names:
+            full_path = os.path.abspath(os.path.join(folder_path, name))
+            if full_path not in existing_paths:
+                new_files.append(full_path)
         return new_files
@@ -75,6 +75,29 @@ class GPUTexture:
 
         return result
 
+    def readback_pixel(self, x: int, y: int) -> np.ndarray:
+        """Downloads a single texel (RGBA float32) instead of the whole texture."""
+        gpu = GPUDevice.get()
+        if not gpu.device or not self.texture:
+            return np.zeros(4, dtype=np.float32)
+
+        # bytes_per_row must stay 256-aligned even for a one-texel copy
+        staging = gpu.device.create_buffer(size=256, usage=wgpu.BufferUsage.COPY_DST | wgpu.BufferUsage.MAP_READ)
+
+        enc = gpu.device.create_command_encoder()
+        enc.copy_texture_to_buffer(
+            {"texture": self.texture, "origin": (x, y, 0)},
+            {"buffer": staging, "bytes_per_row": 256},
+            (1, 1, 1),
+        )
+        gpu.device.queue.submit([enc.finish()])
+
+        staging.map_sync(mode=wgpu.MapMode.READ)
+        result = np.frombuffer(staging.read_mapped(), dtype=np.float32)[:4].copy()
+        staging.destroy()
+
+        return result
+
     def destroy(self) -> None:
         """Forces hardware resource release."""
         try:
@@ -1,5 +1,4 @@
 import numpy as np
-import imageio.v3 as iio
 from typing import Any, ContextManager, Tuple
 from negpy.domain.interfaces import IImageLoader
 from negpy.kernel.image.logic import uint8_to_float32
@@ -12,6 +11,8 @@ class JpegLoader(IImageLoader):
     """
 
     def load(self, file_path: str) -> Tuple[ContextManager[Any], dict]:
+        import imageio.v3 as iio
+
         img = iio.imread(file_path)
         if img.ndim == 2:
             img = np.stack([img] * 3, axis=-1)
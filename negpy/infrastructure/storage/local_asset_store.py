@@ -9,6 +9,9 @@ from negpy.domain.interfaces import IAssetStore
 
 logger = get_logger(__name__)
 
+# Uploads are copied in chunks so a large RAW is never held in memory whole
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 
 class LocalAssetStore(IAssetStore):
     """
@@ -42,13 +45,15 @@ class LocalAssetStore(IAssetStore):
                 logger.warning(f"Registration failed: Path does not exist: {source}")
 
             # Docker/Streamlit upload
-            if hasattr(source, "getbuffer") and hasattr(source, "name"):
+            if hasattr(source, "read") and hasattr(source, "name"):
                 session_dir = self._get_session_dir(session_id)
                 unique_name = f"{uuid.uuid4()}_{source.name}"
                 file_path = os.path.join(session_dir, unique_name)
 
+                if hasattr(source, "seek"):
+                    source.seek(0)
                 with open(file_path, "wb") as f_out:
-                    f_out.write(source.getbuffer())
+                    shutil.copyfileobj(source, f_out, UPLOAD_CHUNK_SIZE)
 
                 f_hash = calculate_file_hash(file_path)
                 return file_path, f_hash
@@ -1,10 +1,13 @@
 import sqlite3
 import json
 import os
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 from negpy.domain.models import WorkspaceConfig
 from negpy.domain.interfaces import IRepository
 
+# Stays under SQLite's host-parameter limit on older builds
+SQL_BATCH_SIZE = 500
+
 
 class StorageRepository(IRepository):
     """
@@ -91,6 +94,17 @@ class StorageRepository(IRepository):
                 (file_hash, settings_json),
             )
 
+    def save_file_settings_batch(self, items: list[tuple[str, WorkspaceConfig]]) -> None:
+        """
+        Persists settings for many files in a single transaction.
+        """
+        rows = [(file_hash, json.dumps(settings.to_dict(), default=str)) for file_hash, settings in items]
+        with sqlite3.connect(self.edits_db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO file_settings (file_hash, settings_json) VALUES (?, ?)",
+                rows,
+            )
+
     def load_file_settings(self, file_hash: str) -> Optional[WorkspaceConfig]:
         with sqlite3.connect(self.edits_db_path) as conn:
             cursor = conn.execute(
@@ -103,6 +117,23 @@ class StorageRepository(IRepository):
                 return WorkspaceConfig.from_flat_dict(data)
         return None
 
+    def load_file_settings_batch(self, file_hashes: List[str]) -> Dict[str, WorkspaceConfig]:
+        """
+        Reads settings for many files over one connection; files without saved settings are left out.
+        """
+        result: Dict[str, WorkspaceConfig] = {}
+        with sqlite3.connect(self.edits_db_path) as conn:
+            for start in range(0, len(file_hashes), SQL_BATCH_SIZE):
+                chunk = file_hashes[start : start + SQL_BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor = conn.execute(
+                    f"SELECT file_hash, settings_json FROM file_settings WHERE file_hash IN ({placeholders})",
+                    tuple(chunk),
+                )
+                for file_hash, settings_json in cursor.fetchall():
+                    result[file_hash] = WorkspaceConfig.from_flat_dict(json.loads(settings_json))
+        return result
+
     def save_global_setting(self, key: str, value: Any) -> None:
         with sqlite3.connect(self.settings_db_path) as conn:
             conn.execute(
@@ -110,6 +141,17 @@ class StorageRepository(IRepository):
                 (key, json.dumps(value, default=str)),
             )
 
+    def save_global_settings(self, values: Dict[str, Any]) -> None:
+        """
+        Persists several global settings in a single transaction.
+        """
+        rows = [(key, json.dumps(value, default=str)) for key, value in values.items()]
+        with sqlite3.connect(self.settings_db_path) as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO global_settings (key, value_json) VALUES (?, ?)",
+                rows,
+            )
+
     def get_global_setting(self, key: str, default: Any = None) -> Any:
         with sqlite3.connect(self.settings_db_path) as conn:
             cursor = conn.execute("SELECT value_json FROM global_settings WHERE key = ?", (key,))
@@ -117,3 +159,15 @@ class StorageRepository(IRepository):
             if row:
                 return json.loads(row[0])
         return default
+
+    def get_global_settings(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Reads several global settings in one query; missing keys are left out.
+        """
+        placeholders = ", ".join("?" for _ in keys)
+        with sqlite3.connect(self.settings_db_path) as conn:
+            cursor = conn.execute(
+                f"SELECT key, value_json FROM global_settings WHERE key IN ({placeholders})",
+                tuple(keys),
+            )
+            return {key: json.loads(value) for key, value in cursor.fetchall()}
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Optional, Tuple
 from negpy.kernel.caching.logic import CacheEntry
 
 
@@ -16,9 +16,13 @@ class PipelineCache:
     retouch: Optional[CacheEntry] = None
     lab: Optional[CacheEntry] = None
 
+    # (orientation key, detected film borders); offset/ratio edits reuse the detection
+    autocrop: Optional[Tuple[Tuple[Any, ...], Optional[Tuple[float, float, float, float]]]] = None
+
     def clear(self) -> None:
         self.base = None
         self.exposure = None
         self.retouch = None
         self.lab = None
+        self.autocrop = None
         self.source_hash = ""
@@ -187,13 +187,13 @@ def float_to_uint_luma(img: np.ndarray, bit_depth: int = 8) -> np.ndarray:
 
 def float_to_uint16(img: np.ndarray) -> np.ndarray:
     """Converts float32 [0,1] buffer to uint16."""
-    res: np.ndarray = _to_uint16_jit(np.ascontiguousarray(img.astype(np.float32)))
+    res: np.ndarray = _to_uint16_jit(np.ascontiguousarray(img, dtype=np.float32))
     return res
 
 
 def float_to_uint8(img: np.ndarray) -> np.ndarray:
     """Converts float32 [0,1] buffer to uint8."""
-    res: np.ndarray = _to_uint8_jit(np.ascontiguousarray(img.astype(np.float32)))
+    res: np.ndarray = _to_uint8_jit(np.ascontiguousarray(img, dtype=np.float32))
     return res
 
 
@@ -213,11 +213,47 @@ def get_luminance(img: np.ndarray) -> np.ndarray:
     Calculates relative luminance. Supports (H, W, 3) and (N, 3) arrays.
     """
     if img.ndim == 3:
-        return ensure_image(_get_luminance_jit(np.ascontiguousarray(img.astype(np.float32))))
+        return ensure_image(_get_luminance_jit(np.ascontiguousarray(img, dtype=np.float32)))
 
     return LUMA_R * img[..., 0] + LUMA_G * img[..., 1] + LUMA_B * img[..., 2]
 
 
+@njit(parallel=True, cache=True, fastmath=True)
+def _channel_histograms_jit(img: np.ndarray, step: int) -> np.ndarray:
+    """
+    256-bin R, G, B and luminance counts over [0, 1] in one pass; out-of-range values are skipped.
+    Only every step-th row and column is visited, so subsampling needs no strided copy.
+    """
+    h, w, _ = img.shape
+    n_rows = (h + step - 1) // step
+    n_chunks = min(n_rows, 64)
+    rows = (n_rows + n_chunks - 1) // n_chunks
+    partial = np.zeros((n_chunks, 4, 256), dtype=np.int64)
+    for k in prange(n_chunks):
+        for r in range(k * rows, min(n_rows, (k + 1) * rows)):
+            y = r * step
+            for x in range(0, w, step):
+                lum = LUMA_R * img[y, x, 0] + LUMA_G * img[y, x, 1] + LUMA_B * img[y, x, 2]
+                for ch in range(4):
+                    v = lum if ch == 3 else img[y, x, ch]
+                    if v >= 0.0 and v <= 1.0:
+                        partial[k, ch, min(int(v * 256.0), 255)] += 1
+    res: np.ndarray = partial.sum(axis=0)
+    return res
+
+
+def get_channel_histograms(img: np.ndarray, step: int = 1) -> np.ndarray:
+    """
+    Returns (4, 256) counts for R, G, B and luminance, matching the GPU histogram layout.
+    With step > 1 only every step-th row and column is counted.
+    """
+    if img.dtype != np.float32 or not img.flags.c_contiguous:
+        img = np.ascontiguousarray(img[::step, ::step], dtype=np.float32)
+        step = 1
+    res: np.ndarray = _channel_histograms_jit(img, step)
+    return res
+
+
 def calculate_file_hash(file_path: str) -> str:
     """
     Fingerprint using file size + head/tail samples.
@@ -248,15 +284,21 @@ def prepare_thumbnail(img: Any, size: int) -> Any:
     """
     from PIL import Image
 
-    # Copy to avoid mutating original
-    img_copy = img.copy()
-    img_copy.thumbnail((size, size), Image.Resampling.LANCZOS)
+    # Resample into a new image rather than copying the full-size original for an in-place thumbnail()
+    w, h = img.size
+    scale = min(size / w, size / h)
+    if scale < 1.0:
+        img = img.resize(
+            (max(1, round(w * scale)), max(1, round(h * scale))),
+            Image.Resampling.LANCZOS,
+            reducing_gap=2.0,
+        )
 
     # Create dark square background
     square_img = Image.new("RGB", (size, size), (14, 17, 23))
     # Center the thumbnail
-    offset_x = (size - img_copy.width) // 2
-    offset_y = (size - img_copy.height) // 2
-    square_img.paste(img_copy, (offset_x, offset_y))
+    offset_x = (size - img.width) // 2
+    offset_y = (size - img.height) // 2
+    square_img.paste(img, (offset_x, offset_y))
 
     return square_img
@@ -1,7 +1,6 @@
 import os
 import sys
 import json
-import urllib.request
 from typing import Optional
 
 
@@ -40,6 +39,9 @@ def check_for_updates() -> Optional[str]:
     if current_version == "unknown":
         return None
 
+    # Imported here: urllib.request pulls in http.client, email and ssl, which startup never needs
+    import urllib.request
+
     url = "https://api.github.com/repos/marcinz606/NegPy/releases/latest"
 
     try:
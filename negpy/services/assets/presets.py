@@ -1,6 +1,6 @@
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from negpy.kernel.system.config import APP_CONFIG
 from negpy.domain.models import WorkspaceConfig
 
@@ -10,6 +10,9 @@ class Presets:
     JSON I/O for user presets.
     """
 
+    # (presets dir mtime, names) of the last directory scan
+    _names_cache: Optional[Tuple[int, List[str]]] = None
+
     @staticmethod
     def save_preset(name: str, settings: WorkspaceConfig) -> None:
         """
@@ -49,6 +52,7 @@ class Presets:
         filepath = os.path.join(APP_CONFIG.presets_dir, f"{name}.json")
         with open(filepath, "w") as f_out:
             json.dump(filtered, f_out, indent=4)
+        Presets._names_cache = None
 
     @staticmethod
     def load_preset(name: str) -> Optional[Dict[str, Any]]:
@@ -63,6 +67,15 @@ class Presets:
 
     @staticmethod
     def list_presets() -> List[str]:
-        if not os.path.exists(APP_CONFIG.presets_dir):
+        """
+        Preset names; the directory is only rescanned when its mtime changes.
+        """
+        try:
+            mtime = os.stat(APP_CONFIG.presets_dir).st_mtime_ns
+        except FileNotFoundError:
             return []
-        return [f[:-5] for f in os.listdir(APP_CONFIG.presets_dir) if f.endswith(".json")]
+        cached = Presets._names_cache
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, [f[:-5] for f in os.listdir(APP_CONFIG.presets_dir) if f.endswith(".json")])
+            Presets._names_cache = cached
+        return list(cached[1])
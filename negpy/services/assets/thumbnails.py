@@ -1,5 +1,6 @@
 import asyncio
 from typing import Optional, Any, List, Dict, Tuple
+import cv2
 from PIL import Image
 import rawpy
 from negpy.kernel.system.config import APP_CONFIG
@@ -64,6 +65,7 @@ def get_thumbnail_worker(file_path: str, file_hash: str, asset_store: Any = None
                         import io
 
                         img = Image.open(io.BytesIO(thumb.data))
+                        img.draft("RGB", (ts, ts))
                     elif thumb.format == rawpy.ThumbFormat.BITMAP:
                         img = Image.fromarray(thumb.data)
                 except Exception:
@@ -83,6 +85,9 @@ def get_thumbnail_worker(file_path: str, file_hash: str, asset_store: Any = None
                 rgb = ensure_rgb(rgb)
                 img = Image.fromarray(rgb)
 
+            # Shrink before rotating so the transform runs at thumbnail resolution
+            img.thumbnail((ts, ts), Image.Resampling.LANCZOS)
+
             rot = metadata.get("orientation", 0)
             if rot != 0:
                 img = img.rotate(rot * -90, expand=True)
@@ -106,6 +111,11 @@ def get_rendered_thumbnail(buffer: Any, file_hash: str, asset_store: Any = None)
         from negpy.kernel.image.logic import float_to_uint8
 
         ts = APP_CONFIG.thumbnail_size
+        h, w = buffer.shape[:2]
+        scale = ts / max(h, w)
+        if scale < 1.0:
+            # Quantize and pad at thumbnail size, not at preview size
+            buffer = cv2.resize(buffer, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=cv2.INTER_AREA)
         u8_arr = float_to_uint8(buffer)
         img = Image.fromarray(u8_arr)
 
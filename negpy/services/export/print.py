@@ -1,8 +1,7 @@
-from PIL import Image
 import cv2
 import numpy as np
 from typing import Tuple
-from negpy.domain.models import ExportConfig, AspectRatio
+from negpy.domain.models import ExportConfig, AspectRatio, ASPECT_RATIO_VALUES
 
 
 class PrintService:
@@ -11,20 +10,18 @@ class PrintService:
     """
 
     @staticmethod
-    def apply_preview_layout_to_pil(
-        pil_img: Image.Image,
+    def apply_preview_layout(
+        img: np.ndarray,
         paper_aspect_ratio: str,
         border_size_cm: float,
         print_size_cm: float,
         border_color_hex: str,
         preview_size_px: float,
-    ) -> Tuple[Image.Image, Tuple[int, int, int, int]]:
+    ) -> Tuple[np.ndarray, Tuple[int, int, int, int]]:
         """
-        Pads a PIL image to match a specific paper aspect ratio for UI preview.
-        Returns (Image, (content_x, content_y, content_w, content_h)).
+        Pads a display buffer (any dtype) to match a specific paper aspect ratio for UI preview.
+        Returns (buffer, (content_x, content_y, content_w, content_h)).
         """
-        img_np = np.array(pil_img).astype(np.float32) / 255.0
-
         virtual_dpi = int((preview_size_px * 2.54) / max(0.1, print_size_cm))
 
         config = ExportConfig(
@@ -36,9 +33,7 @@ class PrintService:
             use_original_res=False,
         )
 
-        result_np, content_rect = PrintService.apply_layout(img_np, config)
-        result_uint8 = (np.clip(result_np, 0, 1) * 255).astype(np.uint8)
-        return Image.fromarray(result_uint8), content_rect
+        return PrintService.apply_layout(img, config)
 
     @staticmethod
     def calculate_paper_px(print_size_cm: float, dpi: int, aspect_ratio_str: str, img_w: int, img_h: int) -> Tuple[int, int]:
@@ -53,11 +48,7 @@ class PrintService:
             else:
                 return int(long_edge_px * (img_w / img_h)), long_edge_px
 
-        try:
-            w_r, h_r = map(float, aspect_ratio_str.split(":"))
-            ratio = w_r / h_r
-        except (ValueError, ZeroDivisionError):
-            ratio = 1.0
+        ratio = ASPECT_RATIO_VALUES.get(aspect_ratio_str, 1.0)
 
         if ratio >= 1.0:
             paper_w = long_edge_px
@@ -97,11 +88,7 @@ class PrintService:
             paper_w = target_w + 2 * border_px
             paper_h = target_h + 2 * border_px
         else:
-            try:
-                w_r, h_r = map(float, export_settings.paper_aspect_ratio.split(":"))
-                paper_ratio = w_r / h_r
-            except Exception:
-                paper_ratio = img_aspect
+            paper_ratio = ASPECT_RATIO_VALUES.get(export_settings.paper_aspect_ratio, img_aspect)
 
             if export_settings.use_original_res:
                 target_w, target_h = img_w, img_h
@@ -137,16 +124,8 @@ class PrintService:
 
                 img_scaled = cv2.resize(img, (target_w, target_h), interpolation=cv2.INTER_LANCZOS4)
 
-        color_hex = export_settings.export_border_color.lstrip("#")
-        r, g, b = tuple(int(color_hex[i : i + 2], 16) / 255.0 for i in (0, 2, 4))
-
-        channels = img_scaled.shape[2] if img_scaled.ndim == 3 else 1
-        paper_shape = (paper_h, paper_w, channels) if channels > 1 else (paper_h, paper_w)
-        paper = np.full(
-            paper_shape,
-            (r, g, b) if channels > 1 else (r,),
-            dtype=img_scaled.dtype,
-        )
+        if (paper_h, paper_w) == img_scaled.shape[:2]:
+            return img_scaled, (0, 0, target_w, target_h)
 
         offset_x = (paper_w - target_w) // 2
         offset_y = (paper_h - target_h) // 2
@@ -154,9 +133,17 @@ class PrintService:
         h_copy = min(target_h, paper_h - offset_y)
         w_copy = min(target_w, paper_w - offset_x)
 
-        if channels > 1:
-            paper[offset_y : offset_y + h_copy, offset_x : offset_x + w_copy, :] = img_scaled[:h_copy, :w_copy, :]
-        else:
-            paper[offset_y : offset_y + h_copy, offset_x : offset_x + w_copy] = img_scaled[:h_copy, :w_copy]
+        color_hex = export_settings.export_border_color.lstrip("#")
+        white = np.iinfo(img_scaled.dtype).max if np.issubdtype(img_scaled.dtype, np.integer) else 1.0
+        fill = [int(color_hex[i : i + 2], 16) / 255.0 * white for i in (0, 2, 4)]
+
+        # Single buffer at paper size: paint only the border strips, then drop the content in.
+        paper = np.empty((paper_h, paper_w) + img_scaled.shape[2:], dtype=img_scaled.dtype)
+        fill_value = np.array(fill if img_scaled.ndim == 3 and img_scaled.shape[2] == 3 else fill[0], dtype=img_scaled.dtype)
+        paper[:offset_y] = fill_value
+        paper[offset_y + h_copy :] = fill_value
+        paper[offset_y : offset_y + h_copy, :offset_x] = fill_value
+        paper[offset_y : offset_y + h_copy, offset_x + w_copy :] = fill_value
+        paper[offset_y : offset_y + h_copy, offset_x : offset_x + w_copy] = img_scaled[:h_copy, :w_copy]
 
         return paper, (offset_x, offset_y, w_copy, h_copy)
@@ -1,7 +1,6 @@
 import os
 import re
 from datetime import datetime
-from jinja2 import Template
 from negpy.domain.models import ExportConfig
 
 
@@ -34,6 +33,8 @@ def render_export_filename(
         "date": datetime.now().strftime("%Y%m%d"),
     }
 
+    from jinja2 import Template
+
     try:
         template = Template(export_settings.filename_pattern)
         rendered = template.render(**context)
@@ -88,7 +88,7 @@ class DarkroomEngine:
             logger.debug(f"Engine process with manual_crop_rect: {settings.geometry.manual_crop_rect}")
 
         def run_base(img_in: ImageBuffer, ctx: PipelineContext) -> ImageBuffer:
-            img_in = GeometryProcessor(settings.geometry).process(img_in, ctx)
+            img_in = GeometryProcessor(settings.geometry, self.cache).process(img_in, ctx)
             return NormalizationProcessor(settings.process).process(img_in, ctx)
 
         base_key = (
@@ -135,7 +135,7 @@ class DarkroomEngine:
         current_img = CropProcessor(settings.geometry).process(current_img, context)
 
         try:
-            uv_grid = CoordinateMapping.create_uv_grid(
+            uv_transform = CoordinateMapping.create_uv_transform(
                 rh_orig=h_orig,
                 rw_orig=w_cols,
                 rotation=settings.geometry.rotation,
@@ -145,9 +145,9 @@ class DarkroomEngine:
                 autocrop=True,
                 autocrop_params={"roi": context.active_roi} if context.active_roi else None,
             )
-            context.metrics["uv_grid"] = uv_grid
+            context.metrics["uv_transform"] = uv_transform
         except Exception as e:
-            logger.error(f"Failed to generate UV grid: {e}")
+            logger.error(f"Failed to generate UV transform: {e}")
 
         context.metrics["base_positive"] = current_img.copy()
 
@@ -10,14 +10,16 @@ from negpy.infrastructure.gpu.device import GPUDevice
 from negpy.infrastructure.gpu.resources import GPUTexture, GPUBuffer
 from negpy.infrastructure.gpu.shader_loader import ShaderLoader
 from negpy.features.process.models import ProcessMode
-from negpy.domain.models import WorkspaceConfig, AspectRatio
+from negpy.domain.models import WorkspaceConfig, AspectRatio, ASPECT_RATIO_VALUES
 from negpy.kernel.system.logging import get_logger
 from negpy.kernel.system.config import APP_CONFIG
 from negpy.kernel.system.paths import get_resource_path
+from negpy.kernel.image.validation import ensure_image
 from negpy.features.geometry.logic import (
     get_manual_rect_coords,
-    get_autocrop_coords,
-    map_coords_to_geometry,
+    detect_film_borders,
+    finalize_autocrop_roi,
+    map_points_to_geometry,
     apply_fine_rotation,
 )
 from negpy.features.exposure.normalization import (
@@ -37,6 +39,22 @@ TILING_THRESHOLD_PX = 12_000_000
 HISTOGRAM_BINS = 256
 METRICS_BUFFER_SIZE = 4096
 
+# Compute shaders declared with 16x16 workgroups (the rest use 8x8)
+WIDE_WORKGROUP_PIPELINES = frozenset({"autocrop", "metrics", "clahe_hist"})
+# CLAHE passes run over the fixed 8x8 tile grid rather than over pixels
+TILE_GRID_PIPELINES = frozenset({"clahe_hist", "clahe_cdf"})
+# Bytes each stage's uniform block occupies within its aligned slot of the unified UBO
+UNIFORM_SIZES: Dict[str, int] = {
+    "geometry": 32,
+    "normalization": 64,
+    "exposure": 112,
+    "clahe_u": 32,
+    "retouch_u": 40,
+    "lab": 64,
+    "toning": 48,
+    "layout": 48,
+}
+
 
 class GPUEngine:
     """
@@ -76,9 +94,12 @@ class GPUEngine:
             "layout",
         ]
         self._alignment = UNIFORM_ALIGNMENT_DEFAULT
+        self._uniform_bindings: Dict[str, Dict[str, Any]] = {}
         self._current_source_hash: Optional[str] = None
         self._last_settings: Optional[WorkspaceConfig] = None
         self._last_scale_factor: float = 1.0
+        self._autocrop_cache: Optional[Tuple[Tuple[Any, ...], Any]] = None
+        self._bounds_cache: Optional[Tuple[Tuple[Any, ...], LogNegativeBounds]] = None
 
     def _detect_invalidated_stage(self, settings: WorkspaceConfig, scale_factor: float) -> int:
         """
@@ -142,6 +163,12 @@ class GPUEngine:
             self._alignment * len(self._uniform_names),
             wgpu.BufferUsage.UNIFORM | wgpu.BufferUsage.COPY_DST,
         )
+        # Per-stage UBO slices are fixed once the buffer exists, so build the binding entries once
+        unified = self._buffers["unified_u"].buffer
+        self._uniform_bindings = {
+            name: {"buffer": unified, "offset": idx * self._alignment, "size": UNIFORM_SIZES[name]}
+            for idx, name in enumerate(self._uniform_names)
+        }
 
         # Storage buffers for intermediate metrics and CLAHE
         self._buffers["clahe_h"] = GPUBuffer(65536, wgpu.BufferUsage.STORAGE | wgpu.BufferUsage.COPY_DST)
@@ -163,23 +190,8 @@ class GPUEngine:
         return self.gpu.device.create_compute_pipeline(layout="auto", compute={"module": shader_module, "entry_point": "main"})
 
     def _get_uniform_binding(self, name: str) -> Dict[str, Any]:
-        """Calculates UBO offset and size for a specific pipeline stage."""
-        idx = self._uniform_names.index(name)
-        sizes = {
-            "geometry": 32,
-            "normalization": 64,
-            "exposure": 112,
-            "clahe_u": 32,
-            "retouch_u": 40,
-            "lab": 64,
-            "toning": 48,
-            "layout": 48,
-        }
-        return {
-            "buffer": self._buffers["unified_u"].buffer,
-            "offset": idx * self._alignment,
-            "size": sizes[name],
-        }
+        """UBO offset and size for a specific pipeline stage."""
+        return self._uniform_bindings[name]
 
     def process_to_texture(
         self,
@@ -247,28 +259,7 @@ class GPUEngine:
                     scale_factor=scale_factor,
                 )
             else:
-                det_s = APP_CONFIG.preview_render_size / max(h, w)
-                tmp = cv2.resize(img, (int(w * det_s), int(h * det_s)))
-                if settings.geometry.rotation != 0:
-                    tmp = np.rot90(tmp, k=settings.geometry.rotation)
-                if settings.geometry.flip_horizontal:
-                    tmp = np.fliplr(tmp)
-                if settings.geometry.flip_vertical:
-                    tmp = np.flipud(tmp)
-                roi_tmp = get_autocrop_coords(
-                    tmp.astype(np.float32),
-                    offset_px=settings.geometry.autocrop_offset,
-                    scale_factor=scale_factor,
-                    target_ratio_str=settings.geometry.autocrop_ratio,
-                )
-                rh, rw = tmp.shape[:2]
-                sy, sx = h_rot / rh, w_rot / rw
-                roi = (
-                    int(roi_tmp[0] * sy),
-                    int(roi_tmp[1] * sy),
-                    int(roi_tmp[2] * sx),
-                    int(roi_tmp[3] * sx),
-                )
+                roi = self._get_autocrop_roi(img, settings, scale_factor, (h_rot, w_rot), source_hash)
             y1, y2, x1, x2 = roi
             crop_w, crop_h = max(1, x2 - x1), max(1, y2 - y1)
 
@@ -285,23 +276,7 @@ class GPUEngine:
                 ceils=settings.process.local_ceils,
             )
         else:
-            analysis_source = img.copy()
-            if settings.geometry.rotation != 0:
-                analysis_source = np.rot90(analysis_source, k=settings.geometry.rotation)
-            if settings.geometry.flip_horizontal:
-                analysis_source = np.fliplr(analysis_source)
-            if settings.geometry.flip_vertical:
-                analysis_source = np.flipud(analysis_source)
-            if settings.geometry.fine_rotation != 0.0:
-                analysis_source = apply_fine_rotation(analysis_source, settings.geometry.fine_rotation)
-
-            bounds = analyze_log_exposure_bounds(
-                analysis_source,
-                roi if not tiling_mode else None,
-                settings.process.analysis_buffer,
-                process_mode=settings.process.process_mode,
-                e6_normalize=settings.process.e6_normalize,
-            )
+            bounds = self._get_log_bounds(img, settings, None if tiling_mode else roi, None if tiling_mode else source_hash)
 
         pw, ph, cw, ch, ox, oy = self._calculate_layout_dims(settings, crop_w, crop_h, render_size_ref)
 
@@ -534,7 +509,7 @@ class GPUEngine:
         if not tiling_mode and readback_metrics:
             metrics["histogram_raw"] = self._readback_metrics()
             try:
-                metrics["uv_grid"] = CoordinateMapping.create_uv_grid(
+                metrics["uv_transform"] = CoordinateMapping.create_uv_transform(
                     rh_orig=h,
                     rw_orig=w,
                     rotation=settings.geometry.rotation,
@@ -551,6 +526,108 @@ class GPUEngine:
         self._last_scale_factor = scale_factor
         return tex_final, metrics
 
+    @staticmethod
+    def _orient_source(img: np.ndarray, geo: Any) -> np.ndarray:
+        """Applies rot90 and flips as zero-copy views."""
+        if geo.rotation != 0:
+            img = np.rot90(img, k=geo.rotation)
+        if geo.flip_horizontal:
+            img = np.fliplr(img)
+        if geo.flip_vertical:
+            img = np.flipud(img)
+        return img
+
+    def _get_autocrop_roi(
+        self,
+        img: np.ndarray,
+        settings: WorkspaceConfig,
+        scale_factor: float,
+        rot_shape: Tuple[int, int],
+        source_hash: Optional[str],
+    ) -> Tuple[int, int, int, int]:
+        """
+        Detects film borders on a downscaled copy, memoized per source and orientation.
+        Offset and ratio are applied on top of the cached borders, so adjusting them skips detection.
+        """
+        h, w = img.shape[:2]
+        h_rot, w_rot = rot_shape
+        geo = settings.geometry
+        key = (
+            source_hash,
+            h,
+            w,
+            geo.rotation,
+            geo.flip_horizontal,
+            geo.flip_vertical,
+        )
+        if source_hash is not None and self._autocrop_cache is not None and self._autocrop_cache[0] == key:
+            borders, (rh, rw) = self._autocrop_cache[1]
+        else:
+            det_s = APP_CONFIG.preview_render_size / max(h, w)
+            tmp = img if det_s >= 1.0 else cv2.resize(img, (int(w * det_s), int(h * det_s)))
+            tmp = ensure_image(np.ascontiguousarray(self._orient_source(tmp, geo), dtype=np.float32))
+            borders = detect_film_borders(tmp)
+            rh, rw = tmp.shape[:2]
+            if source_hash is not None:
+                self._autocrop_cache = (key, (borders, (rh, rw)))
+
+        roi_tmp = finalize_autocrop_roi(
+            borders,
+            rh,
+            rw,
+            offset_px=geo.autocrop_offset,
+            scale_factor=scale_factor,
+            target_ratio_str=geo.autocrop_ratio,
+        )
+        sy, sx = h_rot / rh, w_rot / rw
+        return (
+            int(roi_tmp[0] * sy),
+            int(roi_tmp[1] * sy),
+            int(roi_tmp[2] * sx),
+            int(roi_tmp[3] * sx),
+        )
+
+    def _get_log_bounds(
+        self,
+        img: np.ndarray,
+        settings: WorkspaceConfig,
+        roi: Optional[Tuple[int, int, int, int]],
+        source_hash: Optional[str],
+    ) -> LogNegativeBounds:
+        """
+        Analyzes normalization bounds on the oriented source, memoized per source, geometry and ROI.
+        """
+        geo, proc = settings.geometry, settings.process
+        key = (
+            source_hash,
+            img.shape[:2],
+            geo.rotation,
+            geo.fine_rotation,
+            geo.flip_horizontal,
+            geo.flip_vertical,
+            roi,
+            proc.analysis_buffer,
+            proc.process_mode,
+            proc.e6_normalize,
+        )
+        if source_hash is not None and self._bounds_cache is not None and self._bounds_cache[0] == key:
+            return self._bounds_cache[1]
+
+        analysis_source = self._orient_source(img, geo)
+        if geo.fine_rotation != 0.0:
+            analysis_source = apply_fine_rotation(analysis_source, geo.fine_rotation)
+
+        bounds = analyze_log_exposure_bounds(
+            analysis_source,
+            roi,
+            proc.analysis_buffer,
+            process_mode=proc.process_mode,
+            e6_normalize=proc.e6_normalize,
+        )
+        if source_hash is not None:
+            self._bounds_cache = (key, bounds)
+        return bounds
+
     def _upload_unified_uniforms(
         self,
         settings: WorkspaceConfig,
@@ -725,22 +802,22 @@ class GPUEngine:
         scale_factor: float,
     ) -> None:
         """Uploads manual retouch spots to GPU storage buffer."""
-        spot_data = bytearray()
-        for x, y, size in conf.manual_dust_spots[:512]:
-            mx, my = map_coords_to_geometry(
-                x,
-                y,
-                orig_shape,
-                geom.rotation,
-                geom.fine_rotation,
-                geom.flip_horizontal,
-                geom.flip_vertical,
-            )
-            # Correctly scale radius using scale_factor
-            scaled_radius = (size * scale_factor) / max(orig_shape)
-            spot_data += struct.pack("ffff", mx, my, scaled_radius, 0.0)
-        if spot_data:
-            self._buffers["retouch_s"].upload(np.frombuffer(spot_data, dtype=np.uint8))
+        spots = conf.manual_dust_spots[:512]
+        if not spots:
+            return
+        spots_arr = np.asarray(spots, dtype=np.float64).reshape(-1, 3)
+        spot_data = np.zeros((len(spots_arr), 4), dtype=np.float32)
+        spot_data[:, :2] = map_points_to_geometry(
+            spots_arr[:, :2],
+            orig_shape,
+            geom.rotation,
+            geom.fine_rotation,
+            geom.flip_horizontal,
+            geom.flip_vertical,
+        )
+        # Correctly scale radius using scale_factor
+        spot_data[:, 2] = (spots_arr[:, 2] * scale_factor) / max(orig_shape)
+        self._buffers["retouch_s"].upload(spot_data)
 
     def _calculate_layout_dims(
         self, settings: WorkspaceConfig, cw: int, ch: int, size_ref: Optional[float]
@@ -773,11 +850,7 @@ class GPUEngine:
         else:
             if use_orig:
                 content_w, content_h = cw, ch
-                try:
-                    w_r, h_r = map(float, settings.export.paper_aspect_ratio.split(":"))
-                    paper_ratio = w_r / h_r
-                except Exception:
-                    paper_ratio = cw / ch
+                paper_ratio = ASPECT_RATIO_VALUES.get(settings.export.paper_aspect_ratio, cw / ch)
 
                 min_paper_w = content_w + 2 * border_px
                 min_paper_h = content_h + 2 * border_px
@@ -852,7 +925,7 @@ class GPUEngine:
         if pipeline is None:
             raise RuntimeError(f"Pipeline not initialized: {pipeline_name}")
 
-        wg_x, wg_y = (16, 16) if pipeline_name in ["autocrop", "metrics", "clahe_hist"] else (8, 8)
+        wg_x, wg_y = (16, 16) if pipeline_name in WIDE_WORKGROUP_PIPELINES else (8, 8)
         entries = []
         for idx, res in bindings:
             if res is None:
@@ -893,7 +966,7 @@ class GPUEngine:
         pass_enc = encoder.begin_compute_pass()
         pass_enc.set_pipeline(pipeline)
         pass_enc.set_bind_group(0, bind_group)
-        if pipeline_name in ["clahe_hist", "clahe_cdf"]:
+        if pipeline_name in TILE_GRID_PIPELINES:
             pass_enc.dispatch_workgroups(8, 8)
         else:
             pass_enc.dispatch_workgroups((w + wg_x - 1) // wg_x, (h + wg_y - 1) // wg_y)
@@ -915,13 +988,7 @@ class GPUEngine:
         """Processes ultra-high resolution images using memory-efficient tiling."""
         h, w = img.shape[:2]
 
-        img_rot = img
-        if settings.geometry.rotation != 0:
-            img_rot = np.rot90(img_rot, k=settings.geometry.rotation)
-        if settings.geometry.flip_horizontal:
-            img_rot = np.fliplr(img_rot)
-        if settings.geometry.flip_vertical:
-            img_rot = np.flipud(img_rot)
+        img_rot = self._orient_source(img, settings.geometry)
         if settings.geometry.fine_rotation != 0.0:
             img_rot = apply_fine_rotation(img_rot, settings.geometry.fine_rotation)
 
@@ -1011,6 +1078,10 @@ class GPUEngine:
         for tex in self._tex_cache.values():
             tex.destroy()
         self._tex_cache.clear()
+        self._current_source_hash = None
+        self._last_settings = None
+        self._autocrop_cache = None
+        self._bounds_cache = None
         gc.collect()
         logger.info("GPUEngine: VRAM resources released")
 
@@ -1020,6 +1091,7 @@ class GPUEngine:
         for buf in self._buffers.values():
             buf.destroy()
         self._buffers.clear()
+        self._uniform_bindings.clear()
         self._pipelines.clear()
         self._sampler = None
         logger.info("GPUEngine: Engine decommissioned")
@@ -1,6 +1,5 @@
 import os
 import io
-import tifffile
 import numpy as np
 from PIL import Image, ImageCms
 from typing import Tuple, Optional, Any, Dict
@@ -28,6 +27,7 @@ from negpy.infrastructure.loaders.factory import loader_factory
 from negpy.infrastructure.loaders.helpers import get_best_demosaic_algorithm
 from negpy.services.export.print import PrintService
 from negpy.infrastructure.display.color_spaces import ColorSpaceRegistry
+from negpy.infrastructure.display.color_mgmt import ColorService
 
 logger = get_logger(__name__)
 
@@ -87,6 +87,7 @@ class ImageProcessor:
                     settings,
                     scale_factor=scale_factor,
                     render_size_ref=render_size_ref,
+                    source_hash=source_hash,
                     readback_metrics=readback_metrics,
                 )
                 context.metrics.update(gpu_metrics)
@@ -187,7 +188,7 @@ class ImageProcessor:
                         export_settings.icc_profile_path,
                         export_settings.icc_invert,
                     )
-                    img_out = np.array(pil_img)
+                    img_out = np.asarray(pil_img)
                 else:
                     img_out = img_int
                     icc_bytes = self._get_target_icc_bytes(
@@ -196,6 +197,8 @@ class ImageProcessor:
                         export_settings.icc_invert,
                     )
 
+                import tifffile
+
                 output_buf = io.BytesIO()
                 tifffile.imwrite(
                     output_buf,
@@ -246,19 +249,20 @@ class ImageProcessor:
         color_space: str,
         icc_path: Optional[str],
         inverse: bool = False,
+        embed_icc: bool = True,
     ) -> Tuple[Image.Image, Optional[bytes]]:
-        """Applies ICC profile transformations."""
+        """Applies ICC profile transformations. Profile bytes for embedding are only read when embed_icc is set."""
         path_src = ColorSpaceRegistry.get_icc_path(color_space)
-        profile_working = ImageCms.getOpenProfile(path_src) if path_src and os.path.exists(path_src) else ImageCms.createProfile("sRGB")
+        profile_working = ColorService.load_profile(path_src) if path_src and os.path.exists(path_src) else ImageCms.createProfile("sRGB")
 
         try:
             profile_selected = None
             if icc_path and os.path.exists(icc_path):
-                profile_selected = ImageCms.getOpenProfile(icc_path)
+                profile_selected = ColorService.load_profile(icc_path)
             else:
                 path_dst = ColorSpaceRegistry.get_icc_path(color_space)
                 if path_dst and os.path.exists(path_dst):
-                    profile_selected = ImageCms.getOpenProfile(path_dst)
+                    profile_selected = ColorService.load_profile(path_dst)
 
             if profile_selected:
                 p_src, p_dst = (profile_selected, profile_working) if inverse else (profile_working, profile_selected)
@@ -275,9 +279,9 @@ class ImageProcessor:
                 )
                 if result_pil:
                     pil_img = result_pil
-                icc_bytes = self._get_target_icc_bytes(color_space, icc_path) if not inverse else None
+                icc_bytes = self._get_target_icc_bytes(color_space, icc_path) if embed_icc and not inverse else None
             else:
-                icc_bytes = self._get_target_icc_bytes(color_space, None)
+                icc_bytes = self._get_target_icc_bytes(color_space, None) if embed_icc else None
             return pil_img, icc_bytes
         except Exception as e:
             logger.error(f"CMS transformation failed: {e}")
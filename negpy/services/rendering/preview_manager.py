@@ -49,8 +49,7 @@ class PreviewManager:
             )
             rgb = ensure_rgb(rgb)
 
-            full_linear = uint16_to_float32(np.ascontiguousarray(rgb))
-            h_orig, w_orig = full_linear.shape[:2]
+            h_orig, w_orig = rgb.shape[:2]
 
             max_res = APP_CONFIG.preview_render_size
             if max(h_orig, w_orig) > max_res:
@@ -58,14 +57,13 @@ class PreviewManager:
                 target_w = int(w_orig * scale)
                 target_h = int(h_orig * scale)
 
-                preview_raw = ensure_image(
-                    cv2.resize(
-                        full_linear,
-                        (target_w, target_h),
-                        interpolation=cv2.INTER_AREA,
-                    )
+                # Downsample while still uint16, then convert only the preview-sized buffer.
+                rgb = cv2.resize(
+                    rgb,
+                    (target_w, target_h),
+                    interpolation=cv2.INTER_AREA,
                 )
-            else:
-                preview_raw = full_linear.copy()
+
+            preview_raw = uint16_to_float32(np.ascontiguousarray(rgb))
 
             return ensure_image(preview_raw), (h_orig, w_orig), metadata
@@ -9,7 +9,7 @@ class CoordinateMapping:
     """
 
     @staticmethod
-    def create_uv_grid(
+    def create_uv_transform(
         rh_orig: int,
         rw_orig: int,
         rotation: int,
@@ -20,38 +20,52 @@ class CoordinateMapping:
         autocrop_params: Optional[dict] = None,
     ) -> np.ndarray:
         """
-        Generates UV map for geometric state.
+        Composes the inverse geometry (crop -> fine rotation -> flips -> rot90) into a single
+        3x3 matrix mapping viewport (0-1) back to raw (0-1).
         """
-        u_raw, v_raw = np.meshgrid(np.linspace(0, 1, rw_orig), np.linspace(0, 1, rh_orig))
-        uv_grid = np.stack([u_raw, v_raw], axis=-1).astype(np.float32)
+        k = (-rotation) % 4
+        if k == 0 and fine_rot == 0.0 and not flip_h and not flip_v and not (autocrop and autocrop_params):
+            return np.eye(3)
 
-        if rotation != 0:
-            uv_grid = np.rot90(uv_grid, k=-rotation).astype(np.float32)
+        h, w = rh_orig, rw_orig
+        if k % 2 == 1:
+            h, w = w, h
+
+        # Each step maps output pixel coords to input pixel coords of the preceding stage.
+        steps = []
+        if k == 1:
+            steps.append(np.array([[0.0, -1.0, rw_orig - 1.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]))
+        elif k == 2:
+            steps.append(np.array([[-1.0, 0.0, rw_orig - 1.0], [0.0, -1.0, rh_orig - 1.0], [0.0, 0.0, 1.0]]))
+        elif k == 3:
+            steps.append(np.array([[0.0, 1.0, 0.0], [-1.0, 0.0, rh_orig - 1.0], [0.0, 0.0, 1.0]]))
 
         if flip_h:
-            uv_grid = np.fliplr(uv_grid).astype(np.float32)
+            steps.append(np.array([[-1.0, 0.0, w - 1.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]))
 
         if flip_v:
-            uv_grid = np.flipud(uv_grid).astype(np.float32)
+            steps.append(np.array([[1.0, 0.0, 0.0], [0.0, -1.0, h - 1.0], [0.0, 0.0, 1.0]]))
 
         if fine_rot != 0.0:
-            h_r, w_r = uv_grid.shape[:2]
-            m_mat = cv2.getRotationMatrix2D((w_r / 2.0, h_r / 2.0), fine_rot, 1.0)
-            uv_grid = cv2.warpAffine(uv_grid, m_mat, (w_r, h_r), flags=cv2.INTER_LINEAR).astype(np.float32)
+            m_mat = cv2.getRotationMatrix2D((w / 2.0, h / 2.0), fine_rot, 1.0)
+            steps.append(np.vstack([cv2.invertAffineTransform(m_mat), [0.0, 0.0, 1.0]]))
 
         if autocrop and autocrop_params:
             y1, y2, x1, x2 = autocrop_params["roi"]
-            uv_grid = uv_grid[y1:y2, x1:x2].astype(np.float32)
+            steps.append(np.array([[1.0, 0.0, float(x1)], [0.0, 1.0, float(y1)], [0.0, 0.0, 1.0]]))
+            h, w = y2 - y1, x2 - x1
+
+        transform = np.diag([1.0 / max(rw_orig - 1, 1), 1.0 / max(rh_orig - 1, 1), 1.0])
+        for step in steps:
+            transform = transform @ step
 
-        return uv_grid
+        res: np.ndarray = transform @ np.diag([max(w - 1, 1), max(h - 1, 1), 1.0])
+        return res
 
     @staticmethod
-    def map_click_to_raw(nx: float, ny: float, uv_grid: np.ndarray) -> Tuple[float, float]:
+    def map_click_to_raw(nx: float, ny: float, uv_transform: np.ndarray) -> Tuple[float, float]:
         """
         Viewport (0-1) -> Raw (0-1).
         """
-        h_uv, w_uv = uv_grid.shape[:2]
-        px = int(np.clip(nx * (w_uv - 1), 0, w_uv - 1))
-        py = int(np.clip(ny * (h_uv - 1), 0, h_uv - 1))
-        raw_uv = uv_grid[py, px]
-        return float(raw_uv[0]), float(raw_uv[1])
+        u, v, _ = uv_transform @ np.array([nx, ny, 1.0])
+        return min(max(float(u), 0.0), 1.0), min(max(float(v), 0.0), 1.0)
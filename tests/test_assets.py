@@ -1,4 +1,5 @@
 import unittest
+import io
 import os
 from negpy.infrastructure.storage.local_asset_store import LocalAssetStore
 from negpy.kernel.system.config import APP_CONFIG
@@ -15,6 +16,19 @@ class TestAssetStore(unittest.TestCase):
         self.assertTrue(os.path.exists(s_dir))
         self.assertIn(s_id, s_dir)
 
+    def test_register_upload_copies_stream(self):
+        upload = io.BytesIO(os.urandom(3 * 1024 * 1024 + 17))
+        upload.name = "roll.dng"
+        upload.read(10)
+
+        file_path, f_hash = self.store.register_asset(upload, "test_upload")
+        try:
+            with open(file_path, "rb") as f:
+                self.assertEqual(f.read(), upload.getvalue())
+            self.assertFalse(f_hash.startswith("err_"))
+        finally:
+            self.store.clear_session_assets("test_upload")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,8 @@ from dataclasses import replace
 from negpy.domain.models import WorkspaceConfig
 from negpy.features.exposure.processor import NormalizationProcessor, PhotometricProcessor
 from negpy.domain.interfaces import PipelineContext
+from unittest.mock import MagicMock
+from negpy.desktop.workers.render import NormalizationWorker, NormalizationTask
 
 
 class TestBatchNormalization(unittest.TestCase):
@@ -55,6 +57,22 @@ class TestBatchNormalization(unittest.TestCase):
 
         np.testing.assert_array_almost_equal(res_batch, res_manual)
 
+    def test_normalization_worker_reuses_bounds_per_file(self):
+        """
+        Verify that re-analyzing a roll only loads frames it has not analyzed yet.
+        """
+        preview_service = MagicMock()
+        preview_service.load_linear_preview.return_value = (np.full((20, 20, 3), 0.5, dtype=np.float32), None, None)
+        repo = MagicMock()
+        repo.load_file_settings.return_value = None
+        worker = NormalizationWorker(preview_service, repo)
+
+        files = [{"name": "a", "path": "a", "hash": "ha"}, {"name": "b", "path": "b", "hash": "hb"}]
+        worker.process(NormalizationTask(files=files[:1], workspace_color_space="sRGB"))
+        worker.process(NormalizationTask(files=files, workspace_color_space="sRGB"))
+
+        self.assertEqual(preview_service.load_linear_preview.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from negpy.services.view.coordinate_mapping import CoordinateMapping
+
+
+def test_identity_transform() -> None:
+    t = CoordinateMapping.create_uv_transform(100, 200, rotation=0, fine_rot=0.0)
+    assert CoordinateMapping.map_click_to_raw(0.25, 0.75, t) == pytest.approx((0.25, 0.75))
+
+
+def test_rotation_matches_rot90() -> None:
+    h, w = 4, 6
+    grid = np.stack(np.meshgrid(np.linspace(0, 1, w), np.linspace(0, 1, h)), axis=-1)
+    for rotation in range(4):
+        rotated = np.rot90(grid, k=-rotation)
+        t = CoordinateMapping.create_uv_transform(h, w, rotation=rotation, fine_rot=0.0, flip_h=True)
+        rotated = np.fliplr(rotated)
+        rh, rw = rotated.shape[:2]
+        for py, px in [(0, 0), (rh - 1, 0), (1, rw - 2)]:
+            u, v = CoordinateMapping.map_click_to_raw(px / (rw - 1), py / (rh - 1), t)
+            assert (u, v) == pytest.approx(tuple(rotated[py, px]))
+
+
+def test_crop_offsets_click() -> None:
+    t = CoordinateMapping.create_uv_transform(
+        101,
+        201,
+        rotation=0,
+        fine_rot=0.0,
+        autocrop=True,
+        autocrop_params={"roi": (10, 61, 20, 121)},
+    )
+    assert CoordinateMapping.map_click_to_raw(0.0, 0.0, t) == pytest.approx((0.1, 0.1))
+    assert CoordinateMapping.map_click_to_raw(1.0, 1.0, t) == pytest.approx((0.6, 0.6))
+
+
+def test_fine_rotation_keeps_center() -> None:
+    t = CoordinateMapping.create_uv_transform(101, 101, rotation=1, fine_rot=7.5)
+    assert CoordinateMapping.map_click_to_raw(0.5, 0.5, t) == pytest.approx((0.5, 0.5), abs=0.01)
@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from negpy.desktop.controller import AppController
+from negpy.desktop.session import DesktopSessionManager
+from negpy.infrastructure.storage.repository import StorageRepository
+
+
+class TestRenderCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        repo = StorageRepository(os.path.join(self.tmp_dir, "edits.db"), os.path.join(self.tmp_dir, "settings.db"))
+        repo.initialize()
+        self.controller = AppController(DesktopSessionManager(repo))
+        self.controller.render_requested.disconnect(self.controller.render_worker.process)
+        self.tasks = []
+        self.controller.render_requested.connect(self.tasks.append)
+        self.controller.state.preview_raw = np.zeros((8, 8, 3), dtype=np.float32)
+
+    def tearDown(self):
+        self.controller.cleanup()
+
+    def test_coalesced_requests_keep_metrics_readback(self):
+        self.controller.request_render()
+        self.controller.request_render(readback_metrics=False)
+        self.controller._flush_render_request()
+
+        self.assertEqual(len(self.tasks), 1)
+        self.assertTrue(self.tasks[0].readback_metrics)
+
+    def test_readback_flag_resets_after_flush(self):
+        self.controller.request_render()
+        self.controller._flush_render_request()
+        self.controller._on_render_finished(None, {})
+        self.controller.request_render(readback_metrics=False)
+        self.controller._flush_render_request()
+
+        self.assertEqual([t.readback_metrics for t in self.tasks], [True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
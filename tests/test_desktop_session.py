@@ -27,6 +27,114 @@ class TestDesktopSessionSync(unittest.TestCase):
         self.assertEqual(self.session.state.selected_file_idx, 1)
         self.assertEqual(self.session.state.selected_indices, [1])
 
+    def test_remove_current_file_emits_once(self):
+        self.session.select_file(0)
+        emitted = []
+        self.session.state_changed.connect(lambda: emitted.append(True))
+
+        self.session.remove_current_file()
+
+        self.assertEqual(len(emitted), 1)
+        self.assertEqual([f["name"] for f in self.session.state.uploaded_files], ["file2.dng"])
+        self.assertEqual(self.session.state.current_file_hash, "hash2")
+
+    def test_add_files_skips_known_and_repeated_hashes(self):
+        self.session.add_files(
+            [],
+            validated_info=[
+                {"name": "copy.dng", "path": "path3", "hash": "hash1"},
+                {"name": "file3.dng", "path": "path3", "hash": "hash3"},
+                {"name": "file3b.dng", "path": "path4", "hash": "hash3"},
+            ],
+        )
+        self.assertEqual([f["hash"] for f in self.session.state.uploaded_files], ["hash1", "hash2", "hash3"])
+
+    def test_refresh_thumbnails_updates_only_changed_rows(self):
+        layouts, changed = [], []
+        model = self.session.asset_model
+        model.layoutChanged.connect(lambda: layouts.append(True))
+        model.dataChanged.connect(lambda top, bottom, roles: changed.append((top.row(), bottom.row())))
+
+        model.refresh_thumbnails(["file2.dng"])
+        model.refresh_thumbnails(["missing.dng"])
+
+        self.assertEqual(changed, [(1, 1)])
+        self.assertEqual(layouts, [])
+
+    def test_update_config_skips_signal_for_unchanged_config(self):
+        emitted = []
+        self.session.state_changed.connect(lambda: emitted.append(True))
+        config = self.session.state.config
+
+        self.session.update_config(replace(config))
+        self.assertEqual(emitted, [])
+
+        self.session.update_config(replace(config, exposure=replace(config.exposure, density=config.exposure.density + 0.1)))
+        self.assertEqual(len(emitted), 1)
+
+    def test_refresh_thumbnails_sees_rows_added_later(self):
+        changed = []
+        model = self.session.asset_model
+        model.dataChanged.connect(lambda top, bottom, roles: changed.append((top.row(), bottom.row())))
+
+        model.refresh_thumbnails(["file1.dng"])
+        self.session.add_files([], validated_info=[{"name": "file3.dng", "path": "path3", "hash": "hash3"}])
+        model.refresh_thumbnails(["file3.dng"])
+
+        self.assertEqual(changed, [(0, 0), (2, 2)])
+
+    def test_persist_writes_only_changed_sticky_settings(self):
+        config = WorkspaceConfig()
+        self.session.update_config(config, persist=True, render=False)
+        self.session.flush_pending_settings()
+        self.session.update_config(config, persist=True, render=False)
+        self.session.flush_pending_settings()
+        self.assertEqual(self.mock_repo.save_global_settings.call_count, 1)
+
+        edited = replace(config, exposure=replace(config.exposure, density=1.25))
+        self.session.update_config(edited, persist=True, render=False)
+        self.session.flush_pending_settings()
+        self.mock_repo.save_global_settings.assert_called_with({"last_density": 1.25})
+
+    def test_persisted_edits_are_coalesced_until_flush(self):
+        self.session.state.current_file_hash = "hash1"
+        config = WorkspaceConfig()
+        for density in (0.2, 0.4, 0.6):
+            self.session.update_config(replace(config, exposure=replace(config.exposure, density=density)), persist=True, render=False)
+
+        self.mock_repo.save_file_settings.assert_not_called()
+        self.session.flush_pending_settings()
+        self.session.flush_pending_settings()
+
+        self.mock_repo.save_file_settings.assert_called_once()
+        file_hash, saved = self.mock_repo.save_file_settings.call_args[0]
+        self.assertEqual(file_hash, "hash1")
+        self.assertEqual(saved.exposure.density, 0.6)
+
+    def test_select_file_writes_current_settings_only_when_unsaved(self):
+        self.mock_repo.get_global_settings.return_value = {}
+        self.mock_repo.load_file_settings.return_value = WorkspaceConfig()
+
+        self.session.select_file(0)
+        self.session.select_file(1)
+        self.mock_repo.save_file_settings.assert_not_called()
+
+        config = self.session.state.config
+        self.session.update_config(replace(config, exposure=replace(config.exposure, density=0.9)), persist=True, render=False)
+        self.session.select_file(0)
+        self.mock_repo.save_file_settings.assert_called_once()
+
+    def test_select_file_reads_sticky_settings_once(self):
+        self.mock_repo.get_global_settings.return_value = {"last_density": 0.7, "last_autocrop_offset": 3}
+        self.mock_repo.get_global_setting.reset_mock()
+
+        self.session.select_file(0)
+
+        self.mock_repo.get_global_settings.assert_called_once()
+        self.mock_repo.get_global_setting.assert_not_called()
+        self.assertEqual(self.session.state.config.exposure.density, 0.7)
+        self.assertEqual(self.session.state.config.geometry.autocrop_offset, 3)
+
     def test_sync_selected_settings_exclusions(self):
         source_config = WorkspaceConfig(
             exposure=replace(WorkspaceConfig().exposure, density=1.5),
@@ -44,14 +152,16 @@ class TestDesktopSessionSync(unittest.TestCase):
             retouch=RetouchConfig(dust_remove=False, manual_dust_spots=[]),
             process=ProcessConfig(process_mode="C41", e6_normalize=False),
         )
-        self.mock_repo.load_file_settings.return_value = target_config
+        self.mock_repo.load_file_settings_batch.return_value = {"hash2": target_config}
 
         self.session.update_selection([0, 1])
         self.session.sync_selected_settings()
 
-        args, _ = self.mock_repo.save_file_settings.call_args
-        self.assertEqual(args[0], "hash2")
-        saved_config = args[1]
+        self.mock_repo.load_file_settings_batch.assert_called_once_with(["hash2"])
+        (items,), _ = self.mock_repo.save_file_settings_batch.call_args
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0][0], "hash2")
+        saved_config = items[0][1]
 
         self.assertEqual(saved_config.exposure.density, 1.5)
         self.assertEqual(saved_config.geometry.rotation, 1)
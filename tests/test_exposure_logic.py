@@ -5,6 +5,7 @@ from negpy.features.exposure.logic import (
     cmy_to_density,
     density_to_cmy,
 )
+from negpy.kernel.image.logic import get_luminance
 
 
 class TestExposureLogic(unittest.TestCase):
@@ -31,6 +32,18 @@ class TestExposureLogic(unittest.TestCase):
         # Higher pivot -> lower diff -> lower density -> higher transmittance
         self.assertGreater(np.mean(res2), np.mean(res1))
 
+    def test_bw_mode_returns_replicated_luminance(self):
+        """B&W mode should equal the luminance of the color curve output on every channel."""
+        img = np.random.default_rng(0).random((16, 16, 3), dtype=np.float32)
+        offsets = (0.0, 0.05, -0.03)
+
+        color = apply_characteristic_curve(img, (0.5, 2.0), (0.5, 2.0), (0.5, 2.0), cmy_offsets=offsets)
+        bw = apply_characteristic_curve(img, (0.5, 2.0), (0.5, 2.0), (0.5, 2.0), cmy_offsets=offsets, mode=1)
+
+        lum = get_luminance(color)
+        for ch in range(3):
+            np.testing.assert_allclose(bw[..., ch], lum, atol=1e-6)
+
     def test_cmy_conversions(self):
         """Verify unit conversion roundtrip."""
         val = 0.5
@@ -55,6 +68,20 @@ class TestExposureLogic(unittest.TestCase):
         self.assertGreater(dm, 0)
         self.assertLess(dy, 0)
 
+    def test_log_density_bounds_match_linear_analysis(self):
+        """Analysis on a precomputed log image matches the linear-input path."""
+        from negpy.features.exposure.normalization import analyze_log_density_bounds, analyze_log_exposure_bounds
+
+        img = np.random.default_rng(0).random((64, 96, 3), dtype=np.float32)
+        img_log = np.log10(np.clip(img, 1e-6, 1.0))
+        roi = (4, 60, 8, 90)
+
+        expected = analyze_log_exposure_bounds(img, roi, 0.1)
+        actual = analyze_log_density_bounds(img_log, roi, 0.1)
+
+        np.testing.assert_allclose(actual.floors, expected.floors, atol=1e-5)
+        np.testing.assert_allclose(actual.ceils, expected.ceils, atol=1e-5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -150,3 +150,35 @@ def test_get_manual_rect_coords_flips():
     roi = get_manual_rect_coords(img, manual_rect, orig_shape=(100, 100), flip_vertical=True)
     # Should become bottom-left quadrant: y=50..100
     assert roi == (50, 100, 0, 50)
+
+
+def test_map_points_to_geometry_matches_single_point():
+    from negpy.features.geometry.logic import map_coords_to_geometry, map_points_to_geometry
+
+    points = np.array([[0.1, 0.2], [0.5, 0.5], [0.9, 0.3]])
+    mapped = map_points_to_geometry(points, (100, 200), rotation_k=1, fine_rotation=2.5, flip_horizontal=True)
+
+    for (nx, ny), (mx, my) in zip(points, mapped):
+        expected = map_coords_to_geometry(nx, ny, (100, 200), rotation_k=1, fine_rotation=2.5, flip_horizontal=True)
+        assert np.allclose((mx, my), expected)
+
+
+def test_geometry_processor_reuses_borders_on_offset_change():
+    from dataclasses import replace
+    from unittest.mock import patch
+    from negpy.kernel.caching.manager import PipelineCache
+
+    img = np.zeros((100, 150, 3), dtype=np.float32)
+    cache = PipelineCache()
+    config = GeometryConfig(autocrop_offset=0)
+
+    with patch("negpy.features.geometry.processor.detect_film_borders", return_value=(10.0, 90.0, 10.0, 140.0)) as detect:
+        ctx_a = PipelineContext(scale_factor=1.0, original_size=(100, 150))
+        GeometryProcessor(config, cache).process(img, ctx_a)
+        ctx_b = PipelineContext(scale_factor=1.0, original_size=(100, 150))
+        GeometryProcessor(replace(config, autocrop_offset=5), cache).process(img, ctx_b)
+        assert detect.call_count == 1
+        assert ctx_a.active_roi != ctx_b.active_roi
+
+        GeometryProcessor(replace(config, rotation=1), cache).process(img, PipelineContext(scale_factor=1.0, original_size=(100, 150)))
+        assert detect.call_count == 2
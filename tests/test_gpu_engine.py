@@ -1,7 +1,10 @@
 import unittest
 import numpy as np
+from dataclasses import replace
+from unittest.mock import patch
 from negpy.services.rendering.gpu_engine import GPUEngine
 from negpy.domain.models import WorkspaceConfig
+from negpy.features.exposure.normalization import LogNegativeBounds
 from negpy.infrastructure.gpu.device import GPUDevice
 
 
@@ -82,9 +85,61 @@ class TestGPUEngine(unittest.TestCase):
         self.assertEqual(len(self._engine_buffers_count()), 0)
         self.assertEqual(len(self.engine._pipelines), 0)
 
+    def test_cleanup_resets_source_tracking(self):
+        """Destroyed textures must force a fresh upload of the same source."""
+        img = np.random.rand(64, 64, 3).astype(np.float32)
+        self.engine.process_to_texture(img, WorkspaceConfig(), source_hash="abc")
+        self.assertEqual(self.engine._current_source_hash, "abc")
+
+        self.engine.cleanup()
+        self.assertIsNone(self.engine._current_source_hash)
+        self.assertIsNone(self.engine._last_settings)
+
     def _engine_buffers_count(self):
         return self.engine._buffers
 
 
+class TestGPUEngineAutocropCache(unittest.TestCase):
+    def test_autocrop_roi_reused_for_same_source(self):
+        """Border detection only re-runs when source or orientation changes."""
+        engine = GPUEngine()
+        img = np.random.rand(64, 96, 3).astype(np.float32)
+        settings = WorkspaceConfig()
+
+        with patch("negpy.services.rendering.gpu_engine.detect_film_borders", return_value=(2.0, 60.0, 3.0, 90.0)) as detect:
+            roi = engine._get_autocrop_roi(img, settings, 1.0, (64, 96), "hash1")
+            self.assertEqual(engine._get_autocrop_roi(img, settings, 1.0, (64, 96), "hash1"), roi)
+            self.assertEqual(detect.call_count, 1)
+
+            offset = replace(settings, geometry=replace(settings.geometry, autocrop_offset=10))
+            self.assertNotEqual(engine._get_autocrop_roi(img, offset, 1.0, (64, 96), "hash1"), roi)
+            self.assertEqual(detect.call_count, 1)
+
+            engine._get_autocrop_roi(img, settings, 1.0, (64, 96), "hash2")
+            engine._get_autocrop_roi(img, settings, 1.0, (64, 96), None)
+            engine._get_autocrop_roi(img, settings, 1.0, (64, 96), None)
+            self.assertEqual(detect.call_count, 4)
+
+    def test_log_bounds_reused_for_same_source(self):
+        """Bounds analysis only re-runs when source, geometry or ROI changes."""
+        engine = GPUEngine()
+        img = np.random.rand(64, 96, 3).astype(np.float32)
+        settings = WorkspaceConfig()
+        bounds = LogNegativeBounds(floors=(0.1, 0.1, 0.1), ceils=(0.9, 0.9, 0.9))
+
+        with patch("negpy.services.rendering.gpu_engine.analyze_log_exposure_bounds", return_value=bounds) as analyze:
+            self.assertIs(engine._get_log_bounds(img, settings, (0, 64, 0, 96), "hash1"), bounds)
+            engine._get_log_bounds(img, settings, (0, 64, 0, 96), "hash1")
+            self.assertEqual(analyze.call_count, 1)
+
+            engine._get_log_bounds(img, settings, (2, 60, 3, 90), "hash1")
+            engine._get_log_bounds(img, settings, (2, 60, 3, 90), None)
+            self.assertEqual(analyze.call_count, 3)
+
+            engine.cleanup()
+            engine._get_log_bounds(img, settings, (2, 60, 3, 90), "hash1")
+            self.assertEqual(analyze.call_count, 4)
+
+
 if __name__ == "__main__":
     unittest.main()
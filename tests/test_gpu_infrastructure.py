@@ -57,6 +57,19 @@ class TestGPUInfrastructure(unittest.TestCase):
         self.assertIsNone(tex.texture)
         self.assertIsNone(tex.view)
 
+    def test_gpu_texture_readback_pixel(self):
+        """readback_pixel should match the same texel of a full readback."""
+        if not self.gpu.is_available:
+            self.skipTest("GPU not available")
+
+        tex = GPUTexture(37, 21)
+        data = np.random.default_rng(0).random((21, 37, 3)).astype(np.float32)
+        tex.upload(data)
+
+        np.testing.assert_allclose(tex.readback_pixel(30, 17)[:3], data[17, 30], atol=1e-5)
+        np.testing.assert_allclose(tex.readback_pixel(30, 17), tex.readback()[17, 30], atol=1e-6)
+        tex.destroy()
+
     def test_gpu_buffer(self):
         """GPUBuffer should initialize and upload data."""
         if not self.gpu.is_available:
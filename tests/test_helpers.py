@@ -9,6 +9,7 @@ from negpy.kernel.image.logic import (
     uint8_to_float32,
     uint16_to_float32,
     float_to_uint_luma,
+    get_channel_histograms,
 )
 from negpy.kernel.image.validation import ensure_image
 
@@ -113,3 +114,20 @@ def test_calculate_file_hash(tmp_path):
     h2 = calculate_file_hash(str(d))
     assert h1 == h2
     assert len(h1) == 64  # SHA-256 length
+
+
+def test_get_channel_histograms_matches_numpy() -> None:
+    img = np.random.default_rng(0).uniform(-0.1, 1.1, (40, 60, 3)).astype(np.float32)
+    img[0, 0] = 1.0
+    counts = get_channel_histograms(img)
+
+    assert counts.shape == (4, 256)
+    for ch in range(3):
+        expected, _ = np.histogram(img[..., ch], bins=256, range=(0, 1))
+        np.testing.assert_array_equal(counts[ch], expected)
+
+
+def test_get_channel_histograms_step_matches_subsampled() -> None:
+    img = np.random.default_rng(1).uniform(0.0, 1.0, (41, 63, 3)).astype(np.float32)
+    np.testing.assert_array_equal(get_channel_histograms(img, 4), get_channel_histograms(img[::4, ::4].copy()))
+    np.testing.assert_array_equal(get_channel_histograms(img.astype(np.float64), 4), get_channel_histograms(img, 4))
@@ -61,3 +61,29 @@ def test_apply_layout_with_border():
     assert np.all(result[:, 330:360, :] == 1.0)
     # Content should be intact
     assert np.all(result[30:230, 30:330, :] == 0.0)
+
+
+def test_apply_preview_layout_uint8():
+    img = np.zeros((200, 300, 3), dtype=np.uint8)
+
+    result, (x, y, w, h) = PrintService.apply_preview_layout(img, "1:1", 0.0, 2.54, "#ff8000", 300)
+
+    assert result.dtype == np.uint8
+    assert result.shape == (300, 300, 3)
+    assert (x, y, w, h) == (0, 50, 300, 200)
+    assert tuple(result[0, 0]) == (255, 128, 0)
+    assert np.all(result[50:250, :, :] == 0)
+
+
+def test_apply_layout_without_padding_returns_input():
+    img = np.zeros((200, 300, 3), dtype=np.float32)
+    config = ExportConfig(
+        paper_aspect_ratio="Original",
+        export_border_size=0.0,
+        use_original_res=True,
+    )
+
+    result, rect = PrintService.apply_layout(img, config)
+
+    assert result is img
+    assert rect == (0, 0, 300, 200)
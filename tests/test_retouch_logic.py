@@ -1,5 +1,6 @@
+import cv2
 import numpy as np
-from negpy.features.retouch.logic import apply_dust_removal
+from negpy.features.retouch.logic import apply_dust_removal, _rasterize_spots_jit
 
 
 def test_manual_dust_removal_effect():
@@ -93,3 +94,30 @@ def test_auto_dust_removal_cloud_protection():
 
     # Soft gradients should remain identical or very close
     np.testing.assert_allclose(img, res, atol=0.01)
+
+
+def test_rasterize_spots_matches_filled_circles():
+    cx = np.array([10, 50, 95, -3], dtype=np.int32)
+    cy = np.array([10, 40, 70, 5], dtype=np.int32)
+    radii = np.array([4, 12, 9, 6], dtype=np.int32)
+
+    mask = _rasterize_spots_jit(80, 100, cx, cy, radii)
+
+    expected = np.zeros((80, 100), dtype=np.uint8)
+    for x, y, r in zip(cx, cy, radii):
+        cv2.circle(expected, (int(x), int(y)), int(r), 255, -1)
+    np.testing.assert_array_equal(mask, expected)
+
+
+def test_manual_spots_array_matches_list():
+    img = np.full((60, 80, 3), 0.4, dtype=np.float32)
+    img[28:33, 38:43] = 1.0
+    spots = [(0.5, 0.5, 4.0), (0.1, 0.2, 2.0)]
+
+    np.random.seed(0)
+    from_list = apply_dust_removal(img.copy(), False, 0.5, 2, spots, 1.0)
+    np.random.seed(0)
+    from_array = apply_dust_removal(img.copy(), False, 0.5, 2, np.asarray(spots), 1.0)
+
+    np.testing.assert_array_equal(from_list, from_array)
+    assert apply_dust_removal(img, False, 0.5, 2, np.empty((0, 3)), 1.0) is img
@@ -1,6 +1,7 @@
 import os
 from negpy.kernel.system.version import get_app_version
 from negpy.kernel.system.paths import get_resource_path
+from negpy.infrastructure.filesystem.watcher import FolderWatchService
 
 
 def test_get_app_version(tmp_path):
@@ -18,3 +19,18 @@ def test_get_resource_path():
     p = get_resource_path("negpy/kernel/system/paths.py")
     assert os.path.exists(p)
     assert os.path.isabs(p)
+
+
+def test_hot_folder_listing_feeds_new_file_scan(tmp_path):
+    (tmp_path / "frame1.dng").write_bytes(b"x")
+    (tmp_path / "frame2.dng").write_bytes(b"x")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    names = FolderWatchService.list_supported_files(str(tmp_path))
+    assert names == {"frame1.dng", "frame2.dng"}
+
+    existing = {os.path.abspath(str(tmp_path / "frame1.dng"))}
+    new_files = FolderWatchService.scan_for_new_files(str(tmp_path), existing, names)
+    assert new_files == [os.path.abspath(str(tmp_path / "frame2.dng"))]
+    assert FolderWatchService.scan_for_new_files(str(tmp_path), existing) == new_files
+    assert FolderWatchService.list_supported_files(str(tmp_path / "missing")) is None